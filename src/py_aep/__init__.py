@@ -108,6 +108,7 @@ from .models import (
     Application,
     AVItem,
     AVLayer,
+    BakedLayer,
     CameraLayer,
     CineonFormatOptions,
     CompItem,
@@ -126,6 +127,7 @@ from .models import (
     LightLayer,
     MarkerValue,
     MaskPropertyGroup,
+    NestedLayerSample,
     OpenExrFormatOptions,
     OutputModule,
     PlaceholderSource,
@@ -134,10 +136,12 @@ from .models import (
     Property,
     PropertyBase,
     PropertyGroup,
+    PropertyMatch,
     RenderQueue,
     RenderQueueItem,
     SettingsView,
     Shape,
+    ShapeArrays,
     ShapeLayer,
     SolidSource,
     TargaFormatOptions,
@@ -169,6 +173,7 @@ __all__ = [
     "AutoOrientType",
     "AVItem",
     "AVLayer",
+    "BakedLayer",
     "BaselineDirection",
     "BitsPerChannel",
     "BlendingMode",
@@ -241,6 +246,7 @@ __all__ = [
     "MaskMotionBlur",
     "MaskPropertyGroup",
     "MotionBlurSetting",
+    "NestedLayerSample",
     "OpenExrFormatOptions",
     "OutputAudio",
     "OutputChannels",
@@ -263,6 +269,7 @@ __all__ = [
     "PropertyBase",
     "PropertyControlType",
     "PropertyGroup",
+    "PropertyMatch",
     "PropertyType",
     "PropertyValueType",
     "ProxyUseSetting",
@@ -278,6 +285,7 @@ __all__ = [
     "ResolveType",
     "RQItemStatus",
     "Shape",
+    "ShapeArrays",
     "ShapeLayer",
     "SolidSource",
     "SoloSwitchesSetting",
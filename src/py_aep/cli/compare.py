@@ -9,6 +9,7 @@ at the byte level, including:
 
 Modes:
     Compare:  aep-compare file1.aep file2.aep
+    Align:    aep-compare file1.aep file2.aep --align
     Multi:    aep-compare ref.aep v1.aep v2.aep v3.aep
     List:     aep-compare file.aep --list
     Dump:     aep-compare file.aep --dump "LIST:Fold/ftts"
@@ -17,7 +18,10 @@ Modes:
 from __future__ import annotations
 
 import argparse
+import bisect
+import hashlib
 import json
+import os
 import sys
 import traceback
 from dataclasses import dataclass, field
@@ -62,19 +66,148 @@ class ByteDifference:
         )
 
 
+@dataclass
+class ByteRange:
+    """A run of consecutive differing bytes between two files."""
+
+    path: str
+    start: int
+    end: int
+    """Offset after the last differing byte."""
+    bytes1: bytes
+    """The bytes of the run in file 1. Shorter than the run, or empty,
+    where file 1 ends before it."""
+    bytes2: bytes
+    """The bytes of the run in file 2, likewise."""
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def byte_differences(self) -> Iterator[ByteDifference]:
+        """Yield a [ByteDifference][] for each byte of the run."""
+        for i in range(len(self)):
+            yield ByteDifference(
+                path=self.path,
+                offset=self.start + i,
+                byte1=self.bytes1[i] if i < len(self.bytes1) else MISSING_BYTE,
+                byte2=self.bytes2[i] if i < len(self.bytes2) else MISSING_BYTE,
+            )
+
+    def format_diff(self, max_bytes: int = 16) -> str:
+        """Format the run for display, showing up to *max_bytes* bytes.
+
+        A single byte present in both files is formatted like a
+        [ByteDifference][], with its bit position.
+        """
+        if len(self) == 1 and self.bytes1 and self.bytes2:
+            return next(self.byte_differences()).format_diff()
+        plural = "s" if len(self) != 1 else ""
+        return (
+            f"  Offset {self.start:4d}-{self.end - 1} "
+            f"(0x{self.start:04X}-0x{self.end - 1:04X}), {len(self)} byte{plural}: "
+            f"{_format_run(self.bytes1, max_bytes)} vs "
+            f"{_format_run(self.bytes2, max_bytes)}"
+        )
+
+
+def _format_run(data: bytes, max_bytes: int) -> str:
+    """Format the bytes of a [ByteRange][] as hex."""
+    if not data:
+        return "<missing>"
+    text = " ".join(f"{b:02X}" for b in data[:max_bytes])
+    if len(data) > max_bytes:
+        text += " ..."
+    return text
+
+
 @dataclass
 class ChunkDifference:
     """Represents all differences within a specific chunk/element."""
 
     path: str
     byte_diffs: list[ByteDifference]
+    """Per-byte differences. Only filled in when per-byte output is
+    needed (`--context` or `--json`)."""
     size1: int
     size2: int
+    ranges: list[ByteRange] = field(default_factory=list)
+    """The differing bytes, coalesced into runs."""
+    path2: str | None = None
+    """The path in file 2, when `--align` matched the chunk to one at
+    another position."""
 
     def has_size_difference(self) -> bool:
         """Check if the chunks have different sizes."""
         return self.size1 != self.size2
 
+    def num_byte_differences(self) -> int:
+        """Return the number of differing bytes."""
+        if self.ranges:
+            return sum(len(r) for r in self.ranges)
+        return len(self.byte_diffs)
+
+
+@dataclass
+class ChunkDigest:
+    """A chunk with a content hash of its whole subtree.
+
+    Built by [chunk_digest_tree][]. Equal digests mean equal chunk types
+    and data throughout the subtree, so comparisons can skip it.
+    """
+
+    path: str
+    """The chunk path, as used in comparison output."""
+    identifier: str
+    """The chunk type, with the list type for LIST chunks."""
+    digest: bytes
+    data: bytes | None = None
+    """The raw body of a leaf chunk. `None` for LIST chunks."""
+    children: list[ChunkDigest] = field(default_factory=list)
+
+    @property
+    def is_list(self) -> bool:
+        """Whether this is a LIST chunk."""
+        return self.data is None
+
+    def iter_leaves(self) -> Iterator[ChunkDigest]:
+        """Yield the leaf chunks with data below this chunk, in order."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.data:
+                yield node
+            stack.extend(reversed(node.children))
+
+    def data_size(self) -> int:
+        """Return the total size of the leaf data below this chunk."""
+        return sum(len(leaf.data or b"") for leaf in self.iter_leaves())
+
+
+@dataclass
+class ChunkEdit:
+    """A chunk inserted, deleted or moved between two files.
+
+    Found by [align_digest_trees][]. A LIST chunk inserted or deleted as a
+    whole is reported once, not once per leaf.
+    """
+
+    kind: str
+    """`"inserted"`, `"deleted"` or `"moved"`."""
+    path1: str | None
+    """The path in file 1. `None` for insertions."""
+    path2: str | None
+    """The path in file 2. `None` for deletions."""
+    size: int
+    """The size of the leaf data of the chunk."""
+
+    def format_edit(self) -> str:
+        """Return a human-readable representation of the edit."""
+        if self.kind == "inserted":
+            return f"  + {self.path2} ({self.size} bytes)"
+        if self.kind == "deleted":
+            return f"  - {self.path1} ({self.size} bytes)"
+        return f"  ~ {self.path1} -> {self.path2} ({self.size} bytes)"
+
 
 @dataclass
 class MultiFileDifference:
@@ -110,34 +243,110 @@ class MultiChunkDifference:
 # ── Binary comparison ───────────────────────────────────────────────────────
 
 
+#: Spans of at most this many bytes are scanned byte by byte; longer
+#: differing spans are bisected.
+_SCAN_BLOCK = 64
+
+
+def diff_ranges(data1: bytes, data2: bytes, path: str) -> list[ByteRange]:
+    """Compare two byte sequences and return the differing runs.
+
+    Identical data is settled with a single comparison. Otherwise the
+    common length is bisected, skipping halves that compare equal, and
+    only short spans are scanned byte by byte. Adjacent differing bytes
+    are coalesced into one [ByteRange][]. Bytes past the end of the
+    shorter sequence form a final range.
+    """
+    if data1 == data2:
+        return []
+    min_len = min(len(data1), len(data2))
+
+    runs: list[list[int]] = []
+    stack = [(0, min_len)]
+    while stack:
+        lo, hi = stack.pop()
+        if data1[lo:hi] == data2[lo:hi]:
+            continue
+        if hi - lo > _SCAN_BLOCK:
+            mid = (lo + hi) // 2
+            # Left half last, so spans are visited in order.
+            stack.append((mid, hi))
+            stack.append((lo, mid))
+            continue
+        for offset in range(lo, hi):
+            if data1[offset] != data2[offset]:
+                if runs and runs[-1][1] == offset:
+                    runs[-1][1] = offset + 1
+                else:
+                    runs.append([offset, offset + 1])
+
+    max_len = max(len(data1), len(data2))
+    if max_len > min_len:
+        if runs and runs[-1][1] == min_len:
+            runs[-1][1] = max_len
+        else:
+            runs.append([min_len, max_len])
+
+    return [
+        ByteRange(path, start, end, data1[start:end], data2[start:end])
+        for start, end in runs
+    ]
+
+
+def diff_columns(data_list: list[bytes], path: str) -> list[MultiFileDifference]:
+    """Compare byte sequences of several files offset by offset.
+
+    An offset differs when the files long enough to have it hold at least
+    two distinct values there. The offsets are split where a sequence
+    ends, and each part is compared across all files at once: parts
+    that are equal in every file are skipped with one slice comparison
+    per file, others are bisected like in [diff_ranges][] and only short
+    spans are scanned byte by byte.
+    """
+    first = data_list[0]
+    if all(data == first for data in data_list):
+        return []
+
+    diffs: list[MultiFileDifference] = []
+    bounds = sorted({0, *(len(data) for data in data_list)})
+    for seg_start, seg_end in zip(bounds, bounds[1:]):
+        present = [i for i, data in enumerate(data_list) if len(data) >= seg_end]
+        if len(present) < 2:
+            continue
+        buffers = [data_list[i] for i in present]
+        reference = buffers[0]
+        stack = [(seg_start, seg_end)]
+        while stack:
+            lo, hi = stack.pop()
+            part = reference[lo:hi]
+            if all(data[lo:hi] == part for data in buffers):
+                continue
+            if hi - lo > _SCAN_BLOCK:
+                mid = (lo + hi) // 2
+                # Left half last, so spans are visited in order.
+                stack.append((mid, hi))
+                stack.append((lo, mid))
+                continue
+            for offset in range(lo, hi):
+                value = reference[offset]
+                if all(data[offset] == value for data in buffers):
+                    continue
+                values = [
+                    data[offset] if offset < len(data) else MISSING_BYTE
+                    for data in data_list
+                ]
+                diffs.append(
+                    MultiFileDifference(path=path, offset=offset, values=values)
+                )
+    return diffs
+
+
 def compare_binary_data(
     data1: bytes, data2: bytes, path: str
 ) -> Iterator[ByteDifference]:
     """Compare two byte sequences and yield differences."""
-    min_len = min(len(data1), len(data2))
-
-    # Compare common bytes
-    for i in range(min_len):
-        if data1[i] != data2[i]:
-            yield ByteDifference(path=path, offset=i, byte1=data1[i], byte2=data2[i])
-
-    # Report extra bytes in longer sequence
-    if len(data1) > min_len:
-        for i in range(min_len, len(data1)):
-            yield ByteDifference(
-                path=path,
-                offset=i,
-                byte1=data1[i],
-                byte2=MISSING_BYTE,  # byte doesn't exist in file 2
-            )
-    elif len(data2) > min_len:
-        for i in range(min_len, len(data2)):
-            yield ByteDifference(
-                path=path,
-                offset=i,
-                byte1=MISSING_BYTE,
-                byte2=data2[i],  # byte doesn't exist in file 1
-            )
+    for byte_range in diff_ranges(data1, data2, path):
+        yield from byte_range.byte_differences()
 
 
 # ── AEP chunk extraction ───────────────────────────────────────────────────
@@ -236,17 +445,119 @@ def _extract_chunks_recursive(
                 pass
 
 
+def _leaf_digest(identifier: str, data: bytes) -> bytes:
+    """Hash a leaf chunk."""
+    return hashlib.blake2b(
+        identifier.encode("ascii", "replace") + b"\0" + data, digest_size=16
+    ).digest()
+
+
+def _list_digest(identifier: str, children: list[ChunkDigest]) -> bytes:
+    """Hash a LIST chunk from the digests of its children."""
+    h = hashlib.blake2b(identifier.encode("ascii", "replace"), digest_size=16)
+    for child in children:
+        h.update(child.digest)
+    return h.digest()
+
+
+def _digest_chunks(chunks: list[Any], parent_path: str) -> list[ChunkDigest]:
+    """Build the [ChunkDigest][] nodes of *chunks*, hashing bottom-up."""
+    counters: dict[str, int] = {}
+    nodes: list[ChunkDigest] = []
+    for chunk in chunks:
+        identifier = _get_chunk_identifier(chunk)
+        current_path = _build_chunk_path(parent_path, identifier, counters)
+
+        if chunk.chunk_type == "LIST":
+            children: list[ChunkDigest] = []
+            if hasattr(chunk.body, "chunks") and chunk.body.chunks:
+                children = _digest_chunks(chunk.body.chunks, current_path)
+            nodes.append(
+                ChunkDigest(
+                    path=current_path,
+                    identifier=identifier,
+                    digest=_list_digest(identifier, children),
+                    children=children,
+                )
+            )
+        else:
+            try:
+                raw_data = chunk._raw_body or b""
+            except (AttributeError, TypeError):
+                raw_data = b""
+            nodes.append(
+                ChunkDigest(
+                    path=current_path,
+                    identifier=identifier,
+                    digest=_leaf_digest(identifier, raw_data),
+                    data=raw_data,
+                )
+            )
+    return nodes
+
+
+def chunk_digest_tree(file_path: Path) -> ChunkDigest:
+    """
+    Parse an AEP file into a chunk tree with Merkle hashes.
+
+    Every chunk gets a digest: leaf chunks hash their type and data,
+    LIST chunks hash their list type and the digests of their children.
+    Two subtrees with equal digests are identical, so comparing two
+    trees only needs to descend where digests differ.
+
+    Args:
+        file_path: Path to the AEP file.
+
+    Returns:
+        The root node, with an empty path, holding the top-level chunks.
+    """
+    with Aep.from_file(str(file_path)) as aep:
+        aep._read()
+        children = _digest_chunks(aep.body.chunks, "")
+    return ChunkDigest(
+        path="",
+        identifier="",
+        digest=_list_digest("", children),
+        children=children,
+    )
+
+
 # ── Comparison helpers ──────────────────────────────────────────────────────
 
 
+def _chunk_difference(
+    path: str, bytes1: bytes, bytes2: bytes, per_byte: bool
+) -> ChunkDifference | None:
+    """Compare the data of a chunk present in both files.
+
+    Returns:
+        The differences, or `None` if the data is identical.
+    """
+    ranges = diff_ranges(bytes1, bytes2, path)
+    if not ranges:
+        return None
+    byte_diffs = [bd for r in ranges for bd in r.byte_differences()] if per_byte else []
+    return ChunkDifference(
+        path=path,
+        byte_diffs=byte_diffs,
+        size1=len(bytes1),
+        size2=len(bytes2),
+        ranges=ranges,
+    )
+
+
 def _compare_chunk_dicts(
-    data1: dict[str, bytes], data2: dict[str, bytes]
+    data1: dict[str, bytes],
+    data2: dict[str, bytes],
+    per_byte: bool = True,
 ) -> tuple[list[ChunkDifference], list[str], list[str]]:
     """Compare two chunk dictionaries and return differences.
 
     Args:
         data1: Chunk path to bytes mapping from file 1.
         data2: Chunk path to bytes mapping from file 2.
+        per_byte: Also fill in `byte_diffs` with one [ByteDifference][]
+            per differing byte. Otherwise only the ranges are set.
 
     Returns:
         Tuple of (differences, paths only in data1, paths only in data2).
@@ -260,21 +571,315 @@ def _compare_chunk_dicts(
 
     differences: list[ChunkDifference] = []
     for path in common_paths:
-        bytes1 = data1[path]
-        bytes2 = data2[path]
-        byte_diffs = list(compare_binary_data(bytes1, bytes2, path))
+        diff = _chunk_difference(path, data1[path], data2[path], per_byte)
+        if diff is not None:
+            differences.append(diff)
 
-        if byte_diffs or len(bytes1) != len(bytes2):
-            differences.append(
-                ChunkDifference(
-                    path=path,
-                    byte_diffs=byte_diffs,
-                    size1=len(bytes1),
-                    size2=len(bytes2),
+    return differences, only_in_1, only_in_2
+
+
+def compare_digest_trees(
+    tree1: ChunkDigest,
+    tree2: ChunkDigest,
+    per_byte: bool = True,
+) -> tuple[list[ChunkDifference], list[str], list[str]]:
+    """Compare two chunk trees, skipping subtrees with equal digests.
+
+    Gives the same result as comparing all leaf chunks of both files,
+    but only descends into LIST chunks whose digests differ.
+
+    Args:
+        tree1: Tree of file 1, from [chunk_digest_tree][].
+        tree2: Tree of file 2.
+        per_byte: Also fill in `byte_diffs`, see
+            [_compare_chunk_dicts][].
+
+    Returns:
+        Tuple of (differences, leaf paths only in tree1, leaf paths only
+        in tree2).
+    """
+    differences: list[ChunkDifference] = []
+    only_in_1: list[str] = []
+    only_in_2: list[str] = []
+
+    stack = [(tree1, tree2)]
+    while stack:
+        node1, node2 = stack.pop()
+        children2 = {child.path: child for child in node2.children}
+        for child1 in node1.children:
+            child2 = children2.pop(child1.path, None)
+            if child2 is None:
+                only_in_1.extend(leaf.path for leaf in child1.iter_leaves())
+            elif child1.digest == child2.digest:
+                continue
+            elif child1.is_list:
+                stack.append((child1, child2))
+            elif not child2.data:
+                if child1.data:
+                    only_in_1.append(child1.path)
+            elif not child1.data:
+                only_in_2.append(child2.path)
+            else:
+                diff = _chunk_difference(
+                    child1.path, child1.data, child2.data, per_byte
                 )
+                if diff is not None:
+                    differences.append(diff)
+        for child2 in children2.values():
+            only_in_2.extend(leaf.path for leaf in child2.iter_leaves())
+
+    differences.sort(key=lambda diff: diff.path)
+    return differences, sorted(only_in_1), sorted(only_in_2)
+
+
+def _unique_anchors(
+    a: list[ChunkDigest],
+    a_range: range,
+    b: list[ChunkDigest],
+    b_range: range,
+) -> list[tuple[int, int]]:
+    """Return the patience diff anchors of two sibling ranges.
+
+    These are the longest increasing run of chunks whose digest occurs
+    exactly once in each range.
+    """
+    # Index of each digest in a range, or -1 if it occurs more than once.
+    in_a: dict[bytes, int] = {}
+    for i in a_range:
+        in_a[a[i].digest] = -1 if a[i].digest in in_a else i
+    in_b: dict[bytes, int] = {}
+    for j in b_range:
+        in_b[b[j].digest] = -1 if b[j].digest in in_b else j
+    candidates = sorted(
+        (i, in_b[digest])
+        for digest, i in in_a.items()
+        if i >= 0 and in_b.get(digest, -1) >= 0
+    )
+    return _increasing_pairs(candidates)
+
+
+def _increasing_pairs(pairs: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Return the longest run of *pairs*, sorted by `i`, increasing in `j`."""
+    # Patience sorting: tails[k] is the index in *pairs* of the smallest
+    # `j` ending an increasing run of length k + 1.
+    tail_js: list[int] = []
+    tails: list[int] = []
+    previous: list[int] = []
+    for index, (_, j) in enumerate(pairs):
+        k = bisect.bisect_left(tail_js, j)
+        previous.append(tails[k - 1] if k else -1)
+        if k == len(tails):
+            tail_js.append(j)
+            tails.append(index)
+        else:
+            tail_js[k] = j
+            tails[k] = index
+    result: list[tuple[int, int]] = []
+    index = tails[-1] if tails else -1
+    while index >= 0:
+        result.append(pairs[index])
+        index = previous[index]
+    result.reverse()
+    return result
+
+
+def _pair_equal(
+    a: list[ChunkDigest],
+    a_range: range,
+    b: list[ChunkDigest],
+    b_range: range,
+) -> list[tuple[int, int]]:
+    """Pair the n-th occurrences of each digest of two sibling ranges, in order."""
+    occurrences: dict[bytes, list[int]] = {}
+    for j in b_range:
+        occurrences.setdefault(b[j].digest, []).append(j)
+    seen: dict[bytes, int] = {}
+    pairs: list[tuple[int, int]] = []
+    for i in a_range:
+        digest = a[i].digest
+        n = seen.get(digest, 0)
+        js = occurrences.get(digest, ())
+        if n < len(js):
+            pairs.append((i, js[n]))
+            seen[digest] = n + 1
+    return _increasing_pairs(pairs)
+
+
+def _pair_by_type(
+    a: list[ChunkDigest],
+    a_range: range,
+    b: list[ChunkDigest],
+    b_range: range,
+    a_digests: set[bytes],
+    b_digests: set[bytes],
+) -> list[tuple[int, int]]:
+    """Pair the n-th chunks of each type of two sibling ranges, in order.
+
+    Chunks whose digest occurs among the unmatched siblings on the other
+    side are left unpaired, to be reported as moved.
+    """
+    occurrences: dict[str, list[int]] = {}
+    for j in b_range:
+        if b[j].digest not in a_digests:
+            occurrences.setdefault(b[j].identifier, []).append(j)
+    seen: dict[str, int] = {}
+    pairs: list[tuple[int, int]] = []
+    for i in a_range:
+        if a[i].digest in b_digests:
+            continue
+        identifier = a[i].identifier
+        n = seen.get(identifier, 0)
+        js = occurrences.get(identifier, ())
+        if n < len(js):
+            pairs.append((i, js[n]))
+            seen[identifier] = n + 1
+    return _increasing_pairs(pairs)
+
+
+def _align_siblings(
+    a: list[ChunkDigest], b: list[ChunkDigest]
+) -> list[tuple[int, int]]:
+    """Match two sequences of sibling chunks.
+
+    Equal leading and trailing chunks are matched first, then chunks with
+    a digest that is unique on both sides (patience diff), and the ranges
+    between those are aligned the same way. Ranges without unique chunks
+    pair their equal chunks in order, then pair the changed chunks of the
+    same type between those in order, so that they are compared with each
+    other.
+
+    Returns:
+        The matched `(index in a, index in b)` pairs, in order.
+    """
+    pairs: list[tuple[int, int]] = []
+    unanchored: list[tuple[range, range]] = []
+    stack = [(0, len(a), 0, len(b))]
+    while stack:
+        a_lo, a_hi, b_lo, b_hi = stack.pop()
+        while a_lo < a_hi and b_lo < b_hi and a[a_lo].digest == b[b_lo].digest:
+            pairs.append((a_lo, b_lo))
+            a_lo += 1
+            b_lo += 1
+        while a_lo < a_hi and b_lo < b_hi and a[a_hi - 1].digest == b[b_hi - 1].digest:
+            a_hi -= 1
+            b_hi -= 1
+            pairs.append((a_hi, b_hi))
+        if a_lo == a_hi or b_lo == b_hi:
+            continue
+
+        a_range = range(a_lo, a_hi)
+        b_range = range(b_lo, b_hi)
+        anchors = _unique_anchors(a, a_range, b, b_range)
+        if not anchors:
+            unanchored.append((a_range, b_range))
+            continue
+        for i, j in anchors:
+            pairs.append((i, j))
+            stack.append((a_lo, i, b_lo, j))
+            a_lo, b_lo = i + 1, j + 1
+        stack.append((a_lo, a_hi, b_lo, b_hi))
+
+    if unanchored:
+        gaps: list[tuple[range, range]] = []
+        for a_range, b_range in unanchored:
+            equal = _pair_equal(a, a_range, b, b_range)
+            pairs.extend(equal)
+            a_lo, b_lo = a_range.start, b_range.start
+            for i, j in [*equal, (a_range.stop, b_range.stop)]:
+                if a_lo < i and b_lo < j:
+                    gaps.append((range(a_lo, i), range(b_lo, j)))
+                a_lo, b_lo = i + 1, j + 1
+        # Only chunks left unmatched on the other side can be moves.
+        a_matched = {i for i, _ in pairs}
+        b_matched = {j for _, j in pairs}
+        a_digests = {c.digest for i, c in enumerate(a) if i not in a_matched}
+        b_digests = {c.digest for j, c in enumerate(b) if j not in b_matched}
+        for a_range, b_range in gaps:
+            pairs.extend(_pair_by_type(a, a_range, b, b_range, a_digests, b_digests))
+
+    pairs.sort()
+    return pairs
+
+
+def align_digest_trees(
+    tree1: ChunkDigest,
+    tree2: ChunkDigest,
+    per_byte: bool = True,
+) -> tuple[list[ChunkDifference], list[ChunkEdit]]:
+    """Compare two chunk trees, aligning sibling chunks by content.
+
+    Unlike [compare_digest_trees][], which matches chunks by path, this
+    matches the children of each LIST chunk with a patience diff on their
+    digests. A layer or keyframe chunk inserted in the middle of a list is
+    reported as one insertion instead of shifting the index of every
+    following sibling. Chunks deleted in one place and inserted unchanged
+    in another are reported as moves.
+
+    Args:
+        tree1: Tree of file 1, from [chunk_digest_tree][].
+        tree2: Tree of file 2.
+        per_byte: Also fill in `byte_diffs`, see
+            [_compare_chunk_dicts][].
+
+    Returns:
+        Tuple of (differences of matched leaf chunks, inserted, deleted
+        and moved chunks).
+    """
+    differences: list[ChunkDifference] = []
+    deleted: list[ChunkDigest] = []
+    inserted: list[ChunkDigest] = []
+
+    stack = [(tree1, tree2)]
+    while stack:
+        node1, node2 = stack.pop()
+        children1, children2 = node1.children, node2.children
+        matched1: set[int] = set()
+        matched2: set[int] = set()
+        for i, j in _align_siblings(children1, children2):
+            matched1.add(i)
+            matched2.add(j)
+            child1, child2 = children1[i], children2[j]
+            if child1.digest == child2.digest:
+                continue
+            if child1.is_list:
+                stack.append((child1, child2))
+                continue
+            diff = _chunk_difference(
+                child1.path, child1.data or b"", child2.data or b"", per_byte
             )
+            if diff is not None:
+                if child2.path != child1.path:
+                    diff.path2 = child2.path
+                differences.append(diff)
+        deleted.extend(c for i, c in enumerate(children1) if i not in matched1)
+        inserted.extend(c for j, c in enumerate(children2) if j not in matched2)
+
+    # An unchanged chunk deleted in one place and inserted in another moved.
+    insertions: dict[bytes, list[ChunkDigest]] = {}
+    for node in inserted:
+        insertions.setdefault(node.digest, []).append(node)
+    edits: list[ChunkEdit] = []
+    for node in deleted:
+        candidates = insertions.get(node.digest)
+        if candidates:
+            moved = candidates.pop(0)
+            edits.append(ChunkEdit("moved", node.path, moved.path, node.data_size()))
+        else:
+            edits.append(ChunkEdit("deleted", node.path, None, node.data_size()))
+    for nodes in insertions.values():
+        for node in nodes:
+            edits.append(ChunkEdit("inserted", None, node.path, node.data_size()))
 
-    return differences, only_in_1, only_in_2
+    differences.sort(key=lambda diff: diff.path)
+    edits.sort(key=lambda edit: edit.path1 or edit.path2 or "")
+    return differences, edits
+
+
+def _leaf_data(tree: ChunkDigest, paths: set[str]) -> dict[str, bytes]:
+    """Return the data of the leaf chunks of *tree* at *paths*."""
+    return {
+        leaf.path: leaf.data or b"" for leaf in tree.iter_leaves() if leaf.path in paths
+    }
 
 
 # ── List chunks ─────────────────────────────────────────────────────────────
@@ -422,6 +1027,7 @@ def dump_aep_chunk(file_path: Path, chunk_path: str) -> None:
 
 def compare_multi_aep_files(
     files: list[Path],
+    processes: int | None = None,
 ) -> tuple[
     list[MultiChunkDifference],
     list[tuple[str, list[int]]],
@@ -433,11 +1039,19 @@ def compare_multi_aep_files(
 
     Args:
         files: List of AEP file paths (first = reference).
+        processes: Parse the files in this many worker processes.
+            `None` or `1` parses them in the current process.
 
     Returns:
         Tuple of (chunk differences, missing chunk info, parsed data per file).
     """
-    all_data = [parse_aep_chunks(f) for f in files]
+    if processes is None or processes <= 1 or len(files) < 2:
+        all_data = [parse_aep_chunks(f) for f in files]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=min(processes, len(files))) as executor:
+            all_data = list(executor.map(parse_aep_chunks, files))
     all_paths: set[str] = set()
     for d in all_data:
         all_paths.update(d.keys())
@@ -454,23 +1068,7 @@ def compare_multi_aep_files(
 
         data_list = [all_data[i].get(path, b"") for i in range(len(files))]
         sizes = [len(d) for d in data_list]
-        max_len = max(sizes)
-
-        chunk_diffs: list[MultiFileDifference] = []
-        for offset in range(max_len):
-            values: list[int] = []
-            for i in range(len(files)):
-                if offset < len(data_list[i]):
-                    values.append(data_list[i][offset])
-                else:
-                    values.append(MISSING_BYTE)
-
-            non_missing = [v for v in values if v != MISSING_BYTE]
-            if len(set(non_missing)) > 1:
-                chunk_diffs.append(
-                    MultiFileDifference(path=path, offset=offset, values=values)
-                )
-
+        chunk_diffs = diff_columns(data_list, path)
         if chunk_diffs:
             differences.append(
                 MultiChunkDifference(path=path, diffs=chunk_diffs, sizes=sizes)
@@ -514,6 +1112,7 @@ def print_results(
     context: int = 0,
     data1: dict[str, bytes] | None = None,
     data2: dict[str, bytes] | None = None,
+    edits: list[ChunkEdit] | None = None,
 ) -> None:
     """Print comparison results to stdout.
 
@@ -526,6 +1125,7 @@ def print_results(
         context: Number of surrounding bytes to show around diffs.
         data1: Parsed chunk data for file 1 (for context display).
         data2: Parsed chunk data for file 2 (for context display).
+        edits: Inserted, deleted and moved chunks, with `--align`.
     """
     print(f"\n{'=' * 80}")
     print("Comparing:")
@@ -533,10 +1133,17 @@ def print_results(
     print(f"  File 2: {file2}")
     print(f"{'=' * 80}\n")
 
-    if not differences and not only_in_file1 and not only_in_file2:
+    if not differences and not only_in_file1 and not only_in_file2 and not edits:
         print("No differences found!")
         return
 
+    if edits:
+        print(f"\n{'─' * 40}")
+        print(f"Inserted, deleted and moved chunks ({len(edits)}):")
+        print(f"{'─' * 40}")
+        for edit in edits:
+            print(edit.format_edit())
+
     # Print chunks only in file1
     if only_in_file1:
         print(f"\n{'─' * 40}")
@@ -560,10 +1167,18 @@ def print_results(
         print(f"{'─' * 40}")
 
         for diff in differences:
-            print(f"\n[{diff.path}]")
+            if diff.path2 is not None:
+                print(f"\n[{diff.path} -> {diff.path2}]")
+            else:
+                print(f"\n[{diff.path}]")
             if diff.has_size_difference():
                 print(f"  Size: {diff.size1} bytes vs {diff.size2} bytes")
 
+            if not diff.byte_diffs:
+                for byte_range in diff.ranges:
+                    print(byte_range.format_diff())
+                continue
+
             for byte_diff in diff.byte_diffs:
                 if byte_diff.byte1 == MISSING_BYTE:
                     print(
@@ -583,7 +1198,7 @@ def print_results(
                 # Context display
                 if context > 0 and data1 is not None and data2 is not None:
                     d1 = data1.get(diff.path, b"")
-                    d2 = data2.get(diff.path, b"")
+                    d2 = data2.get(diff.path2 or diff.path, b"")
                     if d1:
                         print(
                             _format_context_line(
@@ -598,13 +1213,17 @@ def print_results(
                         )
 
     # Summary
-    total_byte_diffs = sum(len(d.byte_diffs) for d in differences)
+    total_byte_diffs = sum(d.num_byte_differences() for d in differences)
     print(f"\n{'=' * 80}")
     print("Summary:")
     print(f"  Chunks with differences: {len(differences)}")
     print(f"  Total byte differences: {total_byte_diffs}")
     print(f"  Chunks only in File 1: {len(only_in_file1)}")
     print(f"  Chunks only in File 2: {len(only_in_file2)}")
+    if edits is not None:
+        for kind in ("inserted", "deleted", "moved"):
+            count = sum(1 for edit in edits if edit.kind == kind)
+            print(f"  Chunks {kind}: {count}")
     print(f"{'=' * 80}\n")
 
 
@@ -706,14 +1325,16 @@ def to_json_output(
     differences: list[ChunkDifference],
     only_in_file1: list[str],
     only_in_file2: list[str],
+    edits: list[ChunkEdit] | None = None,
 ) -> dict[str, Any]:
     """Convert comparison results to a JSON-serializable dict."""
-    return {
+    output: dict[str, Any] = {
         "file1": str(file1),
         "file2": str(file2),
         "chunks_with_differences": [
             {
                 "path": diff.path,
+                "path2": diff.path2,
                 "size1": diff.size1,
                 "size2": diff.size2,
                 "byte_differences": [
@@ -738,6 +1359,10 @@ def to_json_output(
                     }
                     for bd in diff.byte_diffs
                 ],
+                "ranges": [
+                    {"start": r.start, "end": r.end, "length": len(r)}
+                    for r in diff.ranges
+                ],
             }
             for diff in differences
         ],
@@ -745,11 +1370,26 @@ def to_json_output(
         "only_in_file2": only_in_file2,
         "summary": {
             "chunks_with_differences": len(differences),
-            "total_byte_differences": sum(len(d.byte_diffs) for d in differences),
+            "total_byte_differences": sum(
+                d.num_byte_differences() for d in differences
+            ),
             "only_in_file1": len(only_in_file1),
             "only_in_file2": len(only_in_file2),
         },
     }
+    if edits is not None:
+        output["edits"] = [
+            {
+                "kind": edit.kind,
+                "path1": edit.path1,
+                "path2": edit.path2,
+                "size": edit.size,
+            }
+            for edit in edits
+        ]
+        for kind in ("inserted", "deleted", "moved"):
+            output["summary"][kind] = sum(1 for edit in edits if edit.kind == kind)
+    return output
 
 
 def filter_differences(
@@ -786,6 +1426,7 @@ Examples:
     %(prog)s file.aep --dump "LIST:Fold/ftts" (hex dump)
     %(prog)s file1.aep file2.aep --context 4
     %(prog)s file1.aep file2.aep --json
+    %(prog)s file1.aep file2.aep --align     (inserted/moved chunks)
     %(prog)s file1.aep file2.aep --filter ldta
 
 Output shows for each different byte:
@@ -834,6 +1475,24 @@ Output shows for each different byte:
         metavar="N",
         help="Show N surrounding bytes around each difference",
     )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=os.cpu_count() or 1,
+        metavar="N",
+        help=(
+            "Parse files in N worker processes in multi-file mode "
+            "(default: number of CPUs)"
+        ),
+    )
+    parser.add_argument(
+        "--align",
+        action="store_true",
+        help=(
+            "Match sibling chunks by content instead of by index, and "
+            "report inserted, deleted and moved chunks (two files only)"
+        ),
+    )
 
     args = parser.parse_args()
     files: list[Path] = args.files
@@ -875,11 +1534,20 @@ Output shows for each different byte:
         )
         return 1
 
+    if args.align and len(files) != 2:
+        print(
+            "Error: --align requires exactly two files",
+            file=sys.stderr,
+        )
+        return 1
+
     # ── Multi-file comparison (3+ AEP files) ──────────────────────
 
     if len(files) > 2:
         try:
-            multi_diffs, missing, all_data = compare_multi_aep_files(files)
+            multi_diffs, missing, all_data = compare_multi_aep_files(
+                files, processes=args.processes
+            )
         except Exception as e:
             print(f"Error comparing files: {e}", file=sys.stderr)
             traceback.print_exc()
@@ -905,11 +1573,22 @@ Output shows for each different byte:
 
     try:
         # Parse once and reuse for both comparison and context
-        data1 = parse_aep_chunks(file1)
-        data2 = parse_aep_chunks(file2)
-        diffs, only1, only2 = _compare_chunk_dicts(data1, data2)
-        ctx1: dict[str, bytes] | None = data1 if args.context > 0 else None
-        ctx2: dict[str, bytes] | None = data2 if args.context > 0 else None
+        tree1 = chunk_digest_tree(file1)
+        tree2 = chunk_digest_tree(file2)
+        # Per-byte entries are only needed for context and JSON output
+        per_byte = args.context > 0 or args.json
+        edits: list[ChunkEdit] | None = None
+        if args.align:
+            diffs, edits = align_digest_trees(tree1, tree2, per_byte)
+            only1: list[str] = []
+            only2: list[str] = []
+        else:
+            diffs, only1, only2 = compare_digest_trees(tree1, tree2, per_byte)
+        ctx1: dict[str, bytes] | None = None
+        ctx2: dict[str, bytes] | None = None
+        if args.context > 0:
+            ctx1 = _leaf_data(tree1, {diff.path for diff in diffs})
+            ctx2 = _leaf_data(tree2, {diff.path2 or diff.path for diff in diffs})
     except Exception as e:
         print(f"Error comparing files: {e}", file=sys.stderr)
         traceback.print_exc()
@@ -918,10 +1597,18 @@ Output shows for each different byte:
     # Apply filter
     if args.filter:
         diffs, only1, only2 = filter_differences(diffs, only1, only2, args.filter)
+        if edits is not None:
+            pattern = args.filter.lower()
+            edits = [
+                edit
+                for edit in edits
+                if pattern in (edit.path1 or "").lower()
+                or pattern in (edit.path2 or "").lower()
+            ]
 
     # Output results
     if args.json:
-        output = to_json_output(file1, file2, diffs, only1, only2)
+        output = to_json_output(file1, file2, diffs, only1, only2, edits)
         print(json.dumps(output, indent=2))
     else:
         print_results(
@@ -933,9 +1620,10 @@ Output shows for each different byte:
             context=args.context,
             data1=ctx1,
             data2=ctx2,
+            edits=edits,
         )
 
-    return 0 if not diffs and not only1 and not only2 else 1
+    return 0 if not diffs and not only1 and not only2 and not edits else 1
 
 
 if __name__ == "__main__":
@@ -17,139 +17,22 @@ import json
 import math
 import re
 import sys
-from dataclasses import fields, is_dataclass
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
 from py_aep import parse
-
-# Fields to skip to avoid circular references.
-# Back-references: containing_comp, parent_folder, parent (OutputModule),
-#   _parent (Layer).
-# Cross-references that re-enter the object graph: _source (AVLayer > Item),
-#   comp (RenderQueueItem > CompItem),
-#   post_render_target_comp (OutputModule > CompItem).
-# The non-circular ID fields (source_id, parent_id) are still serialized.
-SKIP_FIELDS = {
-    "containing_comp",
-    "parent_folder",
-    "parent_property",
-    "parent",
-    "comp",
-    "post_render_target_comp",
-    # Internal marker property (Property with keyframes); compared
-    # separately via _compare_markers.
-    "marker_property",
-    # Cross-reference: LightLayer.light_source > Layer
-    "light_source",
-}
-
-# @property attributes that return complex/duplicate data and should not be
-# included in to_dict() serialization.
-SKIP_PROPERTIES = {
-    "active_camera",
-    "composition_layers",
-    "footage_layers",
-    "selected_layers",
-    # Circular: AVLayer.source > Item > layers > AVLayer...
-    "source",
-    # Circular: AVLayer.track_matte_layer > AVLayer
-    "track_matte_layer",
-    # Circular: AVItem.used_in > list[CompItem] > layers > source > AVItem...
-    "used_in",
-    # Duplicate/circular: Project re-serializes items already in `items` field
-    "compositions",
-    "folders",
-    "footages",
-    # Layer @property accessors derived from Layer.properties - serializing
-    # them would duplicate data already present in the properties list.
-    "transform",
-    "effects",
-    "masks",
-    "text",
-    # Duplicate: Property.separation_leader > Property
-    "separation_leader",
-    # Layer.marker @property: duplicates ADBE Marker in properties tree.
-    "marker",
-}
-
-
-_field_names_cache: dict[type, frozenset[str] | set[str] | None] = {}
-
-
-def _get_field_names(obj: Any) -> frozenset[str] | set[str] | None:
-    """Get serializable field names for model objects.
-
-    Supports both `@dataclass` models and plain-class models that use
-    type annotations and/or chunk-backed descriptors (e.g. the Item
-    hierarchy after the descriptor conversion).
-
-    Results are cached per type since field names are class-level metadata.
-    """
-    cls = type(obj)
-    if cls in _field_names_cache:
-        return _field_names_cache[cls]
-
-    names: set[str] = set()
-    if is_dataclass(obj) and not isinstance(obj, type):
-        names = {f.name for f in fields(obj)}
-    # Collect annotations and chunk-backed descriptors from the full MRO.
-    # This covers plain-class models and also dataclass subclasses that
-    # add chunk descriptors in non-dataclass bases (e.g. Layer extends
-    # PropertyGroup with ChunkField descriptors).
-    for base in reversed(cls.__mro__):
-        if base is object:
-            continue
-        for name in getattr(base, "__annotations__", {}):
-            if not name.startswith("_"):
-                names.add(name)
-        for name, attr in vars(base).items():
-            if hasattr(attr, "chunk_attr") and hasattr(attr, "__get__"):
-                names.add(name)
-    if names:
-        result = frozenset(names)
-        _field_names_cache[cls] = result
-        return result
-    # Check for public @property definitions (descriptor-backed classes
-    # that replaced all class-level annotations with properties).
-    for base in reversed(cls.__mro__):
-        if base is object:
-            continue
-        for name, attr in vars(base).items():
-            if not name.startswith("_") and isinstance(attr, property):
-                names.add(name)
-    result2: frozenset[str] | None = frozenset(names) if names else None
-    _field_names_cache[cls] = result2
-    return result2
-
-
-_property_names_cache: dict[type, frozenset[str]] = {}
-
-
-def _get_property_names(cls: type) -> frozenset[str]:
-    """Get public @property names for a class, cached per type."""
-    if cls in _property_names_cache:
-        return _property_names_cache[cls]
-    names: set[str] = set()
-    for name in dir(cls):
-        if name.startswith("_") or name in SKIP_FIELDS or name in SKIP_PROPERTIES:
-            continue
-        attr = getattr(cls, name, None)
-        if isinstance(attr, property):
-            names.add(name)
-    result = frozenset(names)
-    _property_names_cache[cls] = result
-    return result
-
-
-_PRIMITIVE_TYPES = (int, float, str, bool, type(None))
+from py_aep.models.serialize import (
+    PRIMITIVE_TYPES,
+    get_field_names,
+    iter_model_fields,
+)
 
 
 def to_dict(obj: Any) -> Any:
     """Convert dataclass/enum to dict recursively, skipping circular reference fields."""
     # Fast path for primitive types (majority of recursive calls)
-    if isinstance(obj, _PRIMITIVE_TYPES):
+    if isinstance(obj, PRIMITIVE_TYPES):
         return obj
     if isinstance(obj, Enum):
         return obj.value
@@ -157,25 +40,16 @@ def to_dict(obj: Any) -> Any:
         return [to_dict(item) for item in obj]
     if isinstance(obj, dict):
         return {k: to_dict(v) for k, v in obj.items()}
-    field_names = _get_field_names(obj)
+    field_names = get_field_names(obj)
     if field_names is not None:
         result = {}
-        for name in field_names:
-            if name in SKIP_FIELDS:
-                continue
-            try:
-                value = getattr(obj, name)
-            except AttributeError:
-                continue
-            result[name] = to_dict(value)
-        # Include @property attributes (non-private, non-skipped)
-        for name in _get_property_names(type(obj)):
-            if name in result:
+        for name, value in iter_model_fields(obj, field_names):
+            if name in field_names:
+                result[name] = to_dict(value)
                 continue
             try:
-                value = getattr(obj, name)
                 result[name] = to_dict(value)
-            except Exception:  # properties may raise on missing data
+            except Exception:  # nested values of properties may fail to convert
                 pass
         return result
     return obj
@@ -1591,7 +1465,17 @@ def validate_aep(
         print(f"Parsing: {aep_path.name}")
     app = parse(aep_path)
     project = app.project
-    parsed = to_dict(project)
+    # Items are converted one at a time below, so that only one
+    # composition is held as a dict at once.
+    field_names = get_field_names(project)
+    assert field_names is not None
+    parsed = to_dict(
+        {
+            name: value
+            for name, value in iter_model_fields(project, field_names)
+            if name != "items"
+        }
+    )
 
     # Load expected JSON
     with json_path.open(encoding="utf-8") as f:
@@ -1609,19 +1493,19 @@ def validate_aep(
     # Compare compositions
     if verbose:
         print("\n=== Comparing Compositions ===")
-    parsed_by_id = {comp.id: to_dict(comp) for comp in project.compositions}
+    comps_by_id = {comp.id: comp for comp in project.compositions}
 
     for exp_item in comps:
         item_id = exp_item["id"]
         item_name = exp_item["name"]
 
-        if item_id not in parsed_by_id:
+        if item_id not in comps_by_id:
             result.add_diff(f"Comp[{item_name}]", "exists", "missing", "composition")
             if verbose:
                 print(f"  {item_name} (id={item_id}): MISSING!")
             continue
 
-        parsed_comp = parsed_by_id[item_id]
+        parsed_comp = to_dict(comps_by_id[item_id])
         before_count = len(result)
         compare_comp_item(exp_item, parsed_comp, f"Comp[{item_name}]", result)
 
@@ -1635,29 +1519,34 @@ def validate_aep(
     # Compare folder hierarchy
     if verbose:
         print("\n=== Comparing Folder Hierarchy ===")
-    compare_folder_hierarchy(expected_items, parsed.get("items", {}), result)
+    parsed_folders = {
+        item_id: {"type_name": item.type_name, "name": item.name}
+        for item_id, item in project.items.items()
+        if item.type_name == "Folder"
+    }
+    compare_folder_hierarchy(expected_items, parsed_folders, result)
 
     # Compare footage items
     if verbose:
         print("\n=== Comparing Footage Items ===")
     expected_footage = [i for i in expected_items if i.get("itemType") == "FootageItem"]
-    parsed_items_dict = parsed.get("items", {})
-    parsed_footage_by_id = {
+    footage_by_id = {
         item_id: item
-        for item_id, item in parsed_items_dict.items()
-        if item.get("type_name") == "Footage"
+        for item_id, item in project.items.items()
+        if item.type_name == "Footage"
     }
 
     for exp_fi in expected_footage:
         fi_id = exp_fi["id"]
         fi_name = exp_fi["name"]
 
-        parsed_fi = parsed_footage_by_id.get(fi_id)
-        if parsed_fi is None:
+        footage = footage_by_id.get(fi_id)
+        if footage is None:
             result.add_diff(f"Footage[{fi_name}]", "exists", "missing", "footage")
             if verbose:
                 print(f"  {fi_name} (id={fi_id}): MISSING!")
             continue
+        parsed_fi = to_dict(footage)
 
         before_count = len(result)
         compare_footage_item(exp_fi, parsed_fi, f"Footage[{fi_name}]", result)
@@ -19,10 +19,10 @@ from __future__ import annotations
 
 import argparse
 import contextlib
-import json
+import itertools
 import sys
 from pathlib import Path
-from typing import Any, Generator, TextIO
+from typing import Any, Callable, Generator, Iterator, TextIO
 
 from py_aep import parse
 
@@ -34,12 +34,39 @@ from ..models.layers.layer import Layer
 from ..models.project import Project
 from ..models.properties.property import Property
 from ..models.properties.property_group import PropertyGroup
+from ..models.serialize import write_json
 
 # =============================================================================
 # Node builders - Convert model objects to a uniform dict structure
 # =============================================================================
 
 
+class NodeChildren:
+    """The child nodes of a node, built each time they are iterated.
+
+    Node builders return these instead of lists, so that formatters
+    stream the tree and only hold the nodes on the current path.
+    """
+
+    __slots__ = ("_build",)
+
+    def __init__(self, build: Callable[[], Iterator[dict[str, Any]]]) -> None:
+        self._build = build
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return self._build()
+
+
+def _with_last(nodes: Any) -> Iterator[tuple[dict[str, Any], bool]]:
+    """Yield `(node, is_last)` for each of *nodes*."""
+    iterator = iter(nodes)
+    previous = next(iterator, None)
+    while previous is not None:
+        current = next(iterator, None)
+        yield previous, current is None
+        previous = current
+
+
 def build_project_node(
     app: Application, include_properties: bool = True
 ) -> dict[str, Any]:
@@ -54,22 +81,22 @@ def build_project_node(
     if project.effect_names:
         attrs["effects_used"] = len(project.effect_names)
 
-    children: list[dict[str, Any]] = []
-    root = project.root_folder
-    for item in root:
-        children.append(build_item_node(item, project, include_properties))
-
-    # Add render queue if it has items
     if project.render_queue is None:
         raise RuntimeError("Project render_queue should not be None")
-    if project.render_queue.items:
-        children.append(build_render_queue_node(project))
+    render_queue = project.render_queue
+
+    def children() -> Iterator[dict[str, Any]]:
+        for item in project.root_folder:
+            yield build_item_node(item, project, include_properties)
+        # Add render queue if it has items
+        if render_queue.items:
+            yield build_render_queue_node(project)
 
     return {
         "type": "Project",
         "name": Path(project.file).name,
         "attrs": attrs,
-        "children": children,
+        "children": NodeChildren(children),
     }
 
 
@@ -96,15 +123,16 @@ def build_folder_node(
     folder: FolderItem, project: Project, include_properties: bool = True
 ) -> dict[str, Any]:
     """Build a folder node with its children."""
-    children: list[dict[str, Any]] = []
-    for item in folder:
-        children.append(build_item_node(item, project, include_properties))
+
+    def children() -> Iterator[dict[str, Any]]:
+        for item in folder:
+            yield build_item_node(item, project, include_properties)
 
     return {
         "type": "Folder",
         "name": folder.name,
         "attrs": {"label": folder.label.name.lower() if folder.label.value else None},
-        "children": children,
+        "children": NodeChildren(children),
     }
 
 
@@ -121,15 +149,15 @@ def build_comp_node(
     if comp.markers:
         attrs["markers"] = len(comp.markers)
 
-    children: list[dict[str, Any]] = []
-    for layer in comp.layers:
-        children.append(build_layer_node(layer, project, include_properties))
+    def children() -> Iterator[dict[str, Any]]:
+        for layer in comp.layers:
+            yield build_layer_node(layer, project, include_properties)
 
     return {
         "type": "Composition",
         "name": comp.name,
         "attrs": attrs,
-        "children": children,
+        "children": NodeChildren(children),
     }
 
 
@@ -169,25 +197,26 @@ def build_layer_node(
     if layer.markers:
         attrs["markers"] = len(layer.markers)
 
-    children: list[dict[str, Any]] = []
-    if include_properties:
+    def children() -> Iterator[dict[str, Any]]:
+        if not include_properties:
+            return
         # Transform properties
         if layer.transform:
-            children.append(build_property_group_node(layer.transform))
+            yield build_property_group_node(layer.transform)
 
         # Effects
         if layer.effects:
-            children.append(build_property_group_node(layer.effects))
+            yield build_property_group_node(layer.effects)
 
         # Text properties
         if isinstance(layer.text, PropertyGroup):
-            children.append(build_property_group_node(layer.text))
+            yield build_property_group_node(layer.text)
 
     return {
         "type": "Layer",
         "name": layer.name or "(unnamed)",
         "attrs": attrs,
-        "children": children,
+        "children": NodeChildren(children),
     }
 
 
@@ -197,13 +226,15 @@ def build_property_group_node(group: PropertyGroup) -> dict[str, Any]:
     if group.is_effect:
         attrs["effect"] = True
 
-    children = [build_property_or_group_node(p) for p in group.properties]
+    def children() -> Iterator[dict[str, Any]]:
+        for prop in group.properties:
+            yield build_property_or_group_node(prop)
 
     return {
         "type": "PropertyGroup",
         "name": group.name,
         "attrs": attrs,
-        "children": children,
+        "children": NodeChildren(children),
     }
 
 
@@ -248,15 +279,17 @@ def build_render_queue_node(project: Project) -> dict[str, Any]:
         "items": len(project.render_queue.items),
     }
 
-    children: list[dict[str, Any]] = []
-    for i, item in enumerate(project.render_queue.items):
-        children.append(build_render_queue_item_node(item, i + 1, project))
+    items = project.render_queue.items
+
+    def children() -> Iterator[dict[str, Any]]:
+        for i, item in enumerate(items):
+            yield build_render_queue_item_node(item, i + 1, project)
 
     return {
         "type": "RenderQueue",
         "name": "Render Queue",
         "attrs": attrs,
-        "children": children,
+        "children": NodeChildren(children),
     }
 
 
@@ -272,15 +305,15 @@ def build_render_queue_item_node(
     comp = item.comp
     attrs["comp"] = getattr(comp, "name", None)
 
-    children: list[dict[str, Any]] = []
-    for om in item.output_modules:
-        children.append(build_output_module_node(om))
+    def children() -> Iterator[dict[str, Any]]:
+        for om in item.output_modules:
+            yield build_output_module_node(om)
 
     return {
         "type": "RenderQueueItem",
         "name": f"Item {index}",
         "attrs": attrs,
-        "children": children,
+        "children": NodeChildren(children),
     }
 
 
@@ -347,13 +380,13 @@ def format_text(
     output.write(f"{prefix}{connector}{type_icon} {node['name']}{attrs_str}\n")
 
     # Process children
-    children = node.get("children", [])
+    if max_depth is not None and current_depth + 1 > max_depth:
+        return
     child_prefix = prefix + ("    " if is_last else "│   ")
     if current_depth == 0:
         child_prefix = ""
 
-    for i, child in enumerate(children):
-        is_last_child = i == len(children) - 1
+    for child, is_last_child in _with_last(node.get("children", [])):
         format_text(
             child, output, child_prefix, is_last_child, max_depth, current_depth + 1
         )
@@ -429,8 +462,9 @@ def format_dot(
         if parent_id:
             output.write(f"    {parent_id} -> {nid};\n")
 
-        for child in n.get("children", []):
-            write_node(child, nid, depth + 1)
+        if max_depth is None or depth < max_depth:
+            for child in n.get("children", []):
+                write_node(child, nid, depth + 1)
 
         return nid
 
@@ -485,8 +519,9 @@ def format_mermaid(
         if parent_id:
             output.write(f"    {parent_id} --> {nid}\n")
 
-        for child in n.get("children", []):
-            write_node(child, nid, depth + 1)
+        if max_depth is None or depth < max_depth:
+            for child in n.get("children", []):
+                write_node(child, nid, depth + 1)
 
         return nid
 
@@ -499,24 +534,28 @@ def format_json(
     output: TextIO,
     max_depth: int | None = None,
 ) -> None:
-    """Output as JSON."""
+    """Output as JSON, streamed to *output* node by node."""
 
     def filter_depth(n: dict[str, Any], depth: int = 0) -> dict[str, Any]:
-        if max_depth is not None and depth >= max_depth:
-            result = dict(n)
-            if result.get("children"):
-                result["children"] = f"[{len(result['children'])} children omitted]"
-            return result
-
         result = dict(n)
-        if result.get("children"):
-            result["children"] = [
-                filter_depth(c, depth + 1) for c in result["children"]
-            ]
+        if "children" not in result:
+            return result
+        children = iter(result["children"])
+        first = next(children, None)
+        if first is None:
+            result["children"] = []
+        elif max_depth is not None and depth >= max_depth:
+            count = 1 + sum(1 for _ in children)
+            result["children"] = f"[{count} children omitted]"
+        else:
+            # A generator is streamed as an array, building each child
+            # node only when it is written.
+            result["children"] = (
+                filter_depth(c, depth + 1) for c in itertools.chain((first,), children)
+            )
         return result
 
-    filtered = filter_depth(node)
-    output.write(json.dumps(filtered, indent=2, default=str))
+    write_json(filter_depth(node), output, indent=2, default=str)
     output.write("\n")
 
 
@@ -2,13 +2,17 @@
 
 from .cos import CosParser, IndirectObject, IndirectReference, Stream
 from .descriptors import CosField
+from .events import CosEvent, extract_cos_path, iter_cos_events
 from .serializer import serialize
 
 __all__ = [
+    "CosEvent",
     "CosField",
     "CosParser",
     "IndirectObject",
     "IndirectReference",
     "Stream",
+    "extract_cos_path",
+    "iter_cos_events",
     "serialize",
 ]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import io
+import re
 import typing
 from dataclasses import dataclass
 from enum import Enum, auto
@@ -58,10 +58,92 @@ class Stream:
     data: bytes
 
 
+# Skips whitespace and `%` comments (up to the end of the line), then
+# matches the most common tokens whole. Strings, hex strings and invalid
+# input match no group and are lexed from the end of the match.
+_TOKEN_RE = re.compile(
+    rb"(?:\s+|%[^\n]*)*"
+    rb"(?:"
+    # 1: identifier; printable ASCII except the COS delimiters
+    rb"/([^\x00-\x20\x7f-\xff()\[\]<>{}/%]*)"
+    # 2: number, 3: its fractional part
+    rb"|(?=[0-9.+-])([+-]?[0-9]*(\.[0-9]*)?)"
+    # 4: keyword
+    rb"|([A-Za-z]+)"
+    # 5: dictionary and array delimiters
+    rb"|(<<|>>|\[|\])"
+    rb")?"
+)
+_HEX_DIGITS_RE = re.compile(rb"[0-9A-Fa-f]*")
+_HEX_STRING_RE = re.compile(rb"[0-9A-Fa-f\s]*")
+_WHITESPACE_RE = re.compile(rb"\s+")
+_END_STREAM_RE = re.compile(rb"endstream")
+# Bytes that end a run of literal string characters.
+_STRING_SPECIAL_RE = re.compile(rb"[)\\\r\n]")
+
+_KEYWORDS: dict[bytes, Token] = {
+    b"true": Token(TokenType.Boolean, True),
+    b"false": Token(TokenType.Boolean, False),
+    b"null": Token(TokenType.Null, None),
+    b"obj": Token(TokenType.IndirectObjectStart),
+    b"endobj": Token(TokenType.IndirectObjectEnd),
+    b"R": Token(TokenType.IndirectReference),
+    b"xref": Token(TokenType.Eof),
+}
+
+_STRING_ESCAPES: dict[int, bytes] = {
+    ord("n"): b"\n",
+    ord("r"): b"\r",
+    ord("b"): b"\b",
+    ord("f"): b"\f",
+    ord("("): b"(",
+    ord(")"): b")",
+    ord("\\"): b"\\",
+}
+
+_OCTAL_DIGITS = frozenset(b"01234567")
+_HEX_CHARS = frozenset(b"0123456789abcdefABCDEF")
+_DELIMITERS: dict[bytes, TokenType] = {
+    b"<<": TokenType.ObjectStart,
+    b">>": TokenType.ObjectEnd,
+    b"[": TokenType.ArrayStart,
+    b"]": TokenType.ArrayEnd,
+}
+
+# Tokens that are complete COS values on their own.
+_SCALAR_TOKENS = frozenset(
+    {
+        TokenType.String,
+        TokenType.HexString,
+        TokenType.Null,
+        TokenType.Boolean,
+        TokenType.Identifier,
+        TokenType.Stream,
+    }
+)
+
+
 class CosParser:
-    def __init__(self, file: BinaryIO, max_pos: int | None = None) -> None:
-        self.file = file
-        self.max_pos = max_pos
+    """Parse a COS document from an in-memory buffer.
+
+    The lexer walks the buffer with an index and matches whole tokens
+    with compiled regular expressions, so no bytes are copied until a
+    token value is built.
+
+    Args:
+        data: The COS bytes, as `bytes`, a `memoryview` or a binary file
+            object (read from its current position).
+        max_pos: Only parse this many bytes.
+    """
+
+    def __init__(
+        self, data: bytes | memoryview | BinaryIO, max_pos: int | None = None
+    ) -> None:
+        if hasattr(data, "read"):
+            data = data.read() if max_pos is None else data.read(max_pos)
+        self.data = typing.cast("bytes", data)
+        self.pos = 0
+        self.end = len(data) if max_pos is None else min(len(data), max_pos)
         self.lookahead: Token = Token(TokenType.Eof)  # Will be set by lex()
 
     def parse(self) -> dict[str, Any] | list[Any] | Any:
@@ -76,14 +158,7 @@ class CosParser:
         return [val] + self.parse_array_content()
 
     def parse_value(self) -> Any:
-        if (
-            self.lookahead.type == TokenType.String
-            or self.lookahead.type == TokenType.HexString
-            or self.lookahead.type == TokenType.Null
-            or self.lookahead.type == TokenType.Boolean
-            or self.lookahead.type == TokenType.Identifier
-            or self.lookahead.type == TokenType.Stream
-        ):
+        if self.lookahead.type in _SCALAR_TOKENS:
             val = self.lookahead.value
             self.lex()
             return val
@@ -127,12 +202,11 @@ class CosParser:
 
         raise SyntaxError(f"Expected COS value, got {self.lookahead}")
 
-    def save_state(self) -> tuple[int | None, int, Token]:
-        return (self.max_pos, self.file.tell(), self.lookahead)
+    def save_state(self) -> tuple[int, Token]:
+        return (self.pos, self.lookahead)
 
-    def restore_state(self, state: tuple[int | None, int, Token]) -> None:
-        self.max_pos, pos, self.lookahead = state
-        self.file.seek(pos)
+    def restore_state(self, state: tuple[int, Token]) -> None:
+        self.pos, self.lookahead = state
 
     def parse_dict_content(self) -> dict[str, Any]:
         value = {}
@@ -170,66 +244,52 @@ class CosParser:
         self.lookahead = self.lex_token()
 
     def lex_token(self) -> Token:
-        char: bytes | None = None
-        while True:
-            char = self.get_char()
-            if char is None:
-                return Token(TokenType.Eof)
-            elif char == b"%":
-                self.lex_comment()
-            elif not char.isspace():
-                break
+        data = self.data
+        end = self.end
+        match = _TOKEN_RE.match(data, self.pos, end)
+        assert match is not None
+        pos = self.pos = match.end()
+        group = match.lastindex
 
-        # At this point char is guaranteed to be bytes (not None)
-        assert char is not None
-
-        # <<
-        if char == b"<":
-            next_char = self.get_char()
-            if next_char == b"<":
-                return Token(TokenType.ObjectStart)
-            elif next_char is None:
-                self.raise_lex(b"<")
-            elif self.is_hex(next_char):
-                return self.lex_hex_string(next_char)
-            else:
-                self.raise_lex(b"<" + next_char)
+        # /foo
+        if group == 1:
+            return self.lex_identifier(bytes(match.group(1)))
 
-        # >>
-        if char == b">":
-            self.expect_char(b">", char)
-            return Token(TokenType.ObjectEnd)
+        # Number
+        if group == 2:
+            text = bytes(match.group(2))
+            if match.group(3) is None:
+                return Token(TokenType.Number, int(text))
+            return Token(TokenType.Number, float(text))
 
-        # [
-        if char == b"[":
-            return Token(TokenType.ArrayStart)
+        # Keyword
+        if group == 4:
+            return self.lex_keyword(bytes(match.group(4)))
 
-        # ]
-        if char == b"]":
-            return Token(TokenType.ArrayEnd)
+        # << >> [ ]
+        if group == 5:
+            return Token(_DELIMITERS[bytes(match.group(5))])
 
-        # /foo
-        if char == b"/":
-            return self.lex_identifier()
+        if pos >= end:
+            return Token(TokenType.Eof)
+        self.pos = pos + 1
+        char = data[pos]
 
         # (foo)
-        if char == b"(":
+        if char == 0x28:
             return self.lex_string()
 
-        # Keyword
-        if char.isalpha():
-            return self.lex_keyword(char)
+        # <hex>
+        if char == 0x3C:
+            if pos + 1 < end and data[pos + 1] in _HEX_CHARS:
+                return self.lex_hex_string()
+            self.raise_lex(bytes(data[pos : pos + 2]))
 
-        # Number
-        if char.isdigit() or char in b".+-":
-            return self.lex_number(char)
-
-        self.raise_lex(char)
+        # > not followed by >
+        if char == 0x3E:
+            self.raise_lex(bytes(data[pos : pos + 2]), b">>")
 
-    def expect_char(self, exp: bytes, head: bytes) -> None:
-        char = self.get_char()
-        if char is None or char != exp:
-            self.raise_lex(head + (char or b""), head + exp)
+        self.raise_lex(bytes(data[pos : pos + 1]))
 
     def raise_lex(self, token: bytes, exp: bytes | None = None) -> typing.NoReturn:
         msg = f"Unknown COS token {token!r}"
@@ -237,124 +297,77 @@ class CosParser:
             msg += f", expected {exp!r}"
         raise SyntaxError(msg)
 
-    def get_char(self) -> bytes | None:
-        if self.max_pos is None:
-            return self.file.read(1)
-
-        if self.max_pos <= 0:
-            return None
-
-        char = self.file.read(1)
-        self.max_pos -= 1
-        return char
-
-    def unget(self) -> None:
-        self.file.seek(-1, io.SEEK_CUR)
-        if self.max_pos is not None:
-            self.max_pos += 1
-
-    # Skip until newline
-    def lex_comment(self) -> None:
-        while True:
-            char = self.get_char()
-            if char == b"\n":
-                break
-            elif char is None:
-                break
-
-    def lex_number(self, char: bytes) -> Token:
-        if char == b".":
-            return self.lex_num_fract(self.get_char(), char)
-        elif char == b"+" or char == b"-":
-            return self.lex_num_int(self.get_char(), char)
-        else:
-            return self.lex_num_int(char, b"")
-
-    def lex_num_int(self, char: bytes | None, head: bytes) -> Token:
-        while True:
-            if char is None:
-                break
-            elif char == b".":
-                return self.lex_num_fract(self.get_char(), head + char)
-            elif char.isdigit():
-                head += char
-                char = self.get_char()
-            else:
-                self.unget()
-                break
-        return Token(TokenType.Number, int(head))
-
-    def lex_num_fract(self, char: bytes | None, head: bytes) -> Token:
-        while True:
-            if char is None:
-                break
-            elif char.isdigit():
-                head += char
-                char = self.get_char()
-            else:
-                self.unget()
-                break
-        return Token(TokenType.Number, float(head))
-
-    def lex_keyword(self, char: bytes) -> Token:
-        kw = char
-        while True:
-            next_char = self.get_char()
-            if next_char is None:
-                break
-            elif next_char.isalpha():
-                kw += next_char
-            else:
-                self.unget()
-                break
-
-        if kw == b"true":
-            return Token(TokenType.Boolean, True)
-        elif kw == b"false":
-            return Token(TokenType.Boolean, False)
-        elif kw == b"null":
-            return Token(TokenType.Null, None)
-        elif kw == b"obj":
-            return Token(TokenType.IndirectObjectStart)
-        elif kw == b"endobj":
-            return Token(TokenType.IndirectObjectEnd)
-        elif kw == b"R":
-            return Token(TokenType.IndirectReference)
-        elif kw == b"stream":
+    def lex_keyword(self, kw: bytes) -> Token:
+        token = _KEYWORDS.get(kw)
+        if token is not None:
+            return Token(token.type, token.value)
+        if kw == b"stream":
             return self.lex_stream()
-        elif kw == b"xref":
-            return Token(TokenType.Eof)
-        else:
-            raise SyntaxError(f"Unknown keyword {kw!r}")
+        raise SyntaxError(f"Unknown keyword {kw!r}")
 
     def lex_stream(self) -> Token:
-        char = self.get_char()
-        if char == b"\r":
-            if self.get_char() != b"\n":
+        data = self.data
+        pos = self.pos
+        end = self.end
+        char = data[pos] if pos < end else None
+        if char == 0x0D:
+            if pos + 1 >= end or data[pos + 1] != 0x0A:
                 raise SyntaxError("Invalid newline")
-        elif char != b"\n":
+            pos += 2
+        elif char == 0x0A:
+            pos += 1
+        else:
             raise SyntaxError("Expected newline after `stream`")
 
-        stream = b""
-        marker = b"endstream"
-        while True:
-            char = self.get_char()
-            if char is None:
-                raise SyntaxError("Unterminated stream")
-            stream += char
-            if stream.endswith(marker):
-                break
-
-        return Token(TokenType.Stream, stream[: -len(marker)])
+        match = _END_STREAM_RE.search(data, pos, end)
+        if match is None:
+            raise SyntaxError("Unterminated stream")
+        stop = match.start()
+        self.pos = match.end()
+        return Token(TokenType.Stream, bytes(data[pos:stop]))
 
     def lex_string(self) -> Token:
-        # Read the entire string content first
-        string = b""
+        data = self.data
+        end = self.end
+        pos = self.pos
+        parts: list[bytes] = []
         while True:
-            char = self.lex_string_char()
-            if char is None:
+            match = _STRING_SPECIAL_RE.search(data, pos, end)
+            if match is None:
+                raise SyntaxError("Unterminated string")
+            stop = match.start()
+            if stop > pos:
+                parts.append(bytes(data[pos:stop]))
+            char = data[stop]
+            pos = stop + 1
+            if char == 0x29:  # )
                 break
-            string += char
+            if char == 0x5C:  # backslash
+                if pos >= end:
+                    raise SyntaxError("Unterminated string")
+                escape = data[pos]
+                pos += 1
+                replacement = _STRING_ESCAPES.get(escape)
+                if replacement is not None:
+                    parts.append(replacement)
+                elif escape in _OCTAL_DIGITS:
+                    octal = escape - 0x30
+                    for _ in range(2):
+                        if pos >= end or data[pos] not in _OCTAL_DIGITS:
+                            break
+                        octal = octal * 8 + data[pos] - 0x30
+                        pos += 1
+                    parts.append(octal.to_bytes(1, "big"))
+                else:
+                    raise SyntaxError("Invalid escape sequence")
+            else:
+                # \r\n, \n\r and lone \r or \n are all one newline.
+                other = 0x0A if char == 0x0D else 0x0D
+                if pos < end and data[pos] == other:
+                    pos += 1
+                parts.append(b"\n")
+        self.pos = pos
+        string = b"".join(parts)
 
         # Default to UTF-8 encoding
         encoding = "utf-8"
@@ -377,107 +390,37 @@ class CosParser:
         except UnicodeDecodeError:
             return Token(TokenType.String, string)
 
-    def lex_string_char(self) -> bytes | None:
-        char = self.get_char()
-        if char is None:
-            raise SyntaxError("Unterminated string")
-        elif char == b")":
-            return None
-        elif char == b"\\":
-            return self.lex_string_escape()
-        elif char == b"\r":
-            if self.get_char() != b"\n":
-                self.unget()
-            return b"\n"
-        elif char == b"\n":
-            if self.get_char() != b"\r":
-                self.unget()
-            return b"\n"
-        else:
-            return char
-
-    def lex_string_escape(self) -> bytes:
-        char = self.get_char()
-        if char is None:
-            raise SyntaxError("Unterminated string")
-
-        if char == b"n":
-            return b"\n"
-        elif char == b"r":
-            return b"\r"
-        elif char == b"b":
-            return b"\b"
-        elif char == b"f":
-            return b"\f"
-        elif char == b"(":
-            return b"("
-        elif char == b")":
-            return b")"
-        elif char == b"\\":
-            return b"\\"
-        elif self.is_octal(char):
-            octal = char[0] - ord(b"0")
-            for _ in range(2):
-                next_char = self.get_char()
-                if next_char is None:
-                    break
-                elif not self.is_octal(next_char):
-                    self.unget()
-                    break
-                octal = octal * 8 + next_char[0] - ord(b"0")
-            return octal.to_bytes(1, "big")
-
-        raise SyntaxError("Invalid escape sequence")
-
-    def is_octal(self, char: bytes) -> bool:
-        return b"0" <= char <= b"7"
-
-    def is_hex(self, char: bytes) -> bool:
-        return char.isdigit() or b"a" <= char <= b"f" or b"A" <= char <= b"F"
-
-    def lex_hex_string(self, hstr: bytes) -> Token:
-        while True:
-            char = self.get_char()
-            if char is None:
-                raise SyntaxError("Unterminated hex string")
-            elif self.is_hex(char):
-                hstr += char
-            elif char == b">":
-                break
-            elif not char.isspace():
-                raise SyntaxError(f"Invalid character in hex string: {char!r}")
-
+    def lex_hex_string(self) -> Token:
+        match = _HEX_STRING_RE.match(self.data, self.pos, self.end)
+        assert match is not None
+        stop = match.end()
+        if stop >= self.end:
+            raise SyntaxError("Unterminated hex string")
+        if self.data[stop] != 0x3E:
+            char = bytes(self.data[stop : stop + 1])
+            raise SyntaxError(f"Invalid character in hex string: {char!r}")
+        self.pos = stop + 1
+
+        hstr = _WHITESPACE_RE.sub(b"", match.group())
         if len(hstr) % 2:
             hstr += b"0"
+        return Token(TokenType.HexString, bytes.fromhex(hstr.decode("ascii")))
 
-        data = b""
-        for i in range(0, len(hstr), 2):
-            data += int(hstr[i : i + 2], 16).to_bytes(1, "big")
-
-        return Token(TokenType.HexString, data)
+    def lex_identifier(self, raw: bytes) -> Token:
+        if b"#" not in raw:
+            return Token(TokenType.Identifier, raw.decode("ascii"))
 
-    def lex_identifier(self) -> Token:
-        ident = ""
-        special = b"()[]<>{}/%"
+        parts: list[str] = []
+        pos = 0
         while True:
-            char = self.get_char()
-            if char is None:
-                break
-            elif char < b"!" or char > b"~":
-                self.unget()
+            escape = raw.find(b"#", pos)
+            if escape < 0:
+                parts.append(raw[pos:].decode("ascii"))
                 break
-            elif char == b"#":
-                hexstr = b""
-                for _ in range(2):
-                    char = self.get_char()
-                    if char is None or not self.is_hex(char):
-                        raise SyntaxError("Invalid identifier")
-                    hexstr += char
-                ident += chr(int(hexstr, 16))
-            elif char in special:
-                self.unget()
-                break
-            else:
-                ident += chr(char[0])
-
-        return Token(TokenType.Identifier, ident)
+            parts.append(raw[pos:escape].decode("ascii"))
+            code = raw[escape + 1 : escape + 3]
+            if len(code) != 2 or _HEX_DIGITS_RE.fullmatch(code) is None:
+                raise SyntaxError("Invalid identifier")
+            parts.append(chr(int(code, 16)))
+            pos = escape + 3
+        return Token(TokenType.Identifier, "".join(parts))
@@ -0,0 +1,323 @@
+"""Event-based COS reading.
+
+[iter_cos_events][] walks a COS document and yields one event per token
+instead of building the whole value tree, in the manner of a SAX parser.
+Nesting is tracked with an explicit stack, so documents of any depth are
+read without recursion.
+
+[extract_cos_path][] builds on it to materialize a single sub-value,
+such as the text documents (`("1", "1")`) or the font array
+(`("0", "1", "0")`) of a `btdk` chunk, without building the rest of the
+document.
+"""
+
+from __future__ import annotations
+
+import typing
+from enum import Enum, auto
+from typing import Any, Tuple, Union
+
+from .cos import CosParser, IndirectObject, IndirectReference, Stream, TokenType
+
+if typing.TYPE_CHECKING:
+    from typing import BinaryIO
+
+
+class CosEvent(Enum):
+    """The kind of an event yielded by [iter_cos_events][]."""
+
+    DictStart = auto()
+    """A dictionary starts. A top-level dictionary, written without
+    `<<`, also starts with this event."""
+
+    DictEnd = auto()
+    """The current dictionary ends."""
+
+    StreamEnd = auto()
+    """The current dictionary ends and is followed by a stream. The event
+    value is the stream data."""
+
+    ArrayStart = auto()
+    """An array starts."""
+
+    ArrayEnd = auto()
+    """The current array ends."""
+
+    Key = auto()
+    """A dictionary key. The event value is the key."""
+
+    Value = auto()
+    """A scalar value: number, string, bytes, boolean, `None` or
+    [IndirectReference][py_aep.cos.IndirectReference]."""
+
+    ObjectStart = auto()
+    """An indirect object starts. The event value is its
+    `(object_number, generation_number)`; the object data follows."""
+
+    ObjectEnd = auto()
+    """The current indirect object ends."""
+
+
+CosPath = Tuple[Union[str, int], ...]
+
+# Open containers tracked by iter_cos_events.
+_DICT = 0
+_ARRAY = 1
+_OBJECT = 2
+
+_OPENING = frozenset({CosEvent.DictStart, CosEvent.ArrayStart, CosEvent.ObjectStart})
+_CLOSING = frozenset(
+    {CosEvent.DictEnd, CosEvent.StreamEnd, CosEvent.ArrayEnd, CosEvent.ObjectEnd}
+)
+
+# Tokens yielded as Value events.
+_SCALAR_VALUE_TOKENS = frozenset(
+    {
+        TokenType.String,
+        TokenType.HexString,
+        TokenType.Null,
+        TokenType.Boolean,
+        TokenType.Identifier,
+        TokenType.Stream,
+    }
+)
+
+
+def iter_cos_events(
+    data: bytes | memoryview | BinaryIO,
+    max_pos: int | None = None,
+) -> typing.Iterator[tuple[CosEvent, Any]]:
+    """Yield `(event, value)` pairs for the tokens of a COS document.
+
+    A document starting with a key is a dictionary and is wrapped in
+    `DictStart` and `DictEnd` events. Other documents yield their values
+    one after the other. Events are produced while reading, so a caller
+    can stop early without lexing the rest of the buffer.
+
+    Args:
+        data: The COS bytes, as accepted by
+            [CosParser][py_aep.cos.CosParser].
+        max_pos: Only read this many bytes.
+
+    Raises:
+        SyntaxError: If the document is malformed.
+    """
+    parser = CosParser(data, max_pos)
+    parser.lex()
+    # Kinds of the open containers. A top-level dictionary has no
+    # delimiters and ends at the end of the data.
+    stack: list[int] = []
+    implicit_dict = parser.lookahead.type == TokenType.Identifier
+    if implicit_dict:
+        stack.append(_DICT)
+        yield CosEvent.DictStart, None
+    after_key = False
+
+    while True:
+        token = parser.lookahead
+        kind = stack[-1] if stack else None
+
+        if kind == _DICT and not after_key:
+            if token.type == TokenType.ObjectEnd or token.type == TokenType.Eof:
+                if len(stack) == 1 and implicit_dict:
+                    yield CosEvent.DictEnd, None
+                    return
+                parser.expect(TokenType.ObjectEnd)
+                stack.pop()
+                parser.lex()
+                if parser.lookahead.type == TokenType.Stream:
+                    yield CosEvent.StreamEnd, parser.lookahead.value
+                    parser.lex()
+                else:
+                    yield CosEvent.DictEnd, None
+            else:
+                parser.expect(TokenType.Identifier)
+                yield CosEvent.Key, token.value
+                parser.lex()
+                after_key = True
+                continue
+
+        elif kind == _ARRAY and token.type in (TokenType.ArrayEnd, TokenType.Eof):
+            parser.expect(TokenType.ArrayEnd)
+            stack.pop()
+            parser.lex()
+            yield CosEvent.ArrayEnd, None
+
+        elif kind is None and token.type in (TokenType.Eof, TokenType.ArrayEnd):
+            return
+
+        elif token.type == TokenType.Number:
+            value = token.value
+            parser.lex()
+            if parser.lookahead.type == TokenType.Number:
+                generation = parser.lookahead.value
+                state = parser.save_state()
+                parser.lex()
+                if parser.lookahead.type == TokenType.IndirectObjectStart:
+                    parser.lex()
+                    stack.append(_OBJECT)
+                    after_key = False
+                    yield CosEvent.ObjectStart, (value, generation)
+                    continue
+                if parser.lookahead.type == TokenType.IndirectReference:
+                    parser.lex()
+                    value = IndirectReference(value, generation)
+                else:
+                    parser.restore_state(state)
+            yield CosEvent.Value, value
+
+        elif token.type == TokenType.ObjectStart:
+            parser.lex()
+            stack.append(_DICT)
+            after_key = False
+            yield CosEvent.DictStart, None
+            continue
+
+        elif token.type == TokenType.ArrayStart:
+            parser.lex()
+            stack.append(_ARRAY)
+            after_key = False
+            yield CosEvent.ArrayStart, None
+            continue
+
+        elif token.type in _SCALAR_VALUE_TOKENS:
+            parser.lex()
+            yield CosEvent.Value, token.value
+
+        else:
+            raise SyntaxError(f"Expected COS value, got {token}")
+
+        # A value was completed. An indirect object holds a single value.
+        after_key = False
+        while stack and stack[-1] == _OBJECT:
+            parser.expect(TokenType.IndirectObjectEnd)
+            parser.lex()
+            stack.pop()
+            yield CosEvent.ObjectEnd, None
+
+
+def _build_value(
+    event: CosEvent,
+    value: Any,
+    events: typing.Iterator[tuple[CosEvent, Any]],
+) -> Any:
+    """Build the value starting with *event* from the following events."""
+    # Open containers, each with the key its next value is stored at.
+    stack: list[list[Any]] = []
+    while True:
+        if event == CosEvent.Key:
+            stack[-1][1] = value
+            event, value = next(events)
+            continue
+        if event == CosEvent.DictStart:
+            stack.append([{}, None])
+            event, value = next(events)
+            continue
+        if event == CosEvent.ArrayStart:
+            stack.append([[], None])
+            event, value = next(events)
+            continue
+        if event == CosEvent.ObjectStart:
+            stack.append([IndirectObject(value[0], value[1], None), None])
+            event, value = next(events)
+            continue
+
+        if event == CosEvent.Value:
+            result = value
+        elif event == CosEvent.StreamEnd:
+            result = Stream(stack.pop()[0], value)
+        else:
+            result = stack.pop()[0]
+
+        if not stack:
+            return result
+        parent, key = stack[-1]
+        if isinstance(parent, dict):
+            parent[key] = result
+        elif isinstance(parent, list):
+            parent.append(result)
+        else:
+            parent.data = result
+        event, value = next(events)
+
+
+def extract_cos_path(
+    data: bytes | memoryview | BinaryIO,
+    path: typing.Iterable[str | int],
+    max_pos: int | None = None,
+) -> Any:
+    """Return the value at *path* of a COS document.
+
+    Only the value at *path* is built. Other values are skipped while
+    reading, and reading stops once the value is built or is known to
+    be missing.
+
+    Example:
+        ```python
+        fonts = extract_cos_path(btdk_body.binary_data, ("0", "1", "0"))
+        ```
+
+    Args:
+        data: The COS bytes, as accepted by
+            [CosParser][py_aep.cos.CosParser].
+        path: Dictionary keys and array indices leading to the value. An
+            empty path returns the whole document, or its first value
+            when the document is not a dictionary. Indirect objects are
+            transparent: a path reaching one continues into its data.
+        max_pos: Only read this many bytes.
+
+    Returns:
+        The value, or `None` when *path* does not exist.
+
+    Raises:
+        SyntaxError: If the document is malformed up to the value.
+    """
+    target: CosPath = tuple(path)
+    events = iter_cos_events(data, max_pos)
+    # Path of the next value, and the kinds of the containers entered.
+    keys: list[Any] = []
+    kinds: list[int] = []
+    for event, value in events:
+        if event == CosEvent.Key:
+            keys[-1] = value
+            continue
+        if event in _CLOSING:
+            # Only containers leading to the target are entered, and the
+            # target cannot follow once one of them ends.
+            return None
+
+        here = tuple(keys)
+        if here == target:
+            return _build_value(event, value, events)
+
+        if event == CosEvent.Value:
+            _next_index(keys, kinds)
+            continue
+
+        if target[: len(here)] != here:
+            # Skip a container off the target path.
+            depth = 1
+            while depth:
+                skipped, _ = next(events)
+                if skipped in _OPENING:
+                    depth += 1
+                elif skipped in _CLOSING:
+                    depth -= 1
+            _next_index(keys, kinds)
+            continue
+
+        if event == CosEvent.DictStart:
+            kinds.append(_DICT)
+            keys.append(None)
+        elif event == CosEvent.ArrayStart:
+            kinds.append(_ARRAY)
+            keys.append(0)
+        else:
+            kinds.append(_OBJECT)
+    return None
+
+
+def _next_index(keys: list[Any], kinds: list[int]) -> None:
+    """Advance the array index after a value of the current container."""
+    if kinds and kinds[-1] == _ARRAY:
+        keys[-1] += 1
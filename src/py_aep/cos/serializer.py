@@ -8,8 +8,8 @@ bytes suitable for writing back into a btdk chunk's ``binary_data``.
 
 from __future__ import annotations
 
-import io
-from typing import Any
+import functools
+from typing import Any, Callable
 
 from .cos import IndirectObject, IndirectReference, Stream
 
@@ -25,82 +25,67 @@ def serialize(data: Any) -> bytes:
     Returns:
         The COS binary representation.
     """
-    buf = io.BytesIO()
-    _write_value(buf, data, top_level=True)
-    return buf.getvalue()
+    out = _CosWriter()
+    _write_value(out, data, top_level=True)
+    return out.getvalue()
 
 
-# COS tokens that are self-delimiting (no whitespace needed after them
-# when followed by another self-delimiting token).
-_SELF_DELIM = {b"<<", b">>", b"[", b"]", b"(", b")", b"<", b">"}
+# Bytes after which a space is needed before the next token, so that it
+# cannot be confused with the previous one (e.g. two numbers in a row):
+# alphanumerics, dot, +, - (number chars) and the ``/`` of an empty
+# identifier.
+_SPACE_AFTER = frozenset(
+    b"0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ.+-/"
+)
 
 
-def _needs_space_before(buf: io.BytesIO) -> bool:
-    """Check if a space is needed before the next token.
+class _CosWriter:
+    """Collects COS output in one pass.
 
-    A space is required when the last byte written is alphanumeric or
-    could be confused with the next token (e.g. two numbers in a row).
+    The last byte written is kept in `last`, so deciding whether a
+    separator is needed never reads back from the output.
     """
-    pos = buf.tell()
-    if pos == 0:
-        return False
-    buf.seek(pos - 1)
-    last_byte = buf.read(1)
-    # Space needed after alphanumeric, dot, +, - (number chars) and
-    # after identifiers that end with alphanum
-    return last_byte.isalnum() or last_byte in b".+-/"
 
+    __slots__ = ("_parts", "last")
 
-def _space(buf: io.BytesIO) -> None:
-    """Write a space separator if the previous byte needs one."""
-    if _needs_space_before(buf):
-        buf.write(b" ")
+    def __init__(self) -> None:
+        self._parts: list[bytes] = []
+        self.last = -1
 
+    def write(self, data: bytes) -> None:
+        """Append *data* to the output."""
+        if data:
+            self._parts.append(data)
+            self.last = data[-1]
 
-def _write_value(buf: io.BytesIO, value: Any, *, top_level: bool = False) -> None:
+    def getvalue(self) -> bytes:
+        """Return everything written so far."""
+        return b"".join(self._parts)
+
+
+def _write_value(out: _CosWriter, value: Any, *, top_level: bool = False) -> None:
     """Dispatch *value* to the appropriate serialization handler."""
-    if isinstance(value, dict):
-        if top_level:
-            _write_dict_content(buf, value)
+    if top_level and isinstance(value, (dict, list)):
+        if isinstance(value, dict):
+            _write_dict_content(out, value)
         else:
-            _space(buf)
-            _write_dict(buf, value)
-    elif isinstance(value, list):
-        if top_level:
-            _write_array_content(buf, value)
+            _write_array_content(out, value)
+        return
+    writer = _WRITERS.get(type(value))
+    if writer is None:
+        # Subclasses of the builtin types, checked in dispatch order.
+        # bool must come before int since it is a subclass of int.
+        for value_type, type_writer in _WRITERS.items():
+            if isinstance(value, value_type):
+                writer = type_writer
+                break
         else:
-            _space(buf)
-            _write_array(buf, value)
-    elif isinstance(value, bool):
-        # Must come before int check since bool is a subclass of int
-        _space(buf)
-        buf.write(b"true" if value else b"false")
-    elif isinstance(value, int):
-        _space(buf)
-        buf.write(str(value).encode("ascii"))
-    elif isinstance(value, float):
-        _space(buf)
-        buf.write(_format_float(value))
-    elif isinstance(value, str):
-        _space(buf)
-        _write_string(buf, value)
-    elif isinstance(value, bytes):
-        _space(buf)
-        _write_hex_string(buf, value)
-    elif value is None:
-        _space(buf)
-        buf.write(b"null")
-    elif isinstance(value, IndirectObject):
-        _space(buf)
-        _write_indirect_object(buf, value)
-    elif isinstance(value, IndirectReference):
-        _space(buf)
-        _write_indirect_reference(buf, value)
-    elif isinstance(value, Stream):
-        _space(buf)
-        _write_stream(buf, value)
-    else:
-        raise TypeError(f"Cannot serialize COS value of type {type(value).__name__}")
+            raise TypeError(
+                f"Cannot serialize COS value of type {type(value).__name__}"
+            )
+    if out.last in _SPACE_AFTER:
+        out.write(b" ")
+    writer(out, value)
 
 
 def _format_float(value: float) -> bytes:
@@ -115,40 +100,43 @@ def _format_float(value: float) -> bytes:
     return text.encode("ascii")
 
 
-def _write_dict(buf: io.BytesIO, d: dict[str, Any]) -> None:
+def _write_dict(out: _CosWriter, d: dict[str, Any]) -> None:
     """Write a COS dictionary: ``<< /key value /key value >>``."""
-    buf.write(b"<<")
-    _write_dict_content(buf, d)
-    buf.write(b">>")
+    out.write(b"<<")
+    _write_dict_content(out, d)
+    out.write(b">>")
 
 
-def _write_dict_content(buf: io.BytesIO, d: dict[str, Any]) -> None:
+def _write_dict_content(out: _CosWriter, d: dict[str, Any]) -> None:
     """Write dict key/value pairs without the ``<<``/``>>`` delimiters.
 
     Used for top-level dicts (which the parser emits without delimiters)
     and for nested dicts.
     """
     for key, val in d.items():
-        _write_identifier(buf, key)
-        _write_value(buf, val)
+        out.write(_identifier_bytes(key))
+        _write_value(out, val)
 
 
-def _write_array(buf: io.BytesIO, lst: list[Any]) -> None:
+def _write_array(out: _CosWriter, lst: list[Any]) -> None:
     """Write a COS array: ``[ val val val ]``."""
-    buf.write(b"[")
-    _write_array_content(buf, lst)
-    buf.write(b"]")
+    out.write(b"[")
+    _write_array_content(out, lst)
+    out.write(b"]")
 
 
-def _write_array_content(buf: io.BytesIO, lst: list[Any]) -> None:
+def _write_array_content(out: _CosWriter, lst: list[Any]) -> None:
     """Write array elements without ``[``/``]`` delimiters."""
     for item in lst:
-        _write_value(buf, item)
+        _write_value(out, item)
+
 
+@functools.lru_cache(maxsize=None)
+def _identifier_bytes(name: str) -> bytes:
+    """Encode a COS identifier (name object): ``/foo``.
 
-def _write_identifier(buf: io.BytesIO, name: str) -> None:
-    """Write a COS identifier (name object): ``/foo``."""
-    buf.write(b"/")
+    Documents reuse a small set of keys, so encodings are cached.
+    """
     escaped = ""
     for ch in name:
         code = ord(ch)
@@ -156,10 +144,10 @@ def _write_identifier(buf: io.BytesIO, name: str) -> None:
             escaped += f"#{code:02x}"
         else:
             escaped += ch
-    buf.write(escaped.encode("ascii"))
+    return b"/" + escaped.encode("ascii")
 
 
-def _write_string(buf: io.BytesIO, s: str) -> None:
+def _write_string(out: _CosWriter, s: str) -> None:
     """Write a COS string literal: ``(escaped content)``.
 
     Strings that contain non-ASCII characters are encoded as UTF-16 BE
@@ -171,62 +159,81 @@ def _write_string(buf: io.BytesIO, s: str) -> None:
     except UnicodeEncodeError:
         # Non-ASCII: use UTF-16 BE with BOM
         raw = b"\xfe\xff" + s.encode("utf-16-be")
-    buf.write(b"(")
-    buf.write(_escape_string(raw))
-    buf.write(b")")
+    out.write(b"(" + _escape_string(raw) + b")")
+
+
+# Bytes escaped in string literals; the backslash must come first.
+_STRING_ESCAPES = (
+    (b"\\", b"\\\\"),
+    (b"(", b"\\("),
+    (b")", b"\\)"),
+    (b"\n", b"\\n"),
+    (b"\r", b"\\r"),
+    (b"\x08", b"\\b"),  # backspace
+    (b"\x0c", b"\\f"),  # form feed
+)
 
 
 def _escape_string(raw: bytes) -> bytes:
     """Escape bytes for a COS string literal."""
-    out = bytearray()
-    for byte in raw:
-        if byte == ord(b"("):
-            out.extend(b"\\(")
-        elif byte == ord(b")"):
-            out.extend(b"\\)")
-        elif byte == ord(b"\\"):
-            out.extend(b"\\\\")
-        elif byte == ord(b"\n"):
-            out.extend(b"\\n")
-        elif byte == ord(b"\r"):
-            out.extend(b"\\r")
-        elif byte == ord(b"\x08"):  # backspace
-            out.extend(b"\\b")
-        elif byte == ord(b"\x0c"):  # form feed
-            out.extend(b"\\f")
-        else:
-            out.append(byte)
-    return bytes(out)
+    for char, escape in _STRING_ESCAPES:
+        if char in raw:
+            raw = raw.replace(char, escape)
+    return raw
 
 
-def _write_hex_string(buf: io.BytesIO, data: bytes) -> None:
+def _write_hex_string(out: _CosWriter, data: bytes) -> None:
     """Write a COS hex string: ``<hexdata>``."""
-    buf.write(b"<")
-    buf.write(data.hex().encode("ascii"))
-    buf.write(b">")
+    out.write(b"<" + data.hex().encode("ascii") + b">")
 
 
-def _write_indirect_object(buf: io.BytesIO, obj: IndirectObject) -> None:
+def _write_indirect_object(out: _CosWriter, obj: IndirectObject) -> None:
     """Write ``N G obj <data> endobj``."""
-    buf.write(str(obj.object_number).encode("ascii"))
-    buf.write(b" ")
-    buf.write(str(obj.generation_number).encode("ascii"))
-    buf.write(b" obj")
-    _write_value(buf, obj.data)
-    buf.write(b" endobj")
+    out.write(f"{obj.object_number} {obj.generation_number} obj".encode("ascii"))
+    _write_value(out, obj.data)
+    out.write(b" endobj")
 
 
-def _write_indirect_reference(buf: io.BytesIO, ref: IndirectReference) -> None:
+def _write_indirect_reference(out: _CosWriter, ref: IndirectReference) -> None:
     """Write ``N G R``."""
-    buf.write(str(ref.object_number).encode("ascii"))
-    buf.write(b" ")
-    buf.write(str(ref.generation_number).encode("ascii"))
-    buf.write(b" R")
+    out.write(f"{ref.object_number} {ref.generation_number} R".encode("ascii"))
 
 
-def _write_stream(buf: io.BytesIO, stream: Stream) -> None:
+def _write_stream(out: _CosWriter, stream: Stream) -> None:
     """Write ``<< dict >> stream\\n<bytes>endstream``."""
-    _write_dict(buf, stream.dictionary)
-    buf.write(b"stream\n")
-    buf.write(stream.data)
-    buf.write(b"endstream")
+    _write_dict(out, stream.dictionary)
+    out.write(b"stream\n")
+    out.write(stream.data)
+    out.write(b"endstream")
+
+
+def _write_bool(out: _CosWriter, value: bool) -> None:
+    out.write(b"true" if value else b"false")
+
+
+def _write_int(out: _CosWriter, value: int) -> None:
+    out.write(str(value).encode("ascii"))
+
+
+def _write_float(out: _CosWriter, value: float) -> None:
+    out.write(_format_float(value))
+
+
+def _write_null(out: _CosWriter, value: None) -> None:
+    out.write(b"null")
+
+
+# Writer for each serializable type, in the order subclasses are matched.
+_WRITERS: dict[type, Callable[[_CosWriter, Any], None]] = {
+    dict: _write_dict,
+    list: _write_array,
+    bool: _write_bool,
+    int: _write_int,
+    float: _write_float,
+    str: _write_string,
+    bytes: _write_hex_string,
+    type(None): _write_null,
+    IndirectObject: _write_indirect_object,
+    IndirectReference: _write_indirect_reference,
+    Stream: _write_stream,
+}
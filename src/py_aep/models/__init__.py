@@ -1,6 +1,7 @@
 """Data models for After Effects project structure."""
 
 from .application import Application
+from .bake import BakedLayer
 from .essential_graphics import EssentialGraphicsController
 from .guide import Guide
 from .items.av_item import AVItem
@@ -15,7 +16,8 @@ from .layers.light_layer import LightLayer
 from .layers.shape_layer import ShapeLayer
 from .layers.text_layer import TextLayer
 from .layers.three_d_model_layer import ThreeDModelLayer
-from .project import Project
+from .nested import NestedLayerSample
+from .project import Project, PropertyMatch
 from .properties.keyframe import Keyframe
 from .properties.keyframe_ease import KeyframeEase
 from .properties.marker import MarkerValue
@@ -23,7 +25,7 @@ from .properties.mask_property_group import MaskPropertyGroup
 from .properties.property import Property
 from .properties.property_base import PropertyBase
 from .properties.property_group import PropertyGroup
-from .properties.shape import FeatherPoint, Shape
+from .properties.shape import FeatherPoint, Shape, ShapeArrays
 from .renderqueue.format_options import (
     CineonFormatOptions,
     JpegFormatOptions,
@@ -51,6 +53,7 @@ __all__ = [
     "Application",
     "AVItem",
     "AVLayer",
+    "BakedLayer",
     "CameraLayer",
     "CineonFormatOptions",
     "CompItem",
@@ -70,6 +73,7 @@ __all__ = [
     "LightLayer",
     "MarkerValue",
     "MaskPropertyGroup",
+    "NestedLayerSample",
     "OpenExrFormatOptions",
     "OutputModule",
     "PlaceholderSource",
@@ -78,10 +82,12 @@ __all__ = [
     "Property",
     "PropertyBase",
     "PropertyGroup",
+    "PropertyMatch",
     "RenderQueue",
     "RenderQueueItem",
     "SettingsView",
     "Shape",
+    "ShapeArrays",
     "ShapeLayer",
     "SolidSource",
     "TargaFormatOptions",
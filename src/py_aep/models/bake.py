@@ -0,0 +1,201 @@
+"""Whole-composition baking.
+
+[CompItem.bake][py_aep.models.items.composition.CompItem.bake] evaluates
+every animated property of every layer of a composition over a frame range
+and returns the values as columns, one [BakedLayer][] per layer.
+
+Each layer is sampled only where it is active: frames before its
+[in_point][py_aep.models.layers.layer.Layer.in_point] or from its
+[out_point][py_aep.models.layers.layer.Layer.out_point] on are left out, as
+are layers switched off by their enabled or solo switches (see
+[CompItem.switched_on_layers][py_aep.models.items.composition.CompItem.switched_on_layers]).
+Properties are keyed by their match-name path below the layer (see
+[iter_property_paths][py_aep.models.columns.iter_property_paths]).
+
+Only numeric tracks are baked. Animated shapes, text documents and markers
+are skipped; evaluate them with
+[Property.values_at_times][py_aep.models.properties.property.Property.values_at_times].
+"""
+
+from __future__ import annotations
+
+import math
+import typing
+from bisect import bisect_left
+from typing import Any, NamedTuple
+
+from .columns import iter_property_paths, path_selected
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None  # type: ignore[assignment]
+
+if typing.TYPE_CHECKING:
+    from .items.composition import CompItem
+    from .layers.layer import Layer
+    from .project import Project
+
+
+class BakedLayer(NamedTuple):
+    """The baked values of one layer."""
+
+    layer_id: int
+    """The [Layer.id][py_aep.models.layers.layer.Layer.id] of the layer."""
+
+    times: Any
+    """The composition times (seconds) at which the layer was sampled."""
+
+    values: dict[str, Any]
+    """The values of each animated property at `times`, keyed by
+    match-name path."""
+
+
+def _frame_times(start: float, end: float, fps: float) -> list[float]:
+    """Return the frame times in `[start, end)` at *fps*."""
+    count = max(0, math.ceil((end - start) * fps - 1e-9))
+    return [start + i / fps for i in range(count)]
+
+
+def _bake_layer(
+    layer: Layer,
+    times: list[float],
+    properties: frozenset[str] | None,
+    use_numpy: bool,
+    path_tolerance: float | None,
+) -> BakedLayer | None:
+    """Bake *layer* over the frames of *times* at which it is active.
+
+    Returns:
+        `None` if the layer is not active at any of the frames.
+    """
+    first = bisect_left(times, layer.in_point)
+    last = bisect_left(times, layer.out_point)
+    if first >= last:
+        return None
+    active_times = times[first:last]
+
+    values: dict[str, Any] = {}
+    for path, prop in iter_property_paths(layer):
+        if not prop.keyframes or not path_selected(path, properties):
+            continue
+        if not prop._keyframe_curve(path_tolerance).is_numeric:
+            continue
+        values[path] = prop.values_at_times(
+            active_times, use_numpy=use_numpy, path_tolerance=path_tolerance
+        )
+
+    if use_numpy:
+        return BakedLayer(layer.id, np.asarray(active_times, dtype=float), values)
+    return BakedLayer(layer.id, active_times, values)
+
+
+_worker_project: Project | None = None
+
+
+def _init_worker(path: str) -> None:
+    """Parse the project once in each worker process."""
+    from .. import parse
+
+    global _worker_project
+    _worker_project = parse(path).project
+
+
+def _bake_layer_in_worker(
+    layer_id: int,
+    times: list[float],
+    properties: frozenset[str] | None,
+    use_numpy: bool,
+    path_tolerance: float | None,
+) -> BakedLayer | None:
+    """Bake a layer of the project parsed by [_init_worker][]."""
+    assert _worker_project is not None
+    layer = _worker_project.layer_by_id(layer_id)
+    return _bake_layer(layer, times, properties, use_numpy, path_tolerance)
+
+
+def bake_comp(
+    comp: CompItem,
+    fps: float | None = None,
+    start: float | None = None,
+    end: float | None = None,
+    properties: typing.Iterable[str] | None = None,
+    processes: int | None = None,
+    use_numpy: bool | None = None,
+    path_tolerance: float | None = None,
+) -> dict[int, BakedLayer]:
+    """Evaluate every animated numeric property of *comp* over a range.
+
+    Args:
+        comp: The composition to bake.
+        fps: Sampling rate. Defaults to the composition frame rate.
+        start: First time to sample, in seconds. Defaults to `0`.
+        end: End of the range (exclusive), in seconds. Defaults to the
+            composition duration.
+        properties: Only bake these match-name paths, or the properties
+            below these group paths. `None` bakes everything.
+        processes: Bake the layers in this many worker processes. Each
+            worker parses the project file from disk, so unsaved changes
+            are not seen. `None` or `1` bakes in the current process.
+        use_numpy: Return NumPy arrays instead of lists. Defaults to
+            `True` when NumPy is installed.
+        path_tolerance: Precision of spatial bezier paths, see
+            [Property.values_at_times][py_aep.models.properties.property.Property.values_at_times].
+
+    Returns:
+        The baked layers, keyed by layer id. Layers that are never active
+        in the range are left out.
+
+    Raises:
+        ImportError: If `use_numpy` is `True` but NumPy is not installed.
+        ValueError: If *fps* or *path_tolerance* is not positive, or if
+            *end* is before *start*.
+    """
+    if use_numpy is None:
+        use_numpy = np is not None
+    elif use_numpy and np is None:
+        raise ImportError("use_numpy=True requires NumPy to be installed")
+
+    if fps is None:
+        fps = comp.frame_rate
+    if start is None:
+        start = 0.0
+    if end is None:
+        end = comp.duration
+    if fps <= 0:
+        raise ValueError(f"fps must be positive, got {fps}")
+    if end < start:
+        raise ValueError(f"end ({end}) must not be before start ({start})")
+
+    times = _frame_times(start, end, fps)
+    wanted = frozenset(properties) if properties is not None else None
+
+    layers = comp.switched_on_layers
+
+    if processes is None or processes <= 1:
+        baked = [
+            _bake_layer(layer, times, wanted, use_numpy, path_tolerance)
+            for layer in layers
+        ]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=_init_worker,
+            initargs=(comp._project.file,),
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _bake_layer_in_worker,
+                    layer.id,
+                    times,
+                    wanted,
+                    use_numpy,
+                    path_tolerance,
+                )
+                for layer in layers
+            ]
+            baked = [future.result() for future in futures]
+
+    return {result.layer_id: result for result in baked if result is not None}
@@ -0,0 +1,242 @@
+"""Columnar export of property values and keyframes.
+
+[Project.to_columns][py_aep.models.project.Project.to_columns] walks the
+project once and fills flat, typed columns instead of building one dict
+per property. Numeric columns are `array.array` buffers, converted to
+NumPy arrays (without copying) when NumPy is installed.
+
+Three tables are produced, each a dict of equally long columns:
+
+- `properties`: one row per [Property][] of every layer.
+- `keyframes`: one row per keyframe, pointing back to its property row.
+- `eases`: one row per keyframe and value dimension, holding temporal
+  ease speed and influence.
+
+Value components are spread over `value_0` to `value_3` and padded with
+`nan`, so multi-dimensional values stay rectangular. Properties holding
+text documents, shapes or markers get `nan` values without being decoded.
+"""
+
+from __future__ import annotations
+
+import math
+import typing
+from array import array
+from typing import Any
+
+from ..enums import PropertyValueType
+from .properties.property import Property
+from .properties.property_group import PropertyGroup
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None  # type: ignore[assignment]
+
+if typing.TYPE_CHECKING:
+    from .layers.layer import Layer
+    from .project import Project
+
+#: Maximum number of value components exported per row (RGBA colors).
+MAX_COMPONENTS = 4
+
+_NAN = math.nan
+
+#: Value types that never hold numbers. Their values (text documents,
+#: shapes, markers, ...) are costly to decode, so they are not read.
+_NON_NUMERIC_TYPES = frozenset(
+    {
+        PropertyValueType.NO_VALUE,
+        PropertyValueType.CUSTOM_VALUE,
+        PropertyValueType.MARKER,
+        PropertyValueType.SHAPE,
+        PropertyValueType.TEXT_DOCUMENT,
+        PropertyValueType.LRDR,
+        PropertyValueType.LITM,
+        PropertyValueType.GIDE,
+    }
+)
+
+
+def iter_property_paths(
+    layer: Layer,
+) -> typing.Iterator[tuple[str, Property]]:
+    """Yield `(match_name_path, property)` for every property of *layer*.
+
+    Paths join match names with `/`, starting below the layer (e.g.
+    `ADBE Transform Group/ADBE Position`). Siblings sharing a match name,
+    such as two instances of the same effect, get a `[n]` suffix from the
+    second one on, so every path is unique within its layer.
+
+    Args:
+        layer: The layer to walk.
+    """
+    stack: list[tuple[str, PropertyGroup]] = [("", layer)]
+    while stack:
+        prefix, group = stack.pop()
+        counts: dict[str, int] = {}
+        children: list[tuple[str, PropertyGroup]] = []
+        for child in group.properties:
+            seen = counts.get(child.match_name, 0)
+            counts[child.match_name] = seen + 1
+            segment = child.match_name if not seen else f"{child.match_name}[{seen}]"
+            path = prefix + segment
+            if isinstance(child, PropertyGroup):
+                children.append((path + "/", child))
+            elif isinstance(child, Property):
+                yield path, child
+        # Reversed so groups are visited in document order.
+        stack.extend(reversed(children))
+
+
+def path_selected(path: str, properties: typing.AbstractSet[str] | None) -> bool:
+    """Return whether the property at *path* is selected by *properties*.
+
+    Args:
+        path: A match-name path from [iter_property_paths][].
+        properties: Selected property paths, or group paths selecting
+            every property below them. `None` selects every path.
+    """
+    if properties is None:
+        return True
+    if path in properties:
+        return True
+    return any(path.startswith(prefix + "/") for prefix in properties)
+
+
+def _components(value: Any) -> list[float] | None:
+    """Return the numeric components of *value*, or `None`."""
+    if isinstance(value, (int, float)):
+        return [float(value)]
+    if isinstance(value, (list, tuple)) and all(
+        isinstance(v, (int, float)) for v in value
+    ):
+        return [float(v) for v in value]
+    return None
+
+
+def _append_components(
+    columns: list[array[float]],
+    value: Any,
+) -> int:
+    """Append *value* across the `value_n` columns, padding with `nan`.
+
+    Returns:
+        The number of real components written.
+    """
+    components = _components(value) or []
+    components = components[:MAX_COMPONENTS]
+    for i, column in enumerate(columns):
+        column.append(components[i] if i < len(components) else _NAN)
+    return len(components)
+
+
+def _finalize(table: dict[str, Any], use_numpy: bool) -> dict[str, Any]:
+    """Convert the `array` columns of *table* to NumPy when requested."""
+    if not use_numpy:
+        return table
+    assert np is not None
+    return {
+        key: (
+            np.frombuffer(column, dtype=column.typecode)
+            if isinstance(column, array)
+            else np.array(column, dtype=object)
+        )
+        for key, column in table.items()
+    }
+
+
+def project_to_columns(
+    project: Project,
+    include_keyframes: bool = True,
+    use_numpy: bool | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Export every property value (and keyframe) of *project* as columns.
+
+    Args:
+        project: The project to export.
+        include_keyframes: When `False`, the `keyframes` and `eases`
+            tables are returned empty.
+        use_numpy: Return NumPy arrays instead of `array.array`. Defaults
+            to `True` when NumPy is installed.
+
+    Raises:
+        ImportError: If `use_numpy` is `True` but NumPy is not installed.
+    """
+    if use_numpy is None:
+        use_numpy = np is not None
+    elif use_numpy and np is None:
+        raise ImportError("use_numpy=True requires NumPy to be installed")
+
+    prop_values = [array("d") for _ in range(MAX_COMPONENTS)]
+    properties: dict[str, Any] = {
+        "comp_id": array("q"),
+        "layer_id": array("q"),
+        "path": [],
+        "value_type": array("i"),
+        "dimensions": array("b"),
+        **{f"value_{i}": column for i, column in enumerate(prop_values)},
+        "first_key": array("q"),
+        "num_keys": array("q"),
+    }
+    key_values = [array("d") for _ in range(MAX_COMPONENTS)]
+    keyframes: dict[str, Any] = {
+        "property_index": array("q"),
+        "time": array("d"),
+        "in_interpolation": array("i"),
+        "out_interpolation": array("i"),
+        **{f"value_{i}": column for i, column in enumerate(key_values)},
+    }
+    eases: dict[str, Any] = {
+        "key_index": array("q"),
+        "dimension": array("b"),
+        "in_speed": array("d"),
+        "in_influence": array("d"),
+        "out_speed": array("d"),
+        "out_influence": array("d"),
+    }
+
+    row = 0
+    key_row = 0
+    for comp in project.compositions:
+        comp_id = comp.id
+        for layer in comp.layers:
+            layer_id = layer.id
+            for path, prop in iter_property_paths(layer):
+                properties["comp_id"].append(comp_id)
+                properties["layer_id"].append(layer_id)
+                properties["path"].append(path)
+                value_type = prop.property_value_type
+                numeric = value_type not in _NON_NUMERIC_TYPES
+                properties["value_type"].append(int(value_type))
+                keys = prop.keyframes if include_keyframes else []
+                dims = _append_components(prop_values, prop.value if numeric else None)
+                properties["dimensions"].append(dims)
+                properties["first_key"].append(key_row if keys else -1)
+                properties["num_keys"].append(len(keys))
+
+                for kf in keys:
+                    keyframes["property_index"].append(row)
+                    keyframes["time"].append(kf.time)
+                    keyframes["in_interpolation"].append(int(kf.in_interpolation_type))
+                    keyframes["out_interpolation"].append(
+                        int(kf.out_interpolation_type)
+                    )
+                    _append_components(key_values, kf.value if numeric else None)
+                    for dim, (ease_in, ease_out) in enumerate(
+                        zip(kf.in_temporal_ease, kf.out_temporal_ease)
+                    ):
+                        eases["key_index"].append(key_row)
+                        eases["dimension"].append(dim)
+                        eases["in_speed"].append(ease_in.speed)
+                        eases["in_influence"].append(ease_in.influence)
+                        eases["out_speed"].append(ease_out.speed)
+                        eases["out_influence"].append(ease_out.influence)
+                    key_row += 1
+                row += 1
+
+    return {
+        "properties": _finalize(properties, use_numpy),
+        "keyframes": _finalize(keyframes, use_numpy),
+        "eases": _finalize(eases, use_numpy),
+    }
@@ -12,16 +12,20 @@ from ...kaitai.reverses import (
 )
 from ...kaitai.transforms import normalize_values
 from ...kaitai.utils import create_chunk, propagate_check
+from ..bake import BakedLayer, bake_comp
 from ..layers.av_layer import AVLayer
 from ..layers.camera_layer import CameraLayer
 from ..layers.light_layer import LightLayer
 from ..layers.shape_layer import ShapeLayer
 from ..layers.text_layer import TextLayer
 from ..layers.three_d_model_layer import ThreeDModelLayer
+from ..nested import NestedLayerSample, evaluate_nested
 from ..properties.marker import MarkerValue
+from ..properties.property import _invalidate_resolved_values
 from ..sources.file import FileSource
 from ..sources.placeholder import PlaceholderSource
 from ..sources.solid import SolidSource
+from ..transform import Matrix, world_matrices
 from ..validators import (
     validate_number,
     validate_sequence,
@@ -155,6 +159,7 @@ class CompItem(AVItem):
         "_cdta",
         "width",
         validate=validate_number(min=4, max=30000, integer=True),
+        post_set="_invalidate_resolved_values",
     )
     """The width of the item in pixels. Read / Write."""
 
@@ -162,6 +167,7 @@ class CompItem(AVItem):
         "_cdta",
         "height",
         validate=validate_number(min=4, max=30000, integer=True),
+        post_set="_invalidate_resolved_values",
     )
     """The height of the item in pixels. Read / Write."""
 
@@ -469,12 +475,22 @@ class CompItem(AVItem):
         """Return an iterator over the composition's layers."""
         return iter(self.layers)
 
+    def _invalidate_resolved_values(self) -> None:
+        """Recompute effect point and anchor point values after a resize."""
+        _invalidate_resolved_values()
+
     @property
     def layers(self) -> list[Layer]:
         """All the [Layer][] objects for layers in this composition.
         Read-only."""
         return self._layers
 
+    def _add_layer(self, layer: Layer) -> None:
+        """Append *layer* and mark the project's property indexes stale."""
+        self._layers.append(layer)
+        self._layers_by_id = None
+        self._project._invalidate_property_trees()
+
     @property
     def layers_by_id(self) -> dict[int, Layer]:
         """Map of layer ID to layer, for O(1) lookup by sibling layers."""
@@ -655,6 +671,92 @@ class CompItem(AVItem):
             "Must specify one of name, index, or other_layer and rel_index"
         )
 
+    def bake(
+        self,
+        fps: float | None = None,
+        start: float | None = None,
+        end: float | None = None,
+        properties: typing.Iterable[str] | None = None,
+        processes: int | None = None,
+        use_numpy: bool | None = None,
+        path_tolerance: float | None = None,
+    ) -> dict[int, BakedLayer]:
+        """Evaluate every animated property of every layer over a range.
+
+        Each layer is sampled at the frames where it is active (see
+        [Layer.active_at_time][]), and the values are returned as columns
+        keyed by match-name path. See [py_aep.models.bake][] for details.
+
+        Example:
+            ```python
+            baked = comp.bake(fps=24)
+            for layer_id, layer in baked.items():
+                position = layer.values.get("ADBE Transform Group/ADBE Position")
+            ```
+
+        Args:
+            fps: Sampling rate. Defaults to [frame_rate][].
+            start: First time to sample, in seconds. Defaults to `0`.
+            end: End of the range (exclusive), in seconds. Defaults to
+                [duration][].
+            properties: Only bake these match-name paths, or the
+                properties below these group paths.
+            processes: Bake the layers in this many worker processes.
+                Workers read the saved project file, so unsaved changes
+                are not seen.
+            use_numpy: Return NumPy arrays instead of lists. Defaults to
+                `True` when NumPy is installed.
+            path_tolerance: Precision of spatial bezier paths, see
+                [Property.values_at_times][].
+        """
+        return bake_comp(
+            self, fps, start, end, properties, processes, use_numpy, path_tolerance
+        )
+
+    def evaluate_nested(
+        self,
+        times: typing.Iterable[float],
+        properties: typing.Iterable[str] | None = None,
+    ) -> list[list[NestedLayerSample]]:
+        """Evaluate the composition and all nested compositions at many times.
+
+        For each time, lists every layer that is active at that time in
+        this composition or, through precomposition layers, in any nested
+        composition, with its local time and property values. See
+        [py_aep.models.nested][] for how times are mapped.
+
+        Example:
+            ```python
+            frames = comp.evaluate_nested([10 / comp.frame_rate])
+            for sample in frames[0]:
+                print(sample.layer_path, sample.time)
+            ```
+
+        Args:
+            times: Composition times in seconds.
+            properties: Only evaluate these match-name paths, or the
+                properties below these group paths. `None` evaluates every
+                animated numeric property; an empty list evaluates none.
+        """
+        return evaluate_nested(self, times, properties)
+
+    def world_matrices_at(
+        self, times: typing.Iterable[float]
+    ) -> dict[int, list[Matrix]]:
+        """Return the layer-to-composition matrices of every layer.
+
+        Each layer's transform properties are evaluated once for all
+        *times*, and each parent once for all of its children. See
+        [Layer.world_matrix_at][] for a single layer and time.
+
+        Args:
+            times: Composition times in seconds.
+
+        Returns:
+            One 4x4 matrix per time for each layer, keyed by layer id.
+        """
+        return world_matrices(self.layers, times)
+
     @property
     def av_layers(self) -> list[AVLayer]:
         """A list of all [AVLayer][] objects in this composition."""
@@ -755,6 +857,22 @@ class CompItem(AVItem):
         """A list of the soloed layers in this composition."""
         return [layer for layer in self.layers if layer.solo]
 
+    @property
+    def switched_on_layers(self) -> list[Layer]:
+        """The enabled layers of this composition, limited to the soloed
+        ones when any layer is soloed. Read-only.
+
+        These are the layers that
+        [Layer.active_at_time][py_aep.models.layers.layer.Layer.active_at_time]
+        can report as active.
+        """
+        any_solo = any(layer.solo for layer in self.layers)
+        return [
+            layer
+            for layer in self.layers
+            if layer.enabled and (layer.solo or not any_solo)
+        ]
+
     @property
     def selected_layers(self) -> list[Layer]:
         """The layers that are selected in the composition. Read-only."""
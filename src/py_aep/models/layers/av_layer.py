@@ -13,6 +13,7 @@ from py_aep.enums import (
 
 from ...kaitai.descriptors import ChunkField
 from ...kaitai.utils import propagate_check
+from ..properties.property import Property, _invalidate_resolved_values
 from .layer import Layer
 
 if typing.TYPE_CHECKING:
@@ -221,6 +222,8 @@ class AVLayer(Layer):
     def source(self, value: Item) -> None:
         self._source_id = value.id if value is not None else 0
         self._source_cache = value
+        # The anchor point default scales with the source size.
+        _invalidate_resolved_values()
 
     @property
     def has_video(self) -> bool:
@@ -339,6 +342,25 @@ class AVLayer(Layer):
         prop = self["ADBE Time Remapping"]
         prop._animated = value  # type: ignore[union-attr]
 
+    def source_time(self, time: float) -> float:
+        """Return the time in the layer's [source][] shown at *time*.
+
+        With time remapping enabled this is the value of the Time Remap
+        property. Otherwise the layer's [start_time][] and [stretch][]
+        are applied. For a precomposition layer the result is a time in
+        the nested composition.
+
+        Equivalent to ExtendScript `AVLayer.sourceTime()`.
+
+        Args:
+            time: The composition time in seconds.
+        """
+        if self.time_remap_enabled:
+            remap = self["ADBE Time Remapping"]
+            assert isinstance(remap, Property)
+            return float(remap.value_at_time(time))  # type: ignore[arg-type]
+        return (time - self.start_time) / self._stretch_factor
+
     @property
     def width(self) -> int:
         """The width of the layer in pixels.
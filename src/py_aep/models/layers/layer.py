@@ -12,6 +12,7 @@ from ...kaitai.utils import create_chunk, propagate_check
 from ..properties.marker import MarkerValue
 from ..properties.property import Property
 from ..properties.property_group import PropertyGroup
+from ..transform import Matrix, TransformEvaluator
 
 if typing.TYPE_CHECKING:
     from ...kaitai import Aep
@@ -460,17 +461,53 @@ class Layer(PropertyGroup):
         Args:
             time: The time in seconds.
         """
-        if not self.enabled:
+        if time < self.in_point or time >= self.out_point:
             return False
 
-        any_solo = any(layer.solo for layer in self.containing_comp.layers)
-        if any_solo and not self.solo:
-            return False
+        return self in self.containing_comp.switched_on_layers
 
-        if time < self.in_point or time >= self.out_point:
-            return False
+    def transform_matrix_at(self, time: float) -> Matrix:
+        """Return the layer's transform matrix at the given time.
+
+        The 4x4 matrix maps points in layer space to the space of the
+        [parent][] layer, or to composition space for unparented layers.
+        See [py_aep.models.transform][] for the conventions.
+
+        Args:
+            time: The composition time in seconds.
+        """
+        return TransformEvaluator([time]).local_matrices(self)[0]
+
+    def world_matrix_at(self, time: float) -> Matrix:
+        """Return the layer-to-composition matrix at the given time.
+
+        This is the [transform_matrix_at][] of the layer combined with
+        those of all its [parent][] layers.
+
+        Example:
+            ```python
+            from py_aep.models.transform import transform_point
+
+            matrix = layer.world_matrix_at(1.0)
+            corner = transform_point(matrix, [0, 0])
+            ```
 
-        return True
+        Args:
+            time: The composition time in seconds.
+        """
+        return TransformEvaluator([time]).world_matrices(self)[0]
+
+    def world_matrices_at(self, times: typing.Iterable[float]) -> list[Matrix]:
+        """Return the layer-to-composition matrices at many times.
+
+        Faster than calling [world_matrix_at][] for each time: every
+        transform property of the layer and its parents is evaluated once
+        for the whole batch.
+
+        Args:
+            times: Composition times in seconds.
+        """
+        return TransformEvaluator(times).world_matrices(self)
 
     def _set_raw_in_point(self, value: float) -> None:
         """Write a new in_point (comp time) to the binary chunk."""
@@ -0,0 +1,168 @@
+"""Evaluation of a composition together with its nested compositions.
+
+[CompItem.evaluate_nested][py_aep.models.items.composition.CompItem.evaluate_nested]
+answers "what is visible at time *t* of this composition" for the whole
+tree of precompositions. For every requested time it returns one
+[NestedLayerSample][] per layer that is active at that time, at any
+nesting depth, in stacking order: each precomposition layer is directly
+followed by the layers of its source composition.
+
+Times are mapped into a nested composition with
+[AVLayer.source_time][py_aep.models.layers.av_layer.AVLayer.source_time],
+which applies the layer's start time and stretch, or its Time Remap
+property. When the nested composition preserves its frame rate, the
+mapped time is snapped to its frame grid. Layers of a nested composition
+are only visible while the mapped time is within its duration.
+
+Each composition is expanded once per distinct time, so a precomposition
+used by several layers, or held on one frame by time remapping, is not
+walked again. Property values are evaluated at the end, with one
+[Property.values_at_times][py_aep.models.properties.property.Property.values_at_times]
+call per property for all the times it is needed at.
+"""
+
+from __future__ import annotations
+
+import math
+import typing
+from typing import Any, NamedTuple, Tuple
+
+from .columns import iter_property_paths, path_selected
+from .layers.av_layer import AVLayer
+
+if typing.TYPE_CHECKING:
+    from .items.composition import CompItem
+    from .layers.layer import Layer
+
+
+class NestedLayerSample(NamedTuple):
+    """A layer active at one time of an evaluated composition tree."""
+
+    layer_path: tuple[int, ...]
+    """Ids of the precomposition layers leading to the layer, from the
+    top-level composition down, followed by the id of the layer."""
+
+    comp_id: int
+    """Id of the composition containing the layer."""
+
+    time: float
+    """The time in that composition, in seconds."""
+
+    display_time: float
+    """`time` offset by the composition's
+    [display_start_time][py_aep.models.items.composition.CompItem.display_start_time],
+    as shown in the composition's timeline."""
+
+    values: dict[str, Any]
+    """Values of the layer's animated numeric properties at `time`,
+    keyed by match-name path."""
+
+
+# A layer active at a time: (relative layer path, comp, layer, time).
+_Entry = Tuple[Tuple[int, ...], "CompItem", "Layer", float]
+
+
+class _TreeEvaluator:
+    """Expands compositions into active layers, memoized per time."""
+
+    def __init__(self) -> None:
+        self._expanded: dict[tuple[int, float], list[_Entry]] = {}
+        self._visible: dict[int, list[Layer]] = {}
+
+    def _visible_layers(self, comp: CompItem) -> list[Layer]:
+        """The switched-on layers of *comp*."""
+        layers = self._visible.get(comp.id)
+        if layers is None:
+            layers = comp.switched_on_layers
+            self._visible[comp.id] = layers
+        return layers
+
+    def expand(self, comp: CompItem, time: float) -> list[_Entry]:
+        """Return the layers of *comp* and its precomps active at *time*."""
+        key = (comp.id, time)
+        cached = self._expanded.get(key)
+        if cached is not None:
+            return cached
+        entries: list[_Entry] = []
+        for layer in self._visible_layers(comp):
+            if not layer.in_point <= time < layer.out_point:
+                continue
+            entries.append(((layer.id,), comp, layer, time))
+            if not isinstance(layer, AVLayer):
+                continue
+            source = layer.source
+            if source is None or not source.is_composition:
+                continue
+            nested = typing.cast("CompItem", source)
+            nested_time = layer.source_time(time)
+            if nested.preserve_nested_frame_rate:
+                frame_rate = nested.frame_rate
+                nested_time = math.floor(nested_time * frame_rate + 1e-9) / frame_rate
+            if not 0.0 <= nested_time < nested.duration:
+                continue
+            for path, inner_comp, inner_layer, inner_time in self.expand(
+                nested, nested_time
+            ):
+                entries.append(((layer.id, *path), inner_comp, inner_layer, inner_time))
+        self._expanded[key] = entries
+        return entries
+
+
+def evaluate_nested(
+    comp: CompItem,
+    times: typing.Iterable[float],
+    properties: typing.Iterable[str] | None = None,
+) -> list[list[NestedLayerSample]]:
+    """Evaluate *comp* and all its nested compositions at many times.
+
+    Args:
+        comp: The top-level composition.
+        times: Times in *comp*, in seconds.
+        properties: Only evaluate these match-name paths, or the
+            properties below these group paths. `None` evaluates every
+            animated numeric property; an empty list evaluates none.
+
+    Returns:
+        One list per time, holding the active layers of the whole tree.
+    """
+    evaluator = _TreeEvaluator()
+    frames = [evaluator.expand(comp, float(time)) for time in times]
+    wanted = frozenset(properties) if properties is not None else None
+
+    # Every time each layer is needed at, in first-seen order.
+    layer_times: dict[int, dict[float, None]] = {}
+    layers: dict[int, Layer] = {}
+    for entries in frames:
+        for _, _, layer, time in entries:
+            layers[layer.id] = layer
+            layer_times.setdefault(layer.id, {})[time] = None
+
+    layer_values: dict[int, dict[float, dict[str, Any]]] = {}
+    for layer_id, needed in layer_times.items():
+        layer = layers[layer_id]
+        times_list = list(needed)
+        per_time: dict[float, dict[str, Any]] = {t: {} for t in times_list}
+        if wanted is None or wanted:
+            for path, prop in iter_property_paths(layer):
+                if not prop.keyframes or not path_selected(path, wanted):
+                    continue
+                if not prop._keyframe_curve().is_numeric:
+                    continue
+                values = prop.values_at_times(times_list, use_numpy=False)
+                for t, value in zip(times_list, values):
+                    per_time[t][path] = value
+        layer_values[layer_id] = per_time
+
+    return [
+        [
+            NestedLayerSample(
+                path,
+                nested.id,
+                time,
+                time + nested.display_start_time,
+                dict(layer_values[layer.id][time]),
+            )
+            for path, nested, layer, time in entries
+        ]
+        for entries in frames
+    ]
@@ -5,7 +5,7 @@ import typing
 import xml.etree.ElementTree as ET
 from io import BytesIO
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, NamedTuple, TextIO, cast
 
 from kaitaistruct import KaitaiStream
 
@@ -29,16 +29,23 @@ from ..kaitai.utils import (
     str_contents,
     toggle_flag_chunk,
 )
+from .columns import project_to_columns
 from .items.composition import CompItem
 from .items.folder import FolderItem
 from .items.footage import FootageItem
+from .properties.property_group import PropertyGroup
+from .selector import compile_selector
+from .serialize import write_json
+from .text.text_document import CosWriteQueue, TextDocument
 from .validators import validate_number, validate_one_of
 
 if typing.TYPE_CHECKING:
     from ..kaitai import Aep
     from .items.item import Item
     from .layers.layer import Layer
+    from .properties.property import Property
     from .renderqueue.render_queue import RenderQueue
+    from .text.font_object import FontObject
 
 
 def _reverse_working_gamma(value: float, _body: Any) -> dict[str, int]:
@@ -49,6 +56,20 @@ def _reverse_working_gamma(value: float, _body: Any) -> dict[str, int]:
     return {"working_gamma_selector": 0 if value == 2.2 else 1}
 
 
+class PropertyMatch(NamedTuple):
+    """A property found by [Project.properties_by_match_name][], together
+    with the layer and composition that contain it."""
+
+    property: Property | PropertyGroup
+    """The matching property or property group."""
+
+    layer: Layer
+    """The layer containing the property."""
+
+    comp: CompItem
+    """The composition containing the layer."""
+
+
 class Project:
     """
     The `Project` object represents an After Effects project. Attributes
@@ -229,6 +250,24 @@ class Project:
         self._render_queue = render_queue
         self._active_item: Item | None = None
         self._effect_param_defs: dict[str, dict[str, dict[str, Any]]] = {}
+        # Incremented whenever a layer is added or the children of one of
+        # its property groups are replaced or renamed. Indexes built over
+        # the property trees are rebuilt when built at an older epoch.
+        self._tree_epoch = 0
+        self._match_name_index: dict[str, list[PropertyMatch]] | None = None
+        self._match_name_index_epoch = -1
+        # Display and automatic names of all properties, built with the
+        # match name index
+        self._property_names: frozenset[str] = frozenset()
+        # Fonts of all text documents, keyed by (post_script_name, version)
+        self._font_table: dict[tuple[str, str | None], FontObject] = {}
+        # Text documents edited since their btdk chunks were last written
+        self._cos_writes = CosWriteQueue()
+        # Fonts of each Source Text property, with the match name index
+        # and text edit count they were read at
+        self._text_fonts: list[tuple[Layer, list[FontObject]]] | None = None
+        self._text_fonts_index: dict[str, list[PropertyMatch]] | None = None
+        self._text_fonts_edit_count = -1
 
     def __repr__(self) -> str:
         return f"Project(file={self._file!r})"
@@ -427,6 +466,301 @@ class Project:
         }
         return layers_by_uid[layer_id]
 
+    def select(self, selector: str) -> typing.Iterator[Any]:
+        """Lazily yield the items, layers and properties matching a path
+        selector.
+
+        The selector is compiled once and cached. See
+        [py_aep.models.selector][] for the full syntax.
+
+        Example:
+            ```python
+            docs = project.select(
+                "comp[name^=SH_]/layer[type=text]"
+                "/ADBE Text Properties/ADBE Text Document"
+            )
+            for prop in docs:
+                print(prop.value.text)
+            ```
+
+        Args:
+            selector: A `/`-separated selector path.
+
+        Raises:
+            ValueError: If the selector is malformed.
+        """
+        return compile_selector(selector).select(self)
+
+    def properties_by_match_name(self, match_name: str) -> list[PropertyMatch]:
+        """All properties and property groups with the given match name.
+
+        Backed by a project-wide index built on first use, so repeated
+        lookups do not walk the property trees again.
+
+        Example:
+            ```python
+            for match in project.properties_by_match_name(
+                "ADBE Gaussian Blur 2-0001"
+            ):
+                print(match.comp.name, match.layer.name, match.property.value)
+            ```
+
+        Args:
+            match_name: The match name to look up.
+        """
+        return list(self._get_match_name_index().get(match_name, ()))
+
+    def effects_by_match_name(self, match_name: str) -> list[PropertyMatch]:
+        """All effect instances with the given match name.
+
+        Args:
+            match_name: The effect match name (e.g. `"ADBE Gaussian Blur 2"`).
+        """
+        return [
+            match
+            for match in self._get_match_name_index().get(match_name, ())
+            if match.property.is_effect
+        ]
+
+    def _get_match_name_index(self) -> dict[str, list[PropertyMatch]]:
+        """Return the match name -> properties index.
+
+        The index lists properties in document order. It is built on first
+        use and rebuilt after a layer is added, the children of a property
+        group are replaced or a property is renamed, including when
+        synthesized children are filled in.
+        """
+        if (
+            self._match_name_index is None
+            or self._match_name_index_epoch != self._tree_epoch
+        ):
+            index: dict[str, list[PropertyMatch]] = {}
+            names: set[str] = set()
+            for comp in self.compositions:
+                for layer in comp.layers:
+                    stack: list[Property | PropertyGroup] = list(
+                        reversed(layer.properties)
+                    )
+                    while stack:
+                        prop = stack.pop()
+                        index.setdefault(prop.match_name, []).append(
+                            PropertyMatch(prop, layer, comp)
+                        )
+                        names.add(prop.name)
+                        names.add(prop.auto_name)
+                        if isinstance(prop, PropertyGroup):
+                            stack.extend(reversed(prop.properties))
+            self._match_name_index = index
+            self._property_names = frozenset(names)
+            self._match_name_index_epoch = self._tree_epoch
+        return self._match_name_index
+
+    def _invalidate_property_trees(self) -> None:
+        """Mark indexes built over the property trees as stale."""
+        self._tree_epoch += 1
+
+    @property
+    def fonts(self) -> list[FontObject]:
+        """The fonts used by the text layers of the project. Read-only.
+
+        Each font of the font list of a Source Text property is listed
+        once, in order of first use. The font lists are read without
+        decoding the text documents. After Effects also lists fonts it
+        uses internally, such as `AdobeInvisFont`. Text documents share
+        the [FontObject][] of fonts with the same PostScript name and
+        version.
+        """
+        fonts: dict[int, FontObject] = {}
+        for _, layer_fonts in self._get_text_fonts():
+            for font in layer_fonts:
+                fonts.setdefault(id(font), font)
+        return list(fonts.values())
+
+    def layers_using_font(self, name: str) -> list[Layer]:
+        """The layers with text set in a font.
+
+        A layer is listed when the font list of its Source Text property,
+        shared by the static value and every keyframe, has the font.
+
+        Args:
+            name: The PostScript name of the font (e.g. `"ArialMT"`).
+        """
+        layers: dict[int, Layer] = {}
+        for layer, layer_fonts in self._get_text_fonts():
+            if id(layer) in layers:
+                continue
+            if any(font.post_script_name == name for font in layer_fonts):
+                layers[id(layer)] = layer
+        return list(layers.values())
+
+    def replace_text(
+        self,
+        replacements: dict[str, str] | typing.Callable[[str], str | None],
+        comps: typing.Iterable[CompItem] | None = None,
+        *,
+        font: str | None = None,
+        font_size: float | None = None,
+    ) -> int:
+        """Rewrite the text of many text layers at once.
+
+        Every Source Text value (the static value or each keyframe) is
+        visited once. Edited documents are serialized back to their
+        chunks in a single pass at the end, however many of their values
+        changed.
+
+        Example:
+            ```python
+            french = {"Hello": "Bonjour", "Goodbye": "Au revoir"}
+            project.replace_text(french)
+            project.replace_text(str.upper, comps=[project.compositions[0]])
+            ```
+
+        Args:
+            replacements: Either a dict mapping a whole text to its
+                replacement, or a callable returning the new text for a
+                text, or `None` to leave it unchanged.
+            comps: Only rewrite text layers of these compositions. `None`
+                rewrites all compositions.
+            font: PostScript name of a font to set on the replaced texts.
+                Only fonts already listed in a document can be set, see
+                [TextDocument.font][py_aep.models.text.text_document.TextDocument.font].
+            font_size: Font size to set on the replaced texts.
+
+        Returns:
+            The number of text values that were replaced.
+
+        Raises:
+            ValueError: If *font* is not listed in a document whose text
+                is replaced. No text is changed in that case.
+        """
+        if callable(replacements):
+            replace = replacements
+        else:
+            replace = replacements.get
+        edits: list[tuple[TextDocument, str]] = []
+        for layer, doc in self._iter_text_documents(comps):
+            new_text = replace(doc.text)
+            if new_text is None:
+                continue
+            if font is not None and (
+                doc._char_style is None
+                or all(fo.post_script_name != font for fo in doc._fonts)
+            ):
+                raise ValueError(
+                    f"Font {font!r} is not listed in the text of layer {layer.name!r}"
+                )
+            edits.append((doc, new_text))
+        for doc, new_text in edits:
+            doc.text = new_text
+            if font is not None:
+                doc.font = font
+            if font_size is not None:
+                doc.font_size = font_size
+        self._cos_writes.flush()
+        return len(edits)
+
+    def _get_text_fonts(self) -> list[tuple[Layer, list[FontObject]]]:
+        """Return `(layer, fonts)` for every Source Text property.
+
+        *fonts* is the font list of the property's `btdk` data, read
+        without decoding its text documents. The lists are cached until
+        the property tree or a text document changes.
+        """
+        index = self._get_match_name_index()
+        edit_count = self._cos_writes.edit_count
+        if (
+            self._text_fonts is None
+            or self._text_fonts_index is not index
+            or self._text_fonts_edit_count != edit_count
+        ):
+            text_fonts = []
+            for match in index.get("ADBE Text Document", ()):
+                prop = match.property
+                if isinstance(prop, PropertyGroup) or prop._fonts_loader is None:
+                    continue
+                text_fonts.append((match.layer, prop._fonts_loader()))
+            self._text_fonts = text_fonts
+            self._text_fonts_index = index
+            self._text_fonts_edit_count = edit_count
+        return self._text_fonts
+
+    def _iter_text_documents(
+        self,
+        comps: typing.Iterable[CompItem] | None = None,
+    ) -> typing.Iterator[tuple[Layer, TextDocument]]:
+        """Yield `(layer, text_document)` for every Source Text value.
+
+        Args:
+            comps: Only yield the text of these compositions.
+        """
+        comp_ids = None if comps is None else {comp.id for comp in comps}
+        for match in self._get_match_name_index().get("ADBE Text Document", ()):
+            if comp_ids is not None and match.comp.id not in comp_ids:
+                continue
+            prop = match.property
+            if isinstance(prop, PropertyGroup):
+                continue
+            values = [kf.value for kf in prop.keyframes] or [prop.value]
+            for value in values:
+                if isinstance(value, TextDocument):
+                    yield match.layer, value
+
+    def to_columns(
+        self,
+        include_keyframes: bool = True,
+        use_numpy: bool | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Export all property values and keyframes as columnar tables.
+
+        The project is walked once. The result holds three tables
+        (`properties`, `keyframes` and `eases`), each a dict of equally
+        long columns. See [py_aep.models.columns][] for the column layout.
+
+        Example:
+            ```python
+            import pandas as pd
+
+            tables = project.to_columns()
+            props = pd.DataFrame(tables["properties"])
+            ```
+
+        Args:
+            include_keyframes: When `False`, skip the keyframe and ease
+                tables.
+            use_numpy: Return NumPy arrays instead of `array.array`.
+                Defaults to `True` when NumPy is installed.
+        """
+        return project_to_columns(self, include_keyframes, use_numpy)
+
+    def write_json(
+        self,
+        fp: TextIO,
+        depth: int | None = None,
+        include: typing.Iterable[str] | None = None,
+        indent: int | None = None,
+    ) -> None:
+        """Serialize the project model as JSON, streaming it to *fp*.
+
+        The output is written incrementally while the model is walked, so
+        large projects never need a full in-memory dict or output string.
+        See [py_aep.models.serialize][] for how model objects are mapped.
+
+        Example:
+            ```python
+            with open("project.json", "w") as fp:
+                project.write_json(fp, include={"items"}, indent=2)
+            ```
+
+        Args:
+            fp: A text file object to write to.
+            depth: Model objects nested more than *depth* levels below the
+                project are written as `null`. `None` means no limit.
+            include: Only write these top-level project attributes.
+            indent: Indent nested values by this many spaces. `None`
+                writes everything on one line.
+        """
+        write_json(self, fp, depth=depth, include=include, indent=indent)
+
     @property
     def compositions(self) -> list[CompItem]:
         """All the compositions in the project."""
@@ -457,6 +791,7 @@ class Project:
                 "delete the existing file."
             )
 
+        self._cos_writes.flush()
         aep = self._aep
 
         xmp_bytes = aep.xmp_packet.encode("UTF-8")
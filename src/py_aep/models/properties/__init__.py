@@ -7,7 +7,7 @@ from .mask_property_group import MaskPropertyGroup
 from .property import Property
 from .property_base import PropertyBase
 from .property_group import PropertyGroup
-from .shape import FeatherPoint, Shape
+from .shape import FeatherPoint, Shape, ShapeArrays
 
 __all__ = [
     "FeatherPoint",
@@ -19,4 +19,5 @@ __all__ = [
     "PropertyBase",
     "PropertyGroup",
     "Shape",
+    "ShapeArrays",
 ]
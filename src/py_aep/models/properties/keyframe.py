@@ -44,7 +44,10 @@ class Keyframe:
     """
 
     in_interpolation_type = ChunkField.enum(
-        KeyframeInterpolationType, "_ldat_item", "in_interpolation_type"
+        KeyframeInterpolationType,
+        "_ldat_item",
+        "in_interpolation_type",
+        post_set="_invalidate_curve",
     )
     """The "in" interpolation type for the keyframe. Read / Write."""
 
@@ -56,17 +59,22 @@ class Keyframe:
     """
 
     out_interpolation_type = ChunkField.enum(
-        KeyframeInterpolationType, "_ldat_item", "out_interpolation_type"
+        KeyframeInterpolationType,
+        "_ldat_item",
+        "out_interpolation_type",
+        post_set="_invalidate_curve",
     )
     """The "out" interpolation type for the keyframe. Read / Write."""
 
-    roving = ChunkField.bool("_ldat_item", "roving")
+    roving = ChunkField.bool("_ldat_item", "roving", post_set="_invalidate_curve")
     """
     `True` if the keyframe is roving. The first and last keyframe in
     a property cannot rove. Read / Write.
     """
 
-    temporal_auto_bezier = ChunkField.bool("_ldat_item", "temporal_auto_bezier")
+    temporal_auto_bezier = ChunkField.bool(
+        "_ldat_item", "temporal_auto_bezier", post_set="_invalidate_curve"
+    )
     """
     `True` if the keyframe has temporal auto-Bezier interpolation. Temporal
     auto-Bezier interpolation affects this keyframe only if the keyframe
@@ -74,7 +82,9 @@ class Keyframe:
     `in_interpolation_type` and `out_interpolation_type`. Read / Write.
     """
 
-    temporal_continuous = ChunkField.bool("_ldat_item", "temporal_continuous")
+    temporal_continuous = ChunkField.bool(
+        "_ldat_item", "temporal_continuous", post_set="_invalidate_curve"
+    )
     """
     `True` if the keyframe has temporal continuity. Temporal continuity affects
     this keyframe only if the keyframe interpolation type is
@@ -115,6 +125,12 @@ class Keyframe:
             for ease in self._out_temporal_ease:
                 ease._speed_factor = factor
 
+    def _invalidate_curve(self) -> None:
+        """Drop the owning property's compiled curve and key times after an edit."""
+        if self._property is not None:
+            self._property._curve = None
+            self._property._key_times_cache = None
+
     def _extract_raw_value(
         self,
     ) -> list[float] | float | None:
@@ -159,6 +175,7 @@ class Keyframe:
                     _dimension_index=i,
                     _direction="in",
                     _speed_factor=factor,
+                    _keyframe=self,
                 )
                 for i in range(len(kf_data.in_speed))
             ]
@@ -168,6 +185,7 @@ class Keyframe:
                     _dimension_index=i,
                     _direction="out",
                     _speed_factor=factor,
+                    _keyframe=self,
                 )
                 for i in range(len(kf_data.out_speed))
             ]
@@ -178,6 +196,7 @@ class Keyframe:
                     _dimension_index=0,
                     _direction="in",
                     _speed_factor=factor,
+                    _keyframe=self,
                 )
             ]
             out_ease = [
@@ -186,6 +205,7 @@ class Keyframe:
                     _dimension_index=0,
                     _direction="out",
                     _speed_factor=factor,
+                    _keyframe=self,
                 )
             ]
         return in_ease, out_ease
@@ -194,6 +214,8 @@ class Keyframe:
         """Lazily create ease objects on first access."""
         if self._in_temporal_ease is None:
             self._in_temporal_ease, self._out_temporal_ease = self._create_ease()
+            if self._property is not None:
+                self._property._on_ease_created(self)
 
     @property
     def in_spatial_tangent(self) -> list[float] | None:
@@ -219,6 +241,7 @@ class Keyframe:
         if value is not None and hasattr(kf_data, "in_spatial_tangents"):
             kf_data.in_spatial_tangents = value
             propagate_check(self._ldat_item)
+            self._invalidate_curve()
 
     @property
     def out_spatial_tangent(self) -> list[float] | None:
@@ -244,6 +267,7 @@ class Keyframe:
         if value is not None and hasattr(kf_data, "out_spatial_tangents"):
             kf_data.out_spatial_tangents = value
             propagate_check(self._ldat_item)
+            self._invalidate_curve()
 
     @property
     def value(
@@ -257,6 +281,8 @@ class Keyframe:
         [TextDocument][]. For marker properties, this is a [MarkerValue][].
         For properties that carry no value, this is `None`.
         """
+        if self._property is not None and self._property._value_loader is not None:
+            self._property._load_deferred_value()
         val = (
             self._value
             if self._value is not _VALUE_FROM_CHUNK
@@ -271,9 +297,12 @@ class Keyframe:
         self,
         value: list[float] | float | MarkerValue | Shape | TextDocument | None,
     ) -> None:
-        if self._property is not None and isinstance(value, (int, float, list)):
-            value = self._property._unresolve_value(value)
+        if self._property is not None:
+            self._property._load_deferred_value()
+            if isinstance(value, (int, float, list)):
+                value = self._property._unresolve_value(value)
         self._value = value
+        self._invalidate_curve()
 
     @property
     def in_temporal_ease(self) -> list[KeyframeEase]:
@@ -293,6 +322,7 @@ class Keyframe:
     @in_temporal_ease.setter
     def in_temporal_ease(self, value: list[KeyframeEase]) -> None:
         self._in_temporal_ease = value
+        self._invalidate_curve()
 
     @property
     def out_temporal_ease(self) -> list[KeyframeEase]:
@@ -312,6 +342,7 @@ class Keyframe:
     @out_temporal_ease.setter
     def out_temporal_ease(self, value: list[KeyframeEase]) -> None:
         self._out_temporal_ease = value
+        self._invalidate_curve()
 
     def _resolve_ease(
         self, raw_ease: list[KeyframeEase], direction: str
@@ -391,6 +422,7 @@ class Keyframe:
     def spatial_auto_bezier(self, value: bool) -> None:
         self._ldat_item.kf_data.spatial_auto_bezier = int(value)
         propagate_check(self._ldat_item)
+        self._invalidate_curve()
 
     @property
     def spatial_continuous(self) -> bool:
@@ -405,6 +437,7 @@ class Keyframe:
     def spatial_continuous(self, value: bool) -> None:
         self._ldat_item.kf_data.spatial_continuous = int(value)
         propagate_check(self._ldat_item)
+        self._invalidate_curve()
 
     @property
     def frame_time(self) -> int:
@@ -424,6 +457,7 @@ class Keyframe:
         offset = self._property._frame_offset if self._property is not None else 0
         self._ldat_item.time_raw = round((value - offset) * self._time_scale)
         propagate_check(self._ldat_item)
+        self._invalidate_curve()
 
     @property
     def time(self) -> float:
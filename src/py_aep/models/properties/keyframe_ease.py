@@ -9,6 +9,8 @@ from ...kaitai.utils import propagate_check
 if typing.TYPE_CHECKING:
     from typing import Any
 
+    from .keyframe import Keyframe
+
 
 class KeyframeEase:
     """
@@ -40,8 +42,10 @@ class KeyframeEase:
         _dimension_index: int = 0,
         _direction: str = "",
         _speed_factor: float = 1.0,
+        _keyframe: Keyframe | None = None,
     ) -> None:
         self._kf_data = _kf_data
+        self._keyframe = _keyframe
         self._dimension_index = _dimension_index
         self._direction = _direction
         self._speed_factor = _speed_factor
@@ -77,6 +81,8 @@ class KeyframeEase:
         else:
             setattr(self._kf_data, field_name, binary_value)
         propagate_check(self._kf_data)
+        if self._keyframe is not None:
+            self._keyframe._invalidate_curve()
 
     @property
     def influence(self) -> float:
@@ -104,3 +110,5 @@ class KeyframeEase:
         else:
             setattr(self._kf_data, field_name, binary_value)
         propagate_check(self._kf_data)
+        if self._keyframe is not None:
+            self._keyframe._invalidate_curve()
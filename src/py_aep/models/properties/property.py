@@ -3,10 +3,11 @@ from __future__ import annotations
 import logging
 import math
 import typing
+from bisect import bisect_left, bisect_right
 from typing import cast
 
 from py_aep.enums import PropertyControlType, PropertyType, PropertyValueType
-from py_aep.resolvers.interpolation import interpolate_keyframes
+from py_aep.resolvers.interpolation import KeyframeCurve, is_numeric_value
 
 from ...data.units import UNITS_TEXT_MAP
 from ...kaitai.descriptors import ChunkField
@@ -20,23 +21,46 @@ from .overrides import (
     _NAME_OVERRIDES,
 )
 from .property_base import PropertyBase
+from .shape import Shape, ShapeArrays, _blend_shapes, _copy_shape_arrays
 from .specs import _USE_VALUE
 
 if typing.TYPE_CHECKING:
-    from typing import Any
+    from typing import Any, Callable
 
     from py_aep.models.properties.marker import MarkerValue
-    from py_aep.models.properties.shape import Shape
+    from py_aep.models.text.font_object import FontObject
     from py_aep.models.text.text_document import TextDocument
 
     from ...kaitai import Aep
     from .keyframe import Keyframe
     from .specs import _PropSpec
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 _UNSET = object()  # sentinel for unset min/max fallback
 
+# Keyframe times are frame counts divided by the frame rate; query times
+# computed the same way may differ by rounding.
+_TIME_EPSILON = 1e-9
+
+# Incremented by edits that change how stored values resolve to user
+# units: composition resizes and layer source changes alter the scale of
+# effect points and anchor points. Cached values from an older epoch are
+# recomputed.
+_resolve_epoch = 0
+
+
+def _invalidate_resolved_values() -> None:
+    """Drop the resolved values and effect scales cached by all properties."""
+    global _resolve_epoch
+    _resolve_epoch += 1
+
+
 # Match names whose binary values are stored as 0-1 fractions but
 # ExtendScript reports as 0-100 percentages.
 _PERCENT_MATCH_NAMES: set[str] = {
@@ -339,6 +363,12 @@ class Property(PropertyBase):
         self._expression_enabled = expression_enabled
         self._expression = expression
 
+        self._curve: KeyframeCurve | None = None
+        self._curve_frame_offset = 0
+        self._curve_epoch = _resolve_epoch
+        self._key_times_cache: tuple[list[float], list[int]] | None = None
+        self._key_times_keyframes: list[Keyframe] | None = None
+        self._key_times_frame_offset = 0
         self.keyframes = keyframes
         self._link_keyframes()
 
@@ -347,6 +377,13 @@ class Property(PropertyBase):
         self._property_value_type = property_value_type
 
         self._value: Any = value
+        self._value_loader: Callable[[], None] | None = None
+        # Reads the fonts of text document properties without decoding them
+        self._fonts_loader: Callable[[], list[FontObject]] | None = None
+        self._resolved: Any = _UNSET
+        self._resolved_epoch = _resolve_epoch
+        self._scale_cache: Any = _UNSET
+        self._scale_epoch = _resolve_epoch
 
         self._units_text = units_text
 
@@ -495,6 +532,7 @@ class Property(PropertyBase):
         self._tdbs = tdbs_body
         if cdat_body_ref is not None:
             self._cdat = cdat_body_ref
+            self._invalidate_resolved_value()
 
     @staticmethod
     def _read_tdum(body: Aep.TdumBody) -> Any:
@@ -610,6 +648,23 @@ class Property(PropertyBase):
             self._cdat.value_be = raw
         self._cdat._invalidate_value()
         propagate_check(self._cdat)
+        self._invalidate_resolved_value()
+
+    def _invalidate_resolved_value(self) -> None:
+        """Drop the cached static value after the cdat chunk changed."""
+        self._resolved = _UNSET
+
+    def _load_deferred_value(self) -> None:
+        """Run the pending value loader, if any.
+
+        Parsers may defer decoding expensive values (such as the COS data
+        of text documents) by setting `_value_loader`. The loader fills in
+        `_value` and the keyframe values and is run at most once.
+        """
+        loader = self._value_loader
+        if loader is not None:
+            self._value_loader = None
+            loader()
 
     @property
     def value(self) -> Any:
@@ -619,10 +674,16 @@ class Property(PropertyBase):
         value. If there are keyframes, returns the keyframed value at the
         current time. Otherwise, returns the static value. Read / Write.
         """
+        if self._value_loader is not None:
+            self._load_deferred_value()
         if self._value is not None:
             return self._value
         if self._cdat is not None:
-            return self._resolve_value(self._read_cdat_raw())
+            if self._resolved is _UNSET or self._resolved_epoch != _resolve_epoch:
+                self._resolved = self._resolve_value(self._read_cdat_raw())
+                self._resolved_epoch = _resolve_epoch
+            resolved = self._resolved
+            return list(resolved) if isinstance(resolved, list) else resolved
         if self.keyframes:
             return self.keyframes[0].value
         return None
@@ -630,6 +691,7 @@ class Property(PropertyBase):
     @value.setter
     def value(self, value: Any) -> None:
         _validate_value(self, value)
+        self._load_deferred_value()
         self._value = value
         if isinstance(self._tdsb, ProxyBody) and self.parent_property is not None:
             self._materialize()
@@ -911,18 +973,99 @@ class Property(PropertyBase):
         match_name = _SEPARATION_FOLLOWERS[dim]
         return cast("Property | None", parent.property(name=match_name))
 
+    def _key_times(self) -> tuple[list[float], list[int]]:
+        """Keyframe times in seconds, sorted, with their keyframe indices.
+
+        Editing a keyframe time does not reorder the keyframes, so the
+        times are sorted here and each one is returned with the index of
+        its keyframe. Built from the keyframe times only, so time queries
+        never decode keyframe values or compile the keyframe curve. The
+        keyframe setters that drop the curve also drop the times. They
+        are rebuilt as well when the keyframe list is replaced or when
+        the layer start time shifts keyframe times.
+        """
+        cached = self._key_times_cache
+        frame_offset = self._frame_offset
+        if (
+            cached is None
+            or self._key_times_keyframes is not self.keyframes
+            or len(cached[1]) != len(self.keyframes)
+            or self._key_times_frame_offset != frame_offset
+        ):
+            times = [kf.time for kf in self.keyframes]
+            order = sorted(range(len(times)), key=times.__getitem__)
+            cached = ([times[index] for index in order], order)
+            self._key_times_cache = cached
+            self._key_times_keyframes = self.keyframes
+            self._key_times_frame_offset = frame_offset
+        return cached
+
     def nearest_key_index(self, time: float) -> int:
         """
         Returns the index of the keyframe nearest to the specified time.
 
+        When *time* is exactly between two keyframes, the earlier one is
+        returned.
+
         Args:
             time: The time in seconds; a floating-point value. The beginning
                 of the composition is 0.
+
+        Raises:
+            ValueError: If the property has no keyframes.
         """
-        return min(
-            range(len(self.keyframes)),
-            key=lambda i: abs(self.keyframes[i].frame_time - time),
-        )
+        times, order = self._key_times()
+        if not times:
+            raise ValueError(f"{self.match_name} has no keyframes")
+        index = bisect_left(times, time)
+        if index == len(times):
+            return order[index - 1]
+        if index > 0 and time - times[index - 1] <= times[index] - time:
+            return order[index - 1]
+        return order[index]
+
+    def key_index_at_or_before(self, time: float) -> int | None:
+        """
+        Returns the index of the last keyframe at or before the specified time.
+
+        Args:
+            time: The time in seconds; a floating-point value. The beginning
+                of the composition is 0.
+
+        Returns:
+            The keyframe index, or `None` if every keyframe is after *time*.
+        """
+        times, order = self._key_times()
+        index = bisect_right(times, time + _TIME_EPSILON) - 1
+        return order[index] if index >= 0 else None
+
+    def keyframes_in_range(self, start: float, end: float) -> list[Keyframe]:
+        """
+        Returns the keyframes from *start* up to, but not including, *end*.
+
+        The keyframes are returned in time order.
+
+        Example:
+            ```python
+            frame_duration = 1 / comp.frame_rate
+            for frame in range(250):
+                time = frame * frame_duration
+                keys = prop.keyframes_in_range(time, time + frame_duration)
+            ```
+
+        Args:
+            start: Start of the range in seconds.
+            end: End of the range in seconds (exclusive).
+
+        Raises:
+            ValueError: If *end* is before *start*.
+        """
+        if end < start:
+            raise ValueError(f"end ({end}) must not be before start ({start})")
+        times, order = self._key_times()
+        first = bisect_left(times, start - _TIME_EPSILON)
+        last = bisect_left(times, end - _TIME_EPSILON)
+        return [self.keyframes[index] for index in order[first:last]]
 
     def nearest_key(self, time: float) -> Keyframe:
         """
@@ -1032,7 +1175,205 @@ class Property(PropertyBase):
         if not self.keyframes:
             return self.value  # type: ignore[no-any-return]
 
-        return interpolate_keyframes(time, self.keyframes, self.is_spatial)
+        return self._keyframe_curve().value_at(time)
+
+    def values_at_times(
+        self,
+        times: typing.Iterable[float],
+        use_numpy: bool | None = None,
+        path_tolerance: float | None = None,
+    ) -> Any:
+        """Get the values of the named property at many times in one call.
+
+        Equivalent to calling [value_at_time][Property.value_at_time] for
+        each time, but the keyframe segments are swept once for the whole
+        batch. With NumPy, numeric properties are evaluated vectorized.
+
+        Example:
+            ```python
+            frame_times = [frame / comp.frame_rate for frame in range(250)]
+            positions = layer.transform.position.values_at_times(frame_times)
+            ```
+
+        Args:
+            times: Composition times in seconds, in any order.
+            use_numpy: Return a NumPy array instead of a list. Defaults to
+                `True` when NumPy is installed. Non-numeric properties
+                (shapes, text documents, markers) always return a list.
+            path_tolerance: Precision of spatial bezier paths: the largest
+                distance, in property units, between the curved path and
+                the polyline it is sampled into. `None` samples each path
+                at 150 evenly spaced points, as
+                [value_at_time][Property.value_at_time] does. Larger
+                values evaluate paths with many keyframes faster.
+
+        Returns:
+            The values in the order of *times*. NumPy results have shape
+            `(len(times),)` for one-dimensional properties and
+            `(len(times), dimensions)` otherwise.
+
+        Raises:
+            ImportError: If `use_numpy` is `True` but NumPy is not
+                installed.
+            ValueError: If *path_tolerance* is not positive.
+        """
+        if use_numpy is None:
+            use_numpy = np is not None
+        elif use_numpy and np is None:
+            raise ImportError("use_numpy=True requires NumPy to be installed")
+
+        if not hasattr(times, "__len__"):
+            times = list(times)
+
+        if not self.keyframes:
+            value = self.value
+            if use_numpy and is_numeric_value(value):
+                static = np.asarray(value, dtype=float)
+                query = np.asarray(times, dtype=float)
+                return np.broadcast_to(static, (len(query), *static.shape)).copy()
+            return [list(value) if isinstance(value, list) else value for _ in times]
+
+        curve = self._keyframe_curve(path_tolerance)
+        if use_numpy and curve.is_numeric:
+            return curve.values_at_array(np.asarray(times, dtype=float))
+        return curve.values_at(times)
+
+    def sample(
+        self,
+        start: float,
+        end: float,
+        fps: float | None = None,
+        use_numpy: bool | None = None,
+        path_tolerance: float | None = None,
+    ) -> tuple[Any, Any]:
+        """Sample the named property at a regular frame rate.
+
+        Args:
+            start: First sample time in seconds.
+            end: Last sample time in seconds (included when it falls on
+                a frame).
+            fps: Samples per second. Defaults to the frame rate of the
+                containing composition.
+            use_numpy: See [values_at_times][Property.values_at_times].
+            path_tolerance: See
+                [values_at_times][Property.values_at_times].
+
+        Returns:
+            A `(times, values)` tuple.
+
+        Raises:
+            ValueError: If *end* is before *start*, or if *fps* is not
+                given and the property does not belong to a layer.
+        """
+        if end < start:
+            raise ValueError(f"end ({end}) must not be before start ({start})")
+        if fps is None:
+            layer = self._containing_layer
+            if layer is None:
+                raise ValueError("fps is required for properties outside a layer")
+            fps = float(layer.containing_comp.frame_rate)
+        count = int(math.floor((end - start) * fps + 1e-9)) + 1
+        times = [start + frame / fps for frame in range(count)]
+        values = self.values_at_times(
+            times, use_numpy=use_numpy, path_tolerance=path_tolerance
+        )
+        if use_numpy is None:
+            use_numpy = np is not None
+        return (np.asarray(times, dtype=float) if use_numpy else times), values
+
+    def shapes_at_times(
+        self,
+        times: typing.Iterable[float],
+        use_numpy: bool | None = None,
+    ) -> list[ShapeArrays]:
+        """Get the shape of a mask or shape path property at many times.
+
+        Shapes are returned as arrays (see [Shape.to_arrays][]) rather
+        than [Shape][] objects. Between two keyframes, vertices and
+        tangents are blended point by point, eased by the keyframe
+        interpolation and temporal ease. When the two keyframes have a
+        different number of vertices, the nearer one is held.
+
+        Every keyframe shape is converted to arrays once, and with NumPy
+        all the times between the same two keyframes are blended in one
+        vectorized step.
+
+        Example:
+            ```python
+            frame_times = [frame / comp.frame_rate for frame in range(250)]
+            mask_shape = layer.masks[0].property(name="ADBE Mask Shape")
+            for shape in mask_shape.shapes_at_times(frame_times):
+                print(shape.vertices)
+            ```
+
+        Args:
+            times: Composition times in seconds, in any order.
+            use_numpy: Return `(n, 2)` NumPy arrays instead of lists.
+                Defaults to `True` when NumPy is installed.
+
+        Returns:
+            One [ShapeArrays][py_aep.models.properties.shape.ShapeArrays]
+            per time, in the order of *times*.
+
+        Raises:
+            ImportError: If `use_numpy` is `True` but NumPy is not
+                installed.
+            TypeError: If the property value is not a shape.
+        """
+        if use_numpy is None:
+            use_numpy = np is not None
+        elif use_numpy and np is None:
+            raise ImportError("use_numpy=True requires NumPy to be installed")
+
+        times = list(times)
+        keyframes = self.keyframes
+        if not keyframes:
+            value = self.value
+            if not isinstance(value, Shape):
+                raise TypeError(f"{self.match_name} is not a shape property")
+            static = value.to_arrays(use_numpy)
+            return [_copy_shape_arrays(static, use_numpy) for _ in times]
+
+        key_arrays: dict[int, ShapeArrays] = {}
+
+        def arrays_of(index: int) -> ShapeArrays:
+            arrays = key_arrays.get(index)
+            if arrays is None:
+                shape = keyframes[index].value
+                if not isinstance(shape, Shape):
+                    raise TypeError(f"{self.match_name} is not a shape property")
+                arrays = shape.to_arrays(use_numpy)
+                key_arrays[index] = arrays
+            return arrays
+
+        indices, progress = self._keyframe_curve().progress_at(times)
+        return _blend_shapes(arrays_of, indices, progress, use_numpy)
+
+    def _keyframe_curve(self, path_tolerance: float | None = None) -> KeyframeCurve:
+        """Return the compiled keyframe curve, rebuilding it when stale.
+
+        Keyframe setters drop the cached curve. It is also rebuilt when
+        the keyframe list is replaced, when the layer start time shifts
+        keyframe times, when resolved values are invalidated (e.g. a
+        composition resize rescales effect points), or when a different
+        *path_tolerance* is asked for.
+        """
+        curve = self._curve
+        frame_offset = self._frame_offset
+        if (
+            curve is None
+            or curve.keyframes is not self.keyframes
+            or len(curve) != len(self.keyframes)
+            or curve.is_spatial != self.is_spatial
+            or curve.path_tolerance != path_tolerance
+            or self._curve_frame_offset != frame_offset
+            or self._curve_epoch != _resolve_epoch
+        ):
+            curve = KeyframeCurve(self.keyframes, self.is_spatial, path_tolerance)
+            self._curve = curve
+            self._curve_frame_offset = frame_offset
+            self._curve_epoch = _resolve_epoch
+        return curve
 
     @property
     def _frame_offset(self) -> int:
@@ -1062,7 +1403,8 @@ class Property(PropertyBase):
         - Anchor Point: layer source dimensions.
         - All others: `None`.
 
-        On first access for effect points, also triggers
+        The scale is cached until `_invalidate_resolved_values` is
+        called. When it is computed for effect points, also triggers
         `_scale_effect_point_speeds` to set speed factors on keyframe ease
         objects.
         """
@@ -1072,6 +1414,9 @@ class Property(PropertyBase):
         if _sentinel in self.__dict__:
             result: list[float] | None = self.__dict__[_sentinel]
             return result
+        if self._scale_cache is not _UNSET and self._scale_epoch == _resolve_epoch:
+            cached: list[float] | None = self._scale_cache
+            return cached
 
         scale: list[float] | None = None
 
@@ -1097,11 +1442,26 @@ class Property(PropertyBase):
             self.__dict__[_sentinel] = scale
             self._scale_effect_point_speeds(scale)
             del self.__dict__[_sentinel]
+        self._scale_cache = scale
+        self._scale_epoch = _resolve_epoch
         return scale
 
     @_effect_scale.setter
     def _effect_scale(self, value: list[float] | None) -> None:
         self.__dict__["_effect_scale"] = value
+        self._invalidate_resolved_value()
+
+    def _on_ease_created(self, keyframe: Keyframe) -> None:
+        """Scale the speeds of ease objects created after the effect scale.
+
+        Ease objects are created lazily. Those created before the effect
+        scale is computed are scaled by `_scale_effect_point_speeds`.
+        """
+        if self._scale_cache is _UNSET or self._scale_epoch != _resolve_epoch:
+            return
+        scale = self._scale_cache
+        if scale is not None and self.match_name != "ADBE Anchor Point":
+            self._scale_keyframe_speeds(keyframe, keyframe._prev, keyframe._next, scale)
 
     def _scale_effect_point_speeds(self, scale: list[float]) -> None:
         """Set speed factor on BEZIER ease objects for effect point properties.
@@ -1111,30 +1471,45 @@ class Property(PropertyBase):
         depends on the direction of motion between adjacent keyframes and
         is stored on each `KeyframeEase._speed_factor` for lazy application.
         """
-        n = len(self.keyframes)
-        for i, kf in enumerate(self.keyframes):
-            for ease_list, other_idx in [
-                (kf._out_temporal_ease, i + 1),
-                (kf._in_temporal_ease, i - 1),
-            ]:
-                if not ease_list or other_idx < 0 or other_idx >= n:
-                    continue
-                other_kf = self.keyframes[other_idx]
-                val_a = kf.value
-                val_b = other_kf.value
-                if (
-                    not isinstance(val_a, list)
-                    or not isinstance(val_b, list)
-                    or len(val_a) < 2
-                    or len(val_b) < 2
-                ):
-                    continue
-                delta_px = [b - a for a, b in zip(val_a, val_b)]
-                delta_norm = [d / s if s else 0.0 for d, s in zip(delta_px, scale)]
-                dist_px = math.sqrt(sum(d * d for d in delta_px))
-                dist_norm = math.sqrt(sum(d * d for d in delta_norm))
-                if dist_norm == 0:
-                    continue
-                factor = dist_px / dist_norm
-                for ease in ease_list:
-                    ease._speed_factor = factor
+        keyframes = self.keyframes
+        n = len(keyframes)
+        for i, kf in enumerate(keyframes):
+            self._scale_keyframe_speeds(
+                kf,
+                keyframes[i - 1] if i > 0 else None,
+                keyframes[i + 1] if i < n - 1 else None,
+                scale,
+            )
+
+    def _scale_keyframe_speeds(
+        self,
+        kf: Keyframe,
+        prev_kf: Keyframe | None,
+        next_kf: Keyframe | None,
+        scale: list[float],
+    ) -> None:
+        """Set the speed factors of one keyframe's existing ease objects."""
+        for ease_list, other_kf in [
+            (kf._out_temporal_ease, next_kf),
+            (kf._in_temporal_ease, prev_kf),
+        ]:
+            if not ease_list or other_kf is None:
+                continue
+            val_a = kf.value
+            val_b = other_kf.value
+            if (
+                not isinstance(val_a, list)
+                or not isinstance(val_b, list)
+                or len(val_a) < 2
+                or len(val_b) < 2
+            ):
+                continue
+            delta_px = [b - a for a, b in zip(val_a, val_b)]
+            delta_norm = [d / s if s else 0.0 for d, s in zip(delta_px, scale)]
+            dist_px = math.sqrt(sum(d * d for d in delta_px))
+            dist_norm = math.sqrt(sum(d * d for d in delta_norm))
+            if dist_norm == 0:
+                continue
+            factor = dist_px / dist_norm
+            for ease in ease_list:
+                ease._speed_factor = factor
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 import typing
 from typing import Any, cast
 
@@ -69,7 +70,10 @@ class PropertyBase:
     ) -> None:
         self._tdsb = _tdsb
         self._name_utf8 = _name_utf8
-        self.match_name = match_name
+        # Interned so child lookups in `PropertyGroup.__getitem__` hash
+        # and compare stable string objects.
+        self.match_name = sys.intern(match_name)
+        self.parent_property = None
         self._auto_name = auto_name
         self.property_depth = property_depth
 
@@ -80,7 +84,6 @@ class PropertyBase:
         self.elided = False
         self.is_effect = False
         self.is_mask = False
-        self.parent_property = None
         self.property_type = PropertyType.NAMED_GROUP
 
     @property
@@ -98,6 +101,34 @@ class PropertyBase:
         else:
             self.__dict__["_selected"] = value
 
+    @property
+    def _auto_name(self) -> str | None:
+        """Override for [auto_name][], set from specs or effect param defs."""
+        return self.__dict__["_auto_name_value"]  # type: ignore[no-any-return]
+
+    @_auto_name.setter
+    def _auto_name(self, value: str | None) -> None:
+        self.__dict__["_auto_name_value"] = value
+        self._invalidate_parent_index()
+
+    def _invalidate_property_trees(self) -> None:
+        """Mark indexes built over the project's property trees as stale.
+
+        Properties not attached to a layer of a composition yet (while
+        parsing) belong to no project and are skipped.
+        """
+        layer = self if hasattr(self, "_ldta") else self._containing_layer
+        comp = getattr(layer, "_containing_comp", None)
+        if comp is not None:
+            comp._project._invalidate_property_trees()
+
+    def _invalidate_parent_index(self) -> None:
+        """Drop the parent group's child lookup index after a rename."""
+        self._invalidate_property_trees()
+        parent = self.parent_property
+        if parent is not None:
+            parent._child_index = None
+
     @property
     def auto_name(self) -> str:
         """The automatic (display) name derived from `match_name`."""
@@ -124,6 +155,7 @@ class PropertyBase:
         if self._name_utf8 is not None:
             self._name_utf8.contents = value + "\0"
             propagate_check(self._name_utf8)
+            self._invalidate_parent_index()
 
     @property
     def is_name_set(self) -> bool:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 import typing
 from typing import TYPE_CHECKING
 
@@ -67,9 +68,6 @@ class PropertyGroup(PropertyBase):
     See: https://ae-scripting.docsforadobe.dev/property/propertygroup/
     """
 
-    properties: list[Property | PropertyGroup]
-    """List of properties in this group. Read-only."""
-
     def __init__(
         self,
         *,
@@ -93,6 +91,10 @@ class PropertyGroup(PropertyBase):
         self._tdgp = _tdgp
         self._fnam_utf8 = _fnam_utf8
 
+        self._child_index: dict[str, Property | PropertyGroup] | None = None
+        self._child_index_size = 0
+        self._children_by_key: dict[str, list[Property | PropertyGroup]] = {}
+        self._children_by_key_source: dict[str, Property | PropertyGroup] | None = None
         self.properties = properties
 
         for child in self.properties:
@@ -173,6 +175,55 @@ class PropertyGroup(PropertyBase):
         self._tdsb = tdsb_chunk.body
         self._tdgp = tdgp_body
 
+    @property
+    def properties(self) -> list[Property | PropertyGroup]:
+        """List of properties in this group. Read-only."""
+        return self._properties
+
+    @properties.setter
+    def properties(self, value: list[Property | PropertyGroup]) -> None:
+        self._properties = value
+        self._child_index = None
+        self._invalidate_property_trees()
+
+    def _get_child_index(self) -> dict[str, Property | PropertyGroup]:
+        """Return the name -> child map backing string lookups.
+
+        Keys are each child's display name, match name and snake-cased
+        display name; the first child claiming a key wins, matching a
+        front-to-back scan. The map is dropped whenever `properties` is
+        reassigned or a child is renamed, and rebuilt if the list was
+        resized in place.
+        """
+        index = self._child_index
+        if index is None or self._child_index_size != len(self._properties):
+            index = {}
+            for prop in self._properties:
+                name = prop.name
+                index.setdefault(sys.intern(name), prop)
+                index.setdefault(prop.match_name, prop)
+                index.setdefault(sys.intern(name.lower().replace(" ", "_")), prop)
+            self._child_index = index
+            self._child_index_size = len(self._properties)
+        return index
+
+    def _get_children_by_key(self) -> dict[str, list[Property | PropertyGroup]]:
+        """Return the name -> children map backing path selectors.
+
+        Keys are each child's match name, display name and automatic
+        name. Unlike [_get_child_index][], every child claiming a key is
+        kept, in order. The map is rebuilt whenever the child index is.
+        """
+        index = self._get_child_index()
+        if self._children_by_key_source is not index:
+            by_key: dict[str, list[Property | PropertyGroup]] = {}
+            for prop in self._properties:
+                for key in {prop.match_name, prop.name, prop.auto_name}:
+                    by_key.setdefault(key, []).append(prop)
+            self._children_by_key = by_key
+            self._children_by_key_source = index
+        return self._children_by_key
+
     def __iter__(self) -> typing.Iterator[Property | PropertyGroup]:
         """Return an iterator over the properties in this group."""
         return iter(self.properties)
@@ -198,12 +249,12 @@ class PropertyGroup(PropertyBase):
             failed, so dataclass fields and `@property` descriptors
             always take priority.
         """
-        # Avoid infinite recursion during __init__ (before
-        # `properties` has been set on the instance).
-        try:
-            object.__getattribute__(self, "properties")
-        except AttributeError:
-            raise AttributeError(name) from None
+        # Private names are never child properties; bailing out early
+        # also avoids infinite recursion during __init__ (before
+        # `_properties` has been set on the instance) and keeps
+        # `hasattr(group, "_ldta")` probes cheap.
+        if name.startswith("_"):
+            raise AttributeError(name)
         try:
             return self[name]
         except KeyError:
@@ -236,14 +287,7 @@ class PropertyGroup(PropertyBase):
         if isinstance(key, int):
             return self.properties[key]
         if isinstance(key, str):
-            for prop in self.properties:
-                if (
-                    prop.name == key
-                    or prop.match_name == key
-                    or prop.name.lower().replace(" ", "_") == key
-                ):
-                    return prop
-            raise KeyError(key)
+            return self._get_child_index()[key]
         raise TypeError(f"Property key must be int or str, not {type(key).__name__}")
 
     @property
@@ -0,0 +1,386 @@
+"""Path selectors over the project model.
+
+A selector is a `/`-separated path that walks from project items down to
+layers and properties:
+
+```
+comp[name^=SH_]/layer[type=text]/ADBE Text Properties/ADBE Text Document
+```
+
+Each step is a head followed by zero or more `[attr op value]` filters.
+
+- The first step selects items: `comp`, `footage`, `folder` or `item`.
+  It may also be `layer`, which selects layers from every composition.
+- `layer` selects the layers of the compositions matched so far.
+- Any other head is a property key, matched against a child's match
+  name, display name or default (nice) name.
+- `*` matches any child property and `**` matches at any depth, so
+  `layer/**/ADBE Position` finds every Position property of a layer.
+  Properties found at any depth are yielded in document order, once
+  each.
+
+Supported filter operators are `=`, `!=`, `^=` (prefix), `$=` (suffix),
+`*=` (substring) and `~=` (regular expression search). Values may be
+quoted with `"` or `'` when they contain `/`, `]` or spaces at the edges.
+For layers, `type` compares against the binary layer type (`avlayer`,
+`shape`, `text`, `camera`, `light`, `three_d_model`). Other attributes
+are read with `getattr`; booleans compare as `true`/`false` and enum
+members by name.
+"""
+
+from __future__ import annotations
+
+import enum
+import operator
+import re
+import typing
+from functools import lru_cache
+from typing import Any, Callable
+
+from .items.composition import CompItem
+from .items.folder import FolderItem
+from .items.footage import FootageItem
+from .items.item import Item
+from .layers.layer import Layer
+from .properties.property_group import PropertyGroup
+
+if typing.TYPE_CHECKING:
+    from .project import Project
+
+
+_ITEM_HEADS: dict[str, type] = {
+    "comp": CompItem,
+    "composition": CompItem,
+    "footage": FootageItem,
+    "folder": FolderItem,
+    "item": Item,
+}
+
+_FILTER_RE = re.compile(
+    r"""\s*(?P<attr>[A-Za-z_][A-Za-z0-9_]*)\s*
+    (?P<op>!=|\^=|\$=|\*=|~=|=)\s*
+    (?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'|(?P<bare>[^\]]*?))\s*\]""",
+    re.VERBOSE,
+)
+
+
+def _opens_quote(current: list[str]) -> bool:
+    """Return whether a quote char after *current* starts a quoted value.
+
+    Quotes only count at the start of a step or right after a filter
+    operator, so apostrophes inside display names need no escaping.
+    """
+    preceding = "".join(current).rstrip()
+    return not preceding or preceding[-1] == "="
+
+
+def _split_steps(selector: str) -> list[str]:
+    """Split *selector* on `/` outside of brackets and quotes."""
+    steps: list[str] = []
+    current: list[str] = []
+    depth = 0
+    quote = ""
+    for char in selector:
+        if quote:
+            if char == quote:
+                quote = ""
+        elif char in "\"'" and _opens_quote(current):
+            quote = char
+        elif char == "[":
+            depth += 1
+        elif char == "]":
+            depth -= 1
+        elif char == "/" and depth == 0:
+            steps.append("".join(current).strip())
+            current = []
+            continue
+        current.append(char)
+    if quote or depth != 0:
+        raise ValueError(f"Unbalanced quotes or brackets in selector {selector!r}")
+    steps.append("".join(current).strip())
+    return steps
+
+
+def _attr_text(obj: Any, attr: str) -> str | None:
+    """Return the comparable text of *attr* on *obj*, or `None`."""
+    if attr == "type" and isinstance(obj, Layer):
+        return str(obj._ldta.layer_type.name)
+    try:
+        value = getattr(obj, attr)
+    except (AttributeError, KeyError):
+        return None
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, enum.Enum):
+        return value.name
+    return str(value)
+
+
+_OPERATORS: dict[str, Callable[[str, str], bool]] = {
+    "=": operator.eq,
+    "!=": operator.ne,
+    "^=": str.startswith,
+    "$=": str.endswith,
+    "*=": operator.contains,
+}
+
+
+def _compile_filter(attr: str, op: str, expected: str) -> Callable[[Any], bool]:
+    """Build a predicate for a single `[attr op value]` filter."""
+    if op == "~=":
+        pattern = re.compile(expected)
+
+        def compare(text: str) -> bool:
+            return pattern.search(text) is not None
+
+    else:
+        binary = _OPERATORS[op]
+
+        def compare(text: str) -> bool:
+            return binary(text, expected)
+
+    def predicate(obj: Any) -> bool:
+        text = _attr_text(obj, attr)
+        if text is None:
+            return op == "!="
+        return compare(text)
+
+    return predicate
+
+
+class _Step:
+    """One compiled selector step."""
+
+    __slots__ = ("kind", "key", "item_type", "filters", "recursive")
+
+    def __init__(
+        self,
+        kind: str,
+        key: str | None,
+        item_type: type | None,
+        filters: list[Callable[[Any], bool]],
+        recursive: bool,
+    ) -> None:
+        self.kind = kind
+        self.key = key
+        self.item_type = item_type
+        self.filters = filters
+        self.recursive = recursive
+
+    def accepts(self, obj: Any) -> bool:
+        return all(predicate(obj) for predicate in self.filters)
+
+
+def _parse_step(text: str, position: int, recursive: bool) -> _Step:
+    """Compile the text of one step."""
+    bracket = text.find("[")
+    head = (text if bracket < 0 else text[:bracket]).strip()
+    rest = "" if bracket < 0 else text[bracket:]
+
+    if len(head) >= 2 and head[0] == head[-1] and head[0] in "\"'":
+        head = head[1:-1]
+        quoted = True
+    else:
+        quoted = False
+    if not head:
+        raise ValueError(f"Empty selector step {text!r}")
+
+    filters: list[Callable[[Any], bool]] = []
+    while rest:
+        if rest[0] != "[":
+            raise ValueError(f"Unexpected {rest!r} in selector step {text!r}")
+        match = _FILTER_RE.match(rest, 1)
+        if match is None:
+            raise ValueError(f"Malformed filter in selector step {text!r}")
+        value = match.group("dq")
+        if value is None:
+            value = match.group("sq")
+        if value is None:
+            value = match.group("bare")
+        filters.append(_compile_filter(match.group("attr"), match.group("op"), value))
+        rest = rest[match.end() :].lstrip()
+
+    if not quoted and head in _ITEM_HEADS:
+        if position != 0:
+            raise ValueError(f"Item step {head!r} must be the first selector step")
+        return _Step("item", None, _ITEM_HEADS[head], filters, False)
+    if not quoted and head == "layer":
+        return _Step("layer", None, None, filters, False)
+    if position == 0:
+        raise ValueError(
+            f"Selector must start with an item or layer step, got {head!r}"
+        )
+    if not quoted and head == "*":
+        return _Step("property", None, None, filters, recursive)
+    return _Step("property", head, None, filters, recursive)
+
+
+class Selector:
+    """A compiled path selector.
+
+    Use [compile_selector][py_aep.models.selector.compile_selector] or
+    [Project.select][py_aep.models.project.Project.select] rather than
+    instantiating this class directly.
+
+    Example:
+        ```python
+        from py_aep.models.selector import compile_selector
+
+        selector = compile_selector("comp/layer[type=text]")
+        for layer in selector.select(project):
+            ...
+        ```
+    """
+
+    def __init__(self, selector: str) -> None:
+        self.selector = selector
+        self._steps: list[_Step] = []
+        recursive = False
+        for text in _split_steps(selector):
+            if text == "**":
+                if not self._steps:
+                    raise ValueError("Selector cannot start with '**'")
+                recursive = True
+                continue
+            self._steps.append(_parse_step(text, len(self._steps), recursive))
+            recursive = False
+        if recursive:
+            # Trailing `**` selects every descendant property.
+            self._steps.append(_Step("property", None, None, [], True))
+        if not self._steps:
+            raise ValueError(f"Empty selector {selector!r}")
+        for previous, step in zip(self._steps, self._steps[1:]):
+            if step.kind == "layer" and previous.kind != "item":
+                raise ValueError("A layer step must follow an item step")
+
+    def __repr__(self) -> str:
+        return f"Selector({self.selector!r})"
+
+    def select(self, project: Project) -> typing.Iterator[Any]:
+        """Lazily yield every object in *project* matching this selector.
+
+        Args:
+            project: The project to query.
+        """
+        results: typing.Iterable[Any] = (project,)
+        for step in self._steps:
+            results = self._apply(step, results, project)
+        return iter(results)
+
+    def _apply(
+        self,
+        step: _Step,
+        inputs: typing.Iterable[Any],
+        project: Project,
+    ) -> typing.Iterator[Any]:
+        if step.kind == "item":
+            item_type = step.item_type
+            assert item_type is not None
+            for item in project.items.values():
+                if isinstance(item, item_type) and step.accepts(item):
+                    yield item
+        elif step.kind == "layer":
+            for obj in inputs:
+                comps = project.compositions if obj is project else (obj,)
+                for comp in comps:
+                    if not isinstance(comp, CompItem):
+                        continue
+                    for layer in comp.layers:
+                        if step.accepts(layer):
+                            yield layer
+        elif not step.recursive:
+            for obj in inputs:
+                if isinstance(obj, PropertyGroup):
+                    for child in _matching_children(obj, step.key):
+                        if step.accepts(child):
+                            yield child
+        else:
+            # Input groups may be nested in each other, so descendants
+            # can be reached more than once.
+            seen: set[int] = set()
+            by_layer: dict[int, list[Any]] | None = None
+            for obj in inputs:
+                if not isinstance(obj, PropertyGroup):
+                    continue
+                found: typing.Iterable[Any] | None = None
+                if isinstance(obj, Layer) and step.key is not None:
+                    if by_layer is None:
+                        by_layer = _matches_by_layer(project, step.key)
+                    found = by_layer.get(id(obj)) if by_layer else None
+                if found is None:
+                    found = _matching_descendants(obj, step.key)
+                for prop in found:
+                    if id(prop) not in seen and step.accepts(prop):
+                        seen.add(id(prop))
+                        yield prop
+
+
+def _matches_by_layer(project: Project, key: str) -> dict[int, list[Any]]:
+    """Group the properties with match name *key* by layer.
+
+    Uses the project match name index, keyed by `id()` of every indexed
+    layer. Returns an empty dict when *key* is also the display name of
+    some property, since those matches are not in the index.
+    """
+    index = project._get_match_name_index()
+    if key in project._property_names:
+        return {}
+    by_layer: dict[int, list[Any]] = {
+        id(layer): [] for comp in project.compositions for layer in comp.layers
+    }
+    for match in index.get(key, ()):
+        found = by_layer.get(id(match.layer))
+        if found is not None:
+            found.append(match.property)
+    return by_layer
+
+
+def _matching_children(group: PropertyGroup, key: str | None) -> typing.Sequence[Any]:
+    """Return the children of *group* whose match name or name is *key*.
+
+    Unlike `group[key]`, every match is returned so duplicate effects
+    with the same match name are all selected.
+    """
+    if key is None:
+        return group.properties
+    return group._get_children_by_key().get(key, ())
+
+
+def _matching_descendants(root: PropertyGroup, key: str | None) -> typing.Iterator[Any]:
+    """Yield the descendants of *root* matching *key*, in document order."""
+    stack: list[tuple[PropertyGroup, Any]] = [
+        (root, child) for child in reversed(root.properties)
+    ]
+    # Ids of the matching children of each group visited.
+    matches: dict[int, set[int]] = {}
+    while stack:
+        group, prop = stack.pop()
+        if key is None:
+            yield prop
+        else:
+            ids = matches.get(id(group))
+            if ids is None:
+                ids = {id(child) for child in _matching_children(group, key)}
+                matches[id(group)] = ids
+            if id(prop) in ids:
+                yield prop
+        if isinstance(prop, PropertyGroup):
+            stack.extend((prop, child) for child in reversed(prop.properties))
+
+
+@lru_cache(maxsize=256)
+def compile_selector(selector: str) -> Selector:
+    """Compile *selector* into a reusable [Selector][].
+
+    Compiled selectors are cached, so calling this repeatedly with the
+    same string is cheap.
+
+    Args:
+        selector: The selector path.
+
+    Raises:
+        ValueError: If the selector is malformed.
+    """
+    return Selector(selector)
@@ -0,0 +1,352 @@
+"""Streaming JSON serialization of the project model.
+
+[Project.write_json][py_aep.models.project.Project.write_json] walks the
+object graph and writes JSON text to a file object as it goes, instead of
+building a nested dict and a single output string first. Memory use stays
+proportional to the nesting depth rather than to the project size.
+
+Model objects are serialized generically: every public annotated field,
+chunk-backed descriptor and `@property` becomes a key, enums are written
+as their value, and fields that would re-enter the object graph (parents,
+sources, owning compositions) are skipped. This is the same structure
+`aep-validate` compares against ExtendScript exports.
+"""
+
+from __future__ import annotations
+
+import math
+import typing
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from json.encoder import encode_basestring_ascii
+from types import GeneratorType
+from typing import Any, Callable, TextIO
+
+# Fields to skip to avoid circular references.
+# Back-references: containing_comp, parent_folder, parent (OutputModule),
+#   _parent (Layer).
+# Cross-references that re-enter the object graph: _source (AVLayer > Item),
+#   comp (RenderQueueItem > CompItem),
+#   post_render_target_comp (OutputModule > CompItem).
+# The non-circular ID fields (source_id, parent_id) are still serialized.
+SKIP_FIELDS = {
+    "containing_comp",
+    "parent_folder",
+    "parent_property",
+    "parent",
+    "comp",
+    "post_render_target_comp",
+    # Internal marker property (Property with keyframes); compared
+    # separately via _compare_markers.
+    "marker_property",
+    # Cross-reference: LightLayer.light_source > Layer
+    "light_source",
+}
+
+# @property attributes that return complex/duplicate data and should not be
+# serialized.
+SKIP_PROPERTIES = {
+    "active_camera",
+    "composition_layers",
+    "footage_layers",
+    "selected_layers",
+    # Circular: AVLayer.source > Item > layers > AVLayer...
+    "source",
+    # Circular: AVLayer.track_matte_layer > AVLayer
+    "track_matte_layer",
+    # Circular: AVItem.used_in > list[CompItem] > layers > source > AVItem...
+    "used_in",
+    # Duplicate/circular: Project re-serializes items already in `items` field
+    "compositions",
+    "folders",
+    "footages",
+    # Layer @property accessors derived from Layer.properties - serializing
+    # them would duplicate data already present in the properties list.
+    "transform",
+    "effects",
+    "masks",
+    "text",
+    # Duplicate: Property.separation_leader > Property
+    "separation_leader",
+    # Layer.marker @property: duplicates ADBE Marker in properties tree.
+    "marker",
+}
+
+PRIMITIVE_TYPES = (int, float, str, bool, type(None))
+
+_field_names_cache: dict[type, frozenset[str] | None] = {}
+
+
+def get_field_names(obj: Any) -> frozenset[str] | None:
+    """Get serializable field names for model objects.
+
+    Supports both `@dataclass` models and plain-class models that use
+    type annotations and/or chunk-backed descriptors (e.g. the Item
+    hierarchy after the descriptor conversion).
+
+    Results are cached per type since field names are class-level metadata.
+
+    Returns:
+        The field names, or `None` if *obj* is not a model object.
+    """
+    cls = type(obj)
+    if cls in _field_names_cache:
+        return _field_names_cache[cls]
+
+    names: set[str] = set()
+    if is_dataclass(obj) and not isinstance(obj, type):
+        names = {f.name for f in fields(obj)}
+    # Collect annotations and chunk-backed descriptors from the full MRO.
+    # This covers plain-class models and also dataclass subclasses that
+    # add chunk descriptors in non-dataclass bases (e.g. Layer extends
+    # PropertyGroup with ChunkField descriptors).
+    for base in reversed(cls.__mro__):
+        if base is object:
+            continue
+        for name in getattr(base, "__annotations__", {}):
+            if not name.startswith("_"):
+                names.add(name)
+        for name, attr in vars(base).items():
+            if hasattr(attr, "chunk_attr") and hasattr(attr, "__get__"):
+                names.add(name)
+    if names:
+        result = frozenset(names)
+        _field_names_cache[cls] = result
+        return result
+    # Check for public @property definitions (descriptor-backed classes
+    # that replaced all class-level annotations with properties).
+    for base in reversed(cls.__mro__):
+        if base is object:
+            continue
+        for name, attr in vars(base).items():
+            if not name.startswith("_") and isinstance(attr, property):
+                names.add(name)
+    result2: frozenset[str] | None = frozenset(names) if names else None
+    _field_names_cache[cls] = result2
+    return result2
+
+
+_property_names_cache: dict[type, frozenset[str]] = {}
+
+
+def get_property_names(cls: type) -> frozenset[str]:
+    """Get public @property names for a class, cached per type."""
+    if cls in _property_names_cache:
+        return _property_names_cache[cls]
+    names: set[str] = set()
+    for name in dir(cls):
+        if name.startswith("_") or name in SKIP_FIELDS or name in SKIP_PROPERTIES:
+            continue
+        attr = getattr(cls, name, None)
+        if isinstance(attr, property):
+            names.add(name)
+    result = frozenset(names)
+    _property_names_cache[cls] = result
+    return result
+
+
+def iter_model_fields(
+    obj: Any,
+    field_names: frozenset[str],
+) -> typing.Iterator[tuple[str, Any]]:
+    """Yield `(name, value)` for every serializable attribute of *obj*.
+
+    Fields come first, then `@property` attributes, each in sorted order.
+    Attributes that raise while being read are left out.
+
+    Args:
+        obj: A model object.
+        field_names: The result of [get_field_names][] for *obj*.
+    """
+    seen: set[str] = set()
+    for name in sorted(field_names):
+        if name in SKIP_FIELDS:
+            continue
+        try:
+            value = getattr(obj, name)
+        except AttributeError:
+            continue
+        seen.add(name)
+        yield name, value
+    for name in sorted(get_property_names(type(obj))):
+        if name in seen:
+            continue
+        try:
+            value = getattr(obj, name)
+        except Exception:  # properties may raise on missing data
+            continue
+        yield name, value
+
+
+def _encode_float(value: float) -> str:
+    """Encode *value* the way `json.dumps` does."""
+    if value != value:
+        return "NaN"
+    if value == math.inf:
+        return "Infinity"
+    if value == -math.inf:
+        return "-Infinity"
+    return float.__repr__(value)
+
+
+def _encode_key(key: Any) -> str:
+    """Encode a dict key, converting non-string keys like `json.dumps`."""
+    if isinstance(key, str):
+        return encode_basestring_ascii(key)
+    if isinstance(key, bool):
+        return '"true"' if key else '"false"'
+    if key is None:
+        return '"null"'
+    if isinstance(key, Enum):
+        key = key.value
+    if isinstance(key, float):
+        return '"' + _encode_float(key) + '"'
+    return encode_basestring_ascii(str(key))
+
+
+class _Encoder:
+    """Turns values into a stream of JSON text chunks."""
+
+    def __init__(
+        self,
+        depth: int | None,
+        indent: int | None,
+        default: Callable[[Any], Any] | None,
+    ) -> None:
+        self.depth = depth
+        self.indent = indent
+        self.default = default
+        self.item_separator = "," if indent is not None else ", "
+
+    def newline(self, level: int) -> str:
+        if self.indent is None:
+            return ""
+        return "\n" + " " * (self.indent * level)
+
+    def encode(
+        self,
+        value: Any,
+        level: int,
+        nesting: int,
+        include: frozenset[str] | None = None,
+    ) -> typing.Iterator[str]:
+        if isinstance(value, str):
+            yield encode_basestring_ascii(value)
+        elif value is None:
+            yield "null"
+        elif value is True:
+            yield "true"
+        elif value is False:
+            yield "false"
+        elif isinstance(value, Enum):
+            yield from self.encode(value.value, level, nesting)
+        elif isinstance(value, int):
+            yield int.__repr__(value)
+        elif isinstance(value, float):
+            yield _encode_float(value)
+        elif isinstance(value, (list, tuple, GeneratorType)):
+            yield from self.encode_array(value, level, nesting)
+        elif isinstance(value, dict):
+            yield from self.encode_object(value.items(), level, nesting)
+        elif self.default is not None:
+            yield from self.encode(self.default(value), level, nesting)
+        else:
+            field_names = get_field_names(value)
+            if field_names is None:
+                yield encode_basestring_ascii(str(value))
+            elif self.depth is not None and nesting > self.depth:
+                yield "null"
+            else:
+                members = iter_model_fields(value, field_names)
+                if include is not None:
+                    members = (m for m in members if m[0] in include)
+                yield from self.encode_object(members, level, nesting + 1)
+
+    def encode_array(
+        self,
+        values: typing.Iterable[Any],
+        level: int,
+        nesting: int,
+    ) -> typing.Iterator[str]:
+        separator = "["
+        for item in values:
+            yield separator + self.newline(level + 1)
+            yield from self.encode(item, level + 1, nesting)
+            separator = self.item_separator
+        if separator == "[":
+            yield "[]"
+        else:
+            yield self.newline(level) + "]"
+
+    def encode_object(
+        self,
+        members: typing.Iterable[tuple[Any, Any]],
+        level: int,
+        nesting: int,
+    ) -> typing.Iterator[str]:
+        separator = "{"
+        for key, item in members:
+            yield separator + self.newline(level + 1) + _encode_key(key) + ": "
+            yield from self.encode(item, level + 1, nesting)
+            separator = self.item_separator
+        if separator == "{":
+            yield "{}"
+        else:
+            yield self.newline(level) + "}"
+
+
+def iter_json(
+    obj: Any,
+    depth: int | None = None,
+    include: typing.Iterable[str] | None = None,
+    indent: int | None = None,
+    default: Callable[[Any], Any] | None = None,
+) -> typing.Iterator[str]:
+    """Lazily yield the JSON text of *obj* in small chunks.
+
+    Lists, tuples and generators are written as arrays and dicts as
+    objects. Model objects become objects of their serializable fields.
+    Any other value is written as its `str()`.
+
+    Args:
+        obj: The value to serialize.
+        depth: Model objects nested more than *depth* levels below *obj*
+            are written as `null`. `None` means no limit.
+        include: When *obj* is a model object, only write these
+            top-level fields (e.g. `{"items", "render_queue"}`).
+        indent: Indent nested values by this many spaces. `None` writes
+            everything on one line.
+        default: Called for values that are not JSON types, like the
+            `default` argument of `json.dumps`. Its result is serialized
+            in place of the value, bypassing the model object walk.
+    """
+    encoder = _Encoder(depth, indent, default)
+    names = frozenset(include) if include is not None else None
+    return encoder.encode(obj, 0, 0, names)
+
+
+def write_json(
+    obj: Any,
+    fp: TextIO,
+    depth: int | None = None,
+    include: typing.Iterable[str] | None = None,
+    indent: int | None = None,
+    default: Callable[[Any], Any] | None = None,
+) -> None:
+    """Serialize *obj* as JSON to the text file *fp*, incrementally.
+
+    Chunks are batched into moderately sized writes, so the full document
+    is never held in memory. See [iter_json][] for the arguments.
+    """
+    buffer: list[str] = []
+    size = 0
+    for chunk in iter_json(
+        obj, depth=depth, include=include, indent=indent, default=default
+    ):
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= 65536:
+            fp.write("".join(buffer))
+            buffer.clear()
+            size = 0
+    fp.write("".join(buffer))
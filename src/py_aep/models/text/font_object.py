@@ -30,13 +30,18 @@ class FontObject:
     Note:
         This functionality was added in After Effects 24.0.
 
+    Fonts are shared by all text documents of a project that use them,
+    so their fields are read-only.
+
     See: https://ae-scripting.docsforadobe.dev/text/fontobject/
     """
 
-    post_script_name: str = CosField("_font_data", "0", transform=str, default="")  # type: ignore[assignment]
+    post_script_name: str = CosField(
+        "_font_data", "0", transform=str, default="", read_only=True
+    )  # type: ignore[assignment]
     """The PostScript name of the font. Read-only."""
 
-    version: str | None = CosField("_font_data", "5", transform=str)  # type: ignore[assignment]
+    version: str | None = CosField("_font_data", "5", transform=str, read_only=True)  # type: ignore[assignment]
     """The version number of the font. Read-only."""
 
     def __init__(
@@ -247,6 +247,7 @@ class TextDocument:
         _fonts: list[FontObject] | None = None,
         _cos_data: dict[str, Any] | None = None,
         _btdk_body: Any | None = None,
+        _cos_writes: CosWriteQueue | None = None,
         # Fallback kwargs for fields without COS backing
         text: str | None = None,
         font: str | None = None,
@@ -262,6 +263,7 @@ class TextDocument:
         self._fonts = _fonts or []
         self._cos_data = _cos_data
         self._btdk_body = _btdk_body
+        self._cos_writes = _cos_writes
         # Instance overrides for non-descriptor fields
         if text is not None:
             self.__dict__["text"] = text
@@ -533,7 +535,58 @@ class TextDocument:
     # -- COS write-back ----------------------------------------------------
 
     def _propagate_cos(self) -> None:
-        """Serialize COS data back to the btdk chunk's binary_data."""
-        if self._cos_data is not None and self._btdk_body is not None:
-            self._btdk_body.binary_data = serialize(self._cos_data)
-            propagate_check(self._btdk_body)
+        """Write the COS data back to the btdk chunk's binary_data.
+
+        Documents of a project queue the write in the project's
+        [CosWriteQueue][], so a document edited many times is only
+        serialized once.
+        """
+        if self._cos_data is None or self._btdk_body is None:
+            return
+        if self._cos_writes is not None:
+            self._cos_writes.add(self._btdk_body, self._cos_data)
+        else:
+            _write_cos(self._btdk_body, self._cos_data)
+
+
+class CosWriteQueue:
+    """Edited text documents waiting to be written back to their btdk chunks.
+
+    Each project keeps one queue for its text documents. Until it is
+    flushed, the `binary_data` of an edited btdk chunk and the chunk sizes
+    are stale: code reading them calls [flush][py_aep.models.text.text_document.CosWriteQueue.flush] with the chunk
+    body first. [Project.save][py_aep.models.project.Project.save] flushes
+    the whole queue before writing.
+    """
+
+    def __init__(self) -> None:
+        # Edited btdk chunk bodies, mapped to their COS data.
+        self._writes: dict[Any, dict[str, Any]] = {}
+        # Number of edits queued so far, to invalidate derived caches.
+        self.edit_count = 0
+
+    def add(self, btdk_body: Any, cos_data: dict[str, Any]) -> None:
+        """Queue the write-back of *cos_data* to *btdk_body*."""
+        self._writes[btdk_body] = cos_data
+        self.edit_count += 1
+
+    def flush(self, btdk_body: Any | None = None) -> None:
+        """Serialize queued documents back to their btdk chunks.
+
+        Args:
+            btdk_body: Only write back the document of this chunk body.
+                `None` writes back every queued document.
+        """
+        if btdk_body is not None:
+            cos_data = self._writes.pop(btdk_body, None)
+            if cos_data is not None:
+                _write_cos(btdk_body, cos_data)
+            return
+        while self._writes:
+            _write_cos(*self._writes.popitem())
+
+
+def _write_cos(btdk_body: Any, cos_data: dict[str, Any]) -> None:
+    """Serialize *cos_data* to *btdk_body* and update the chunk sizes."""
+    btdk_body.binary_data = serialize(cos_data)
+    propagate_check(btdk_body)
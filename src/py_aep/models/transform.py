@@ -0,0 +1,451 @@
+"""Layer transform matrices.
+
+[Layer.transform_matrix_at][py_aep.models.layers.layer.Layer.transform_matrix_at]
+and [Layer.world_matrix_at][py_aep.models.layers.layer.Layer.world_matrix_at]
+compose the Transform properties of a layer into 4x4 matrices.
+
+Matrices are nested row-major lists that map column vectors: a point
+`[x, y, z]` in layer space lands at `M @ [x, y, z, 1]` in the parent's
+space (transform matrix) or in composition space (world matrix). Like in
+After Effects, the x axis points right, the y axis down and the z axis
+away from the viewer.
+
+A layer's transform matrix is built as
+
+```
+translate(position) @ auto_orient @ orientation
+    @ rotate_x @ rotate_y @ rotate_z @ scale @ translate(-anchor_point)
+```
+
+2D layers ignore the z components, orientation and the x and y
+rotations. Cameras and lights have no anchor offset or scale; with
+auto-orient towards their point of interest they look at it along their
+z axis. Separated X / Y / Z Position properties are used when the
+position dimensions are separated. Expressions are not evaluated.
+
+A [TransformEvaluator][] computes the matrices of many layers at a shared
+set of times. Each layer's properties are evaluated once for the whole
+batch, and each layer's world matrices are computed once, however many
+children share it as a parent.
+"""
+
+from __future__ import annotations
+
+import math
+import typing
+from typing import List
+
+from py_aep.enums import AutoOrientType
+
+from .properties.property import Property
+
+if typing.TYPE_CHECKING:
+    from .layers.layer import Layer
+
+Matrix = List[List[float]]
+"""A 4x4 row-major matrix."""
+
+_POINT_OF_INTEREST_LAYERS = {"ADBE Camera Layer", "ADBE Light Layer"}
+
+# Time step (seconds) of the central difference used to find the
+# direction of travel for auto-orient along path.
+_TANGENT_STEP = 1e-4
+
+
+def identity_matrix() -> Matrix:
+    """Return a new 4x4 identity matrix."""
+    return [
+        [1.0, 0.0, 0.0, 0.0],
+        [0.0, 1.0, 0.0, 0.0],
+        [0.0, 0.0, 1.0, 0.0],
+        [0.0, 0.0, 0.0, 1.0],
+    ]
+
+
+def multiply_matrices(a: Matrix, b: Matrix) -> Matrix:
+    """Return the matrix product `a @ b` of two 4x4 matrices."""
+    b0, b1, b2, b3 = b
+    return [
+        [
+            r[0] * b0[0] + r[1] * b1[0] + r[2] * b2[0] + r[3] * b3[0],
+            r[0] * b0[1] + r[1] * b1[1] + r[2] * b2[1] + r[3] * b3[1],
+            r[0] * b0[2] + r[1] * b1[2] + r[2] * b2[2] + r[3] * b3[2],
+            r[0] * b0[3] + r[1] * b1[3] + r[2] * b2[3] + r[3] * b3[3],
+        ]
+        for r in a
+    ]
+
+
+def transform_point(matrix: Matrix, point: typing.Sequence[float]) -> list[float]:
+    """Map a 2D or 3D *point* through *matrix*.
+
+    Args:
+        matrix: A 4x4 affine matrix.
+        point: `[x, y]` or `[x, y, z]`. A missing z is taken as `0`.
+
+    Returns:
+        The transformed `[x, y, z]`.
+    """
+    x, y = point[0], point[1]
+    z = point[2] if len(point) > 2 else 0.0
+    return [r[0] * x + r[1] * y + r[2] * z + r[3] for r in matrix[:3]]
+
+
+def _translation(x: float, y: float, z: float) -> Matrix:
+    return [
+        [1.0, 0.0, 0.0, x],
+        [0.0, 1.0, 0.0, y],
+        [0.0, 0.0, 1.0, z],
+        [0.0, 0.0, 0.0, 1.0],
+    ]
+
+
+def _scaling(x: float, y: float, z: float) -> Matrix:
+    return [
+        [x, 0.0, 0.0, 0.0],
+        [0.0, y, 0.0, 0.0],
+        [0.0, 0.0, z, 0.0],
+        [0.0, 0.0, 0.0, 1.0],
+    ]
+
+
+def _rotation_x(degrees: float) -> Matrix:
+    c = math.cos(math.radians(degrees))
+    s = math.sin(math.radians(degrees))
+    return [
+        [1.0, 0.0, 0.0, 0.0],
+        [0.0, c, -s, 0.0],
+        [0.0, s, c, 0.0],
+        [0.0, 0.0, 0.0, 1.0],
+    ]
+
+
+def _rotation_y(degrees: float) -> Matrix:
+    c = math.cos(math.radians(degrees))
+    s = math.sin(math.radians(degrees))
+    return [
+        [c, 0.0, s, 0.0],
+        [0.0, 1.0, 0.0, 0.0],
+        [-s, 0.0, c, 0.0],
+        [0.0, 0.0, 0.0, 1.0],
+    ]
+
+
+def _rotation_z(degrees: float) -> Matrix:
+    # With the y axis pointing down, positive angles turn clockwise on
+    # screen, like the Rotation property.
+    c = math.cos(math.radians(degrees))
+    s = math.sin(math.radians(degrees))
+    return [
+        [c, -s, 0.0, 0.0],
+        [s, c, 0.0, 0.0],
+        [0.0, 0.0, 1.0, 0.0],
+        [0.0, 0.0, 0.0, 1.0],
+    ]
+
+
+def _normalize(v: list[float]) -> list[float] | None:
+    length = math.sqrt(v[0] * v[0] + v[1] * v[1] + v[2] * v[2])
+    if length < 1e-12:
+        return None
+    return [v[0] / length, v[1] / length, v[2] / length]
+
+
+def _cross(a: list[float], b: list[float]) -> list[float]:
+    return [
+        a[1] * b[2] - a[2] * b[1],
+        a[2] * b[0] - a[0] * b[2],
+        a[0] * b[1] - a[1] * b[0],
+    ]
+
+
+def _basis(x: list[float], y: list[float], z: list[float]) -> Matrix:
+    """Return the rotation whose columns are the axes *x*, *y* and *z*."""
+    return [
+        [x[0], y[0], z[0], 0.0],
+        [x[1], y[1], z[1], 0.0],
+        [x[2], y[2], z[2], 0.0],
+        [0.0, 0.0, 0.0, 1.0],
+    ]
+
+
+def _look_along(forward: list[float]) -> Matrix:
+    """Rotation turning the z axis towards *forward*, keeping y down."""
+    z = _normalize(forward)
+    if z is None:
+        return identity_matrix()
+    x = _normalize(_cross([0.0, 1.0, 0.0], z))
+    if x is None:  # looking straight up or down
+        x = [1.0, 0.0, 0.0]
+    return _basis(x, _cross(z, x), z)
+
+
+def _orient_along(tangent: list[float]) -> Matrix:
+    """Rotation turning the x axis along *tangent*, keeping z away."""
+    x = _normalize(tangent)
+    if x is None:
+        return identity_matrix()
+    z = _normalize([-x[2] * x[0], -x[2] * x[1], 1.0 - x[2] * x[2]])
+    if z is None:  # travelling along the z axis
+        z = _normalize(_cross(x, [0.0, 1.0, 0.0])) or [1.0, 0.0, 0.0]
+    return _basis(x, _cross(z, x), z)
+
+
+def _invert_affine(m: Matrix) -> Matrix:
+    """Invert an affine 4x4 matrix."""
+    a, b, c = m[0][0], m[0][1], m[0][2]
+    d, e, f = m[1][0], m[1][1], m[1][2]
+    g, h, i = m[2][0], m[2][1], m[2][2]
+    co_a = e * i - f * h
+    co_b = f * g - d * i
+    co_c = d * h - e * g
+    det = a * co_a + b * co_b + c * co_c
+    if abs(det) < 1e-12:
+        raise ValueError("Matrix is not invertible")
+    inv = [
+        [co_a / det, (c * h - b * i) / det, (b * f - c * e) / det],
+        [co_b / det, (a * i - c * g) / det, (c * d - a * f) / det],
+        [co_c / det, (b * g - a * h) / det, (a * e - b * d) / det],
+    ]
+    tx, ty, tz = m[0][3], m[1][3], m[2][3]
+    result = [[*row, -(row[0] * tx + row[1] * ty + row[2] * tz)] for row in inv]
+    result.append([0.0, 0.0, 0.0, 1.0])
+    return result
+
+
+def _as_vector(value: typing.Any, size: int, fill: float) -> list[float]:
+    """Pad or truncate a scalar or list *value* to *size* floats."""
+    if isinstance(value, (int, float)):
+        components = [float(value)]
+    else:
+        components = [float(v) for v in value]
+    return (components + [fill] * size)[:size]
+
+
+class TransformEvaluator:
+    """Computes layer matrices at a fixed set of times.
+
+    Results are memoized per layer for the lifetime of the evaluator, so
+    a parent shared by many children, or a camera that several layers
+    orient towards, is evaluated once. Build a new evaluator after
+    editing the project.
+
+    Example:
+        ```python
+        evaluator = TransformEvaluator([frame / 24 for frame in range(240)])
+        for layer in comp.layers:
+            matrices = evaluator.world_matrices(layer)
+        ```
+
+    Args:
+        times: Composition times in seconds.
+    """
+
+    def __init__(self, times: typing.Iterable[float]) -> None:
+        self.times = [float(t) for t in times]
+        self._local: dict[int, list[Matrix]] = {}
+        self._world: dict[int, list[Matrix]] = {}
+        self._in_progress: set[int] = set()
+
+    def local_matrices(self, layer: Layer) -> list[Matrix]:
+        """Return the transform matrices of *layer* relative to its parent.
+
+        Args:
+            layer: The layer to evaluate.
+
+        Returns:
+            One matrix per time.
+        """
+        cached = self._local.get(layer.id)
+        if cached is None:
+            cached = self._compute_local(layer)
+            self._local[layer.id] = cached
+        return cached
+
+    def world_matrices(self, layer: Layer) -> list[Matrix]:
+        """Return the layer-to-composition matrices of *layer*.
+
+        Args:
+            layer: The layer to evaluate.
+
+        Returns:
+            One matrix per time.
+
+        Raises:
+            ValueError: If the layer's parent chain loops.
+        """
+        cached = self._world.get(layer.id)
+        if cached is not None:
+            return cached
+        if layer.id in self._in_progress:
+            raise ValueError(f"Parent chain of layer {layer.name!r} loops")
+        self._in_progress.add(layer.id)
+        try:
+            local = self.local_matrices(layer)
+            parent = layer.parent
+            if parent is None:
+                cached = local
+            else:
+                cached = [
+                    multiply_matrices(p, m)
+                    for p, m in zip(self.world_matrices(parent), local)
+                ]
+        finally:
+            self._in_progress.discard(layer.id)
+        self._world[layer.id] = cached
+        return cached
+
+    def _values(
+        self,
+        layer: Layer,
+        match_name: str,
+        default: typing.Any,
+        times: list[float] | None = None,
+    ) -> list[typing.Any]:
+        """Evaluate a Transform property of *layer* at *times*."""
+        if times is None:
+            times = self.times
+        prop = layer.transform._get_child_index().get(match_name)
+        if not isinstance(prop, Property):
+            return [default] * len(times)
+        return typing.cast(
+            List[typing.Any], prop.values_at_times(times, use_numpy=False)
+        )
+
+    def _positions(
+        self, layer: Layer, times: list[float] | None = None
+    ) -> list[list[float]]:
+        """Evaluate the position of *layer*, joining separated dimensions."""
+        leader = layer.transform._get_child_index().get("ADBE Position")
+        if isinstance(leader, Property) and leader.dimensions_separated:
+            columns = [
+                self._values(layer, f"ADBE Position_{dim}", 0.0, times)
+                for dim in range(3)
+            ]
+            return [[float(x), float(y), float(z)] for x, y, z in zip(*columns)]
+        return [
+            _as_vector(value, 3, 0.0)
+            for value in self._values(layer, "ADBE Position", [0.0, 0.0, 0.0], times)
+        ]
+
+    def _compute_local(self, layer: Layer) -> list[Matrix]:
+        is_poi_layer = layer.match_name in _POINT_OF_INTEREST_LAYERS
+        is_3d = is_poi_layer or bool(getattr(layer, "three_d_layer", False))
+        auto_orient = layer.auto_orient
+        count = len(self.times)
+
+        positions = self._positions(layer)
+        anchors = [
+            _as_vector(v, 3, 0.0)
+            for v in self._values(layer, "ADBE Anchor Point", [0.0, 0.0, 0.0])
+        ]
+        rotate_z = self._values(layer, "ADBE Rotate Z", 0.0)
+        if is_3d:
+            orientations = [
+                _as_vector(v, 3, 0.0)
+                for v in self._values(layer, "ADBE Orientation", [0.0, 0.0, 0.0])
+            ]
+            rotate_x = self._values(layer, "ADBE Rotate X", 0.0)
+            rotate_y = self._values(layer, "ADBE Rotate Y", 0.0)
+        else:
+            for vector in positions + anchors:
+                vector[2] = 0.0
+
+        auto: list[Matrix | None] = [None] * count
+        if auto_orient == AutoOrientType.ALONG_PATH:
+            auto = self._along_path(layer, is_3d)
+        elif auto_orient == AutoOrientType.CAMERA_OR_POINT_OF_INTEREST and is_3d:
+            if is_poi_layer:
+                auto = [
+                    _look_along([a[0] - p[0], a[1] - p[1], a[2] - p[2]])
+                    for p, a in zip(positions, anchors)
+                ]
+            else:
+                auto = self._toward_camera(layer, positions)
+
+        if not is_poi_layer:
+            scales = [
+                _as_vector(v, 3, 100.0)
+                for v in self._values(layer, "ADBE Scale", [100.0, 100.0, 100.0])
+            ]
+
+        matrices: list[Matrix] = []
+        for i in range(count):
+            m = _translation(*positions[i])
+            if auto[i] is not None:
+                m = multiply_matrices(m, typing.cast(Matrix, auto[i]))
+            if is_3d:
+                ox, oy, oz = orientations[i]
+                for rotation in (
+                    _rotation_x(ox),
+                    _rotation_y(oy),
+                    _rotation_z(oz),
+                    _rotation_x(rotate_x[i]),
+                    _rotation_y(rotate_y[i]),
+                ):
+                    m = multiply_matrices(m, rotation)
+            m = multiply_matrices(m, _rotation_z(rotate_z[i]))
+            if not is_poi_layer:
+                sx, sy, sz = scales[i]
+                m = multiply_matrices(
+                    m, _scaling(sx / 100.0, sy / 100.0, sz / 100.0 if is_3d else 1.0)
+                )
+                ax, ay, az = anchors[i]
+                m = multiply_matrices(m, _translation(-ax, -ay, -az))
+            matrices.append(m)
+        return matrices
+
+    def _along_path(self, layer: Layer, is_3d: bool) -> list[Matrix | None]:
+        """Rotations turning *layer*'s x axis along its direction of travel."""
+        before = self._positions(layer, [t - _TANGENT_STEP for t in self.times])
+        after = self._positions(layer, [t + _TANGENT_STEP for t in self.times])
+        result: list[Matrix | None] = []
+        for a, b in zip(before, after):
+            tangent = [b[0] - a[0], b[1] - a[1], b[2] - a[2] if is_3d else 0.0]
+            result.append(_orient_along(tangent))
+        return result
+
+    def _toward_camera(
+        self, layer: Layer, positions: list[list[float]]
+    ) -> list[Matrix | None]:
+        """Rotations turning *layer*'s front towards the active camera."""
+        comp = layer.containing_comp
+        cameras = comp.camera_layers
+        parent = layer.parent
+        parent_inverse = (
+            [_invert_affine(m) for m in self.world_matrices(parent)]
+            if parent is not None
+            else None
+        )
+        result: list[Matrix | None] = []
+        for i, time in enumerate(self.times):
+            camera = next((c for c in cameras if c.active_at_time(time)), None)
+            if camera is None:
+                result.append(None)
+                continue
+            world = self.world_matrices(camera)[i]
+            eye = [world[0][3], world[1][3], world[2][3]]
+            if parent_inverse is not None:
+                eye = transform_point(parent_inverse[i], eye)
+            p = positions[i]
+            # Layers face their viewer along -z.
+            result.append(_look_along([p[0] - eye[0], p[1] - eye[1], p[2] - eye[2]]))
+        return result
+
+
+def world_matrices(
+    layers: typing.Iterable[Layer],
+    times: typing.Iterable[float],
+) -> dict[int, list[Matrix]]:
+    """Return the world matrices of many layers at many times.
+
+    Args:
+        layers: The layers to evaluate. Their parents are evaluated as
+            needed, once each.
+        times: Composition times in seconds.
+
+    Returns:
+        One matrix per time for each layer, keyed by layer id.
+    """
+    evaluator = TransformEvaluator(times)
+    return {layer.id: evaluator.world_matrices(layer) for layer in layers}
@@ -93,7 +93,7 @@ def parse_composition(
             composition=composition,
             effect_param_defs=effect_param_defs,
         )
-        composition.layers.append(layer)
+        composition._add_layer(layer)
 
     # Link effect ewot entries for chunk-backed selected state
     ewot_entries = _collect_ewot_entries(child_chunks)
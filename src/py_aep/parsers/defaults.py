@@ -185,6 +185,7 @@ def set_transform_defaults(layer: Layer) -> None:
             # the override; for synthesized properties (_value path),
             # fix the user-facing value directly.
             scale_prop._scale_z_override = 100.0
+            scale_prop._invalidate_resolved_value()
             if isinstance(scale_prop._value, list) and len(scale_prop._value) >= 3:
                 scale_prop._value[2] = 100.0
             for kf in scale_prop.keyframes:
@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-import io
+import functools
 import logging
 import typing
 from contextlib import suppress
 from typing import Any
 
-from ..cos import CosParser
+from ..cos import CosParser, extract_cos_path
 from ..data.match_names import MATCH_NAME_TO_NICE_NAME
 from ..enums import (
     PropertyControlType,
@@ -34,13 +34,14 @@ from .marker import parse_markers
 from .property_value import (
     parse_property,
 )
-from .text import parse_btdk_cos
+from .text import parse_btdk_cos, parse_font_array
 from .utils import (
     get_chunks_by_match_name,
 )
 
 if typing.TYPE_CHECKING:
     from ..models.items.composition import CompItem
+    from ..models.text.font_object import FontObject
 
 logger = logging.getLogger(__name__)
 
@@ -502,29 +503,85 @@ def parse_text_document(
     )
     prop._property_value_type = PropertyValueType.TEXT_DOCUMENT
 
+    prop._value_loader = functools.partial(
+        _load_text_documents, prop, btds_chunk, match_name, composition
+    )
+    prop._fonts_loader = functools.partial(
+        _load_text_fonts, btds_chunk, match_name, composition
+    )
+
+    return prop
+
+
+def _load_text_documents(
+    prop: Property,
+    btds_chunk: Aep.Chunk,
+    match_name: str,
+    composition: CompItem,
+) -> None:
+    """Decode the text documents of a text document property.
+
+    Run by [Property][] on first access to its value or keyframe values,
+    so projects are parsed without decoding the COS data of every text
+    layer. The `btdk` chunk data is parsed in place, without copying.
+
+    Args:
+        prop: The property returned by [parse_text_document][].
+        btds_chunk: The BTDS chunk the property was parsed from.
+        match_name: The property match name, used in log messages.
+        composition: The parent composition. Fonts are interned in the
+            font table of its project.
+    """
     try:
         btdk_chunk = find_by_list_type(
             chunks=btds_chunk.body.chunks,
             list_type="btdk",
         )
-        parser = CosParser(
-            io.BytesIO(btdk_chunk.body.binary_data),
-            len(btdk_chunk.body.binary_data),
-        )
-        cos_data = parser.parse()
+        project = composition._project
+        project._cos_writes.flush(btdk_chunk.body)
+        cos_data = CosParser(btdk_chunk.body.binary_data).parse()
         if not isinstance(cos_data, dict):
             raise TypeError("Expected dict from COS parser")
-        text_documents, _fonts = parse_btdk_cos(cos_data, btdk_chunk.body)
+        text_documents, _fonts = parse_btdk_cos(
+            cos_data, btdk_chunk.body, project._font_table, project._cos_writes
+        )
         if text_documents:
             if prop.keyframes:
                 for kf, doc in zip(prop.keyframes, text_documents):
                     kf._value = doc
             else:
-                prop.value = text_documents[0]
+                prop._value = text_documents[0]
     except Exception:
         logger.debug("Could not parse btdk COS data for %s", match_name)
 
-    return prop
+
+def _load_text_fonts(
+    btds_chunk: Aep.Chunk,
+    match_name: str,
+    composition: CompItem,
+) -> list[FontObject]:
+    """Read the font array of a text document property.
+
+    Only the font array of the `btdk` COS data is built, so the fonts of
+    a text layer are listed without decoding its text documents.
+
+    Args:
+        btds_chunk: The BTDS chunk the property was parsed from.
+        match_name: The property match name, used in log messages.
+        composition: The parent composition. Fonts are interned in the
+            font table of its project.
+    """
+    try:
+        btdk_chunk = find_by_list_type(
+            chunks=btds_chunk.body.chunks,
+            list_type="btdk",
+        )
+        composition._project._cos_writes.flush(btdk_chunk.body)
+        font_array = extract_cos_path(btdk_chunk.body.binary_data, ("0", "1", "0"))
+    except Exception:
+        logger.debug("Could not read btdk fonts for %s", match_name)
+        return []
+    return parse_font_array(font_array, composition._project._font_table)
 
 
 def parse_effect_param_defs(
@@ -33,7 +33,7 @@ import logging
 from typing import Any
 
 from ..models.text.font_object import FontObject
-from ..models.text.text_document import TextDocument
+from ..models.text.text_document import CosWriteQueue, TextDocument
 
 logger = logging.getLogger(__name__)
 
@@ -74,7 +74,10 @@ def _g(data: Any, *keys: str | int) -> Any:
 # ---------------------------------------------------------------------------
 
 
-def parse_fonts(cos_data: dict[str, Any]) -> list[FontObject]:
+def parse_fonts(
+    cos_data: dict[str, Any],
+    font_table: dict[tuple[str, str | None], FontObject] | None = None,
+) -> list[FontObject]:
     """Parse font entries from COS data.
 
     Reads the font array at `cos_data["0"]["1"]["0"]`.  Each font entry
@@ -86,12 +89,35 @@ def parse_fonts(cos_data: dict[str, Any]) -> list[FontObject]:
 
     Args:
         cos_data: The parsed COS dict from a `btdk` chunk.
+        font_table: Fonts already parsed from other `btdk` chunks, keyed
+            by `(post_script_name, version)`. Entries matching a font of
+            the table reuse its [FontObject][]; new fonts are added to it.
 
     Returns:
         List of [FontObject][] instances in the same order as the COS
         array (the index is referenced by character styles).
     """
-    font_array = _g(cos_data, "0", "1", "0")
+    return parse_font_array(_g(cos_data, "0", "1", "0"), font_table)
+
+
+def parse_font_array(
+    font_array: Any,
+    font_table: dict[tuple[str, str | None], FontObject] | None = None,
+) -> list[FontObject]:
+    """Parse the font array of a `btdk` COS document.
+
+    Used by [parse_fonts][] and to list the fonts of a text document
+    property without decoding its text documents.
+
+    Args:
+        font_array: The value at `cos_data["0"]["1"]["0"]`.
+        font_table: Project-wide font interning table, see
+            [parse_fonts][].
+
+    Returns:
+        List of [FontObject][] instances in the same order as the COS
+        array.
+    """
     if not font_array or not isinstance(font_array, list):
         return []
 
@@ -105,6 +131,9 @@ def parse_fonts(cos_data: dict[str, Any]) -> list[FontObject]:
             _font_data=font_data,
             _font_entry=font_entry if isinstance(font_entry, dict) else None,
         )
+        if font_table is not None:
+            key = (font.post_script_name, font.version)
+            font = font_table.setdefault(key, font)
         fonts.append(font)
 
     return fonts
@@ -141,6 +170,7 @@ def parse_text_documents(
     cos_data: dict[str, Any],
     fonts: list[FontObject],
     btdk_body: Any | None = None,
+    cos_writes: CosWriteQueue | None = None,
 ) -> list[TextDocument]:
     """Parse text documents from COS data.
 
@@ -153,6 +183,8 @@ def parse_text_documents(
         fonts: The list of [FontObject][] parsed by
             [parse_fonts][] (font indices reference this list).
         btdk_body: The btdk chunk body for COS write-back.
+        cos_writes: The write-back queue of the project, see
+            [CosWriteQueue][].
 
     Returns:
         List of [TextDocument][] instances (one per keyframe).
@@ -175,6 +207,7 @@ def parse_text_documents(
                 _fonts=fonts,
                 _cos_data=cos_data,
                 _btdk_body=btdk_body,
+                _cos_writes=cos_writes,
             )
         )
 
@@ -189,6 +222,8 @@ def parse_text_documents(
 def parse_btdk_cos(
     cos_data: dict[str, Any],
     btdk_body: Any | None = None,
+    font_table: dict[tuple[str, str | None], FontObject] | None = None,
+    cos_writes: CosWriteQueue | None = None,
 ) -> tuple[list[TextDocument], list[FontObject]]:
     """Parse a btdk COS dict into text documents and fonts.
 
@@ -199,12 +234,16 @@ def parse_btdk_cos(
         cos_data: The parsed COS dict from a `btdk` chunk (the return
             value of [CosParser.parse][py_aep.cos.CosParser.parse]).
         btdk_body: The btdk chunk body for COS write-back.
+        font_table: Project-wide font interning table, see
+            [parse_fonts][].
+        cos_writes: The write-back queue of the project, see
+            [CosWriteQueue][].
 
     Returns:
         A tuple `(text_documents, fonts)` where *text_documents* is a
         list of [TextDocument][] (one per keyframe) and *fonts* is
         the list of [FontObject][] referenced by the documents.
     """
-    fonts = parse_fonts(cos_data)
-    documents = parse_text_documents(cos_data, fonts, btdk_body)
+    fonts = parse_fonts(cos_data, font_table)
+    documents = parse_text_documents(cos_data, fonts, btdk_body, cos_writes)
     return documents, fonts
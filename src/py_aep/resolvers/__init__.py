@@ -7,8 +7,20 @@ computation.
 
 from __future__ import annotations
 
+from .interpolation import (
+    DEFAULT_EASING_CACHE_SIZE,
+    EasingCacheInfo,
+    clear_easing_cache,
+    easing_cache_info,
+    set_easing_cache_size,
+)
 from .output import resolve_output_filename
 
 __all__ = [
+    "DEFAULT_EASING_CACHE_SIZE",
+    "EasingCacheInfo",
+    "clear_easing_cache",
+    "easing_cache_info",
     "resolve_output_filename",
+    "set_easing_cache_size",
 ]
@@ -1,7 +1,8 @@
 """Interpolation utilities for keyframe-based property evaluation.
 
 Implements HOLD, LINEAR, and BEZIER interpolation for
-`Property.value_at_time()`.  Pure Python with no external dependencies.
+`Property.value_at_time()` and `Property.values_at_times()`.  Pure
+Python; when NumPy is installed, batch evaluation is vectorized.
 
 The algorithms are ported from `lottie-web <https://github.com/airbnb/
 lottie-web>`_, the industry-standard renderer for Lottie/bodymovin
@@ -10,20 +11,38 @@ animations exported from After Effects:
 - **Temporal ease** uses a normalised [0, 1] -> [0, 1] cubic-bezier
   easing function (`BezierEasing`), with an 11-point sample table,
   Newton-Raphson refinement, and binary-subdivision fallback (ported
-  from `BezierEaser.js`).
+  from `BezierEaser.js`). Easing functions are shared through a
+  bounded LRU cache, see `set_easing_cache_size`.
 - **Spatial paths** are pre-sampled into a 150-segment polyline with
-  per-segment partial lengths (ported from `bez.js`).
-- **Arc-length reparameterisation** walks the segment table linearly,
+  cumulative arc lengths (ported from `bez.js`). Given a
+  `path_tolerance`, the polyline is built by error-bounded subdivision
+  instead, trading accuracy for speed.
+- **Arc-length reparameterisation** bisects the cumulative lengths,
   interpolating between adjacent sample points.
+
+`KeyframeCurve` compiles a keyframe track once (times, values, auto
+tangents, per-segment easing and sampled paths) so repeated evaluation
+only bisects the keyframe times and runs the segment evaluator. Batches
+of times are swept through the segments in one pass.
 """
 
 from __future__ import annotations
 
+import abc
 import math
-from typing import TYPE_CHECKING, cast
+import threading
+import typing
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from py_aep.enums import KeyframeInterpolationType
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from py_aep.models.properties.keyframe import Keyframe
     from py_aep.models.properties.keyframe_ease import KeyframeEase
@@ -34,6 +53,11 @@ _DEFAULT_INFLUENCE = 100.0 / 6.0  # 16.6667 %
 # lottie-web uses getDefaultCurveSegments() which defaults to 150.
 _CURVE_SEGMENTS = 150
 
+# Adaptive path sampling (see `_sample_bezier_adaptive`): the curve is
+# cut into at least this many spans, each halved at most this many times.
+_MIN_PATH_SPANS = 4
+_MAX_PATH_DEPTH = 12
+
 
 # ---------------------------------------------------------------------------
 # BezierEasing - port of lottie-web 3rd_party/BezierEaser.js
@@ -129,6 +153,58 @@ class _BezierEasing:
             return 1.0
         return _calc_bezier(self._get_t_for_x(x), self._cy1, self._cy2)
 
+    def get_array(self, xs: Any) -> Any:
+        """Vectorized `get` over a NumPy array of x values in [0, 1]."""
+        if self._cx1 == self._cy1 and self._cx2 == self._cy2:
+            return xs
+        samples = self._samples
+        if any(a > b for a, b in zip(samples, samples[1:])):
+            # The sample scan below assumes x(t) is monotonic.
+            return np.array([self.get(x) for x in xs.tolist()], dtype=float)
+        result: Any = _calc_bezier(self._get_t_for_x_array(xs), self._cy1, self._cy2)
+        result[xs == 0.0] = 0.0
+        result[xs == 1.0] = 1.0
+        return result
+
+    def _get_t_for_x_array(self, xs: Any) -> Any:
+        """Vectorized `_get_t_for_x`, matching it element for element."""
+        samples = np.asarray(self._samples)
+        # Same accumulation as the scalar scan so interval starts match.
+        starts = np.cumsum([0.0] + [_SAMPLE_STEP_SIZE] * (_SAMPLE_TABLE_SIZE - 2))
+        current = np.searchsorted(samples[1:-1], xs, side="right")
+        interval_start = starts[current]
+        low = samples[current]
+        denom = samples[current + 1] - low
+        safe = np.where(denom == 0.0, 1.0, denom)
+        dist = np.where(denom == 0.0, 0.0, (xs - low) / safe)
+        guess = interval_start + dist * _SAMPLE_STEP_SIZE
+
+        initial_slope = _get_slope(guess, self._cx1, self._cx2)
+        result = guess.copy()
+
+        newton = initial_slope >= _NEWTON_MIN_SLOPE
+        t = guess[newton]
+        target = xs[newton]
+        active = np.ones(len(t), dtype=bool)
+        for _ in range(_NEWTON_ITERATIONS):
+            slope = _get_slope(t, self._cx1, self._cx2)
+            active &= slope != 0.0
+            current_x = _calc_bezier(t, self._cx1, self._cx2) - target
+            t = np.where(active, t - current_x / np.where(active, slope, 1.0), t)
+        result[newton] = t
+
+        subdivide = np.flatnonzero(~newton & (initial_slope != 0.0))
+        for i in subdivide.tolist():
+            start = float(interval_start[i])
+            result[i] = _binary_subdivide(
+                float(xs[i]),
+                start,
+                start + _SAMPLE_STEP_SIZE,
+                self._cx1,
+                self._cx2,
+            )
+        return result
+
     def _get_t_for_x(self, x: float) -> float:
         """Find t parameter for a given x value."""
         # Find the sample interval
@@ -163,19 +239,118 @@ class _BezierEasing:
         )
 
 
-# Cache for easing functions (mirroring lottie-web's BezierFactory cache)
-_easing_cache: dict[tuple[float, float, float, float], _BezierEasing] = {}
+# Cache for easing functions (mirroring lottie-web's BezierFactory cache).
+# Bounded so long-running processes that evaluate many projects do not grow
+# it forever; least recently used entries are evicted first.
+DEFAULT_EASING_CACHE_SIZE = 4096
+
+_EasingKey = typing.Tuple[float, float, float, float]
+
+
+class EasingCacheInfo(NamedTuple):
+    """Statistics of the easing function cache, see `easing_cache_info`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    max_size: int | None
+    size: int
+
+
+class _EasingCache:
+    """Thread-safe LRU cache of `_BezierEasing` instances."""
+
+    def __init__(self, max_size: int | None) -> None:
+        self._entries: OrderedDict[_EasingKey, _BezierEasing] = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, cx1: float, cy1: float, cx2: float, cy2: float) -> _BezierEasing:
+        key = (cx1, cy1, cx2, cy2)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+        # Built outside the lock; a concurrent miss on the same key just
+        # builds an identical instance.
+        easing = _BezierEasing(cx1, cy1, cx2, cy2)
+        with self._lock:
+            if self.max_size != 0:
+                self._entries[key] = easing
+                self._evict()
+        return easing
+
+    def resize(self, max_size: int | None) -> None:
+        with self._lock:
+            self.max_size = max_size
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> EasingCacheInfo:
+        with self._lock:
+            return EasingCacheInfo(
+                self.hits,
+                self.misses,
+                self.evictions,
+                self.max_size,
+                len(self._entries),
+            )
+
+    def _evict(self) -> None:
+        if self.max_size is None:
+            return
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+
+_easing_cache = _EasingCache(DEFAULT_EASING_CACHE_SIZE)
 
 
 def _get_bezier_easing(cx1: float, cy1: float, cx2: float, cy2: float) -> _BezierEasing:
     """Get or create a cached BezierEasing instance."""
-    key = (cx1, cy1, cx2, cy2)
-    cached = _easing_cache.get(key)
-    if cached is not None:
-        return cached
-    easing = _BezierEasing(cx1, cy1, cx2, cy2)
-    _easing_cache[key] = easing
-    return easing
+    return _easing_cache.get(cx1, cy1, cx2, cy2)
+
+
+def set_easing_cache_size(max_size: int | None) -> None:
+    """Set how many easing functions are kept between evaluations.
+
+    Every distinct temporal ease compiles a small easing function, which
+    is cached and shared by all keyframe curves. When the cache is full,
+    the least recently used function is dropped. Shrinking the cache
+    evicts the excess right away.
+
+    Args:
+        max_size: Maximum number of cached functions. `0` disables the
+            cache and `None` removes the bound. Defaults to
+            `DEFAULT_EASING_CACHE_SIZE`.
+
+    Raises:
+        ValueError: If *max_size* is negative.
+    """
+    if max_size is not None and max_size < 0:
+        raise ValueError(f"max_size must not be negative, got {max_size}")
+    _easing_cache.resize(max_size)
+
+
+def easing_cache_info() -> EasingCacheInfo:
+    """Return the hit, miss and eviction counts and size of the easing cache."""
+    return _easing_cache.info()
+
+
+def clear_easing_cache() -> None:
+    """Empty the easing cache and reset its statistics."""
+    _easing_cache.clear()
 
 
 # ---------------------------------------------------------------------------
@@ -317,13 +492,19 @@ def _point_on_line_3d(
 class _BezierPathData:
     """Pre-sampled spatial bezier path with arc-length data.
 
-    Port of lottie-web's BezierData / buildBezierData.
-    Stores N+1 sample points along the curve with their partial
-    lengths, enabling arc-length reparameterization via linear
-    interpolation in the segment table.
+    Port of lottie-web's BezierData / buildBezierData. Stores sample
+    points along the curve with the cumulative arc length up to each
+    one, so a distance along the path is located by bisection and
+    linear interpolation between adjacent samples.
+
+    By default the curve is sampled at `_CURVE_SEGMENTS` evenly spaced
+    parameters, like lottie-web. With a *tolerance*, it is subdivided
+    adaptively instead: a span is split until the curve point at its
+    middle lies within *tolerance* of the chord. Flat spans then need
+    only a few samples, and coarser tolerances sample faster.
     """
 
-    __slots__ = ("points", "partial_lengths", "segment_length")
+    __slots__ = ("points", "lengths", "segment_lengths", "segment_length")
 
     def __init__(
         self,
@@ -331,6 +512,7 @@ class _BezierPathData:
         v1: list[float],
         out_tangent: list[float],
         in_tangent: list[float],
+        tolerance: float | None = None,
     ) -> None:
         ndim = len(v0)
         # Convert to absolute control points (lottie-web convention)
@@ -366,31 +548,88 @@ class _BezierPathData:
                 p2[2],
             )
 
-        n_segs = 2 if is_collinear else _CURVE_SEGMENTS
+        if is_collinear:
+            points = [_cubic_bezier_nd(v0, p1, p2, v1, perc) for perc in (0.0, 1.0)]
+        elif tolerance is None:
+            n_segs = _CURVE_SEGMENTS
+            points = [
+                _cubic_bezier_nd(v0, p1, p2, v1, k / (n_segs - 1))
+                for k in range(n_segs)
+            ]
+        else:
+            points = _sample_bezier_adaptive(v0, p1, p2, v1, tolerance)
 
-        self.points: list[list[float]] = []
-        self.partial_lengths: list[float] = []
+        # lengths[j] is the arc length from the start to points[j];
+        # segment_lengths[j] is the length of the chord ending at it.
+        self.points = points
+        self.lengths: list[float] = []
+        self.segment_lengths: list[float] = []
         total_length = 0.0
         last_point: list[float] | None = None
-
-        for k in range(n_segs):
-            perc = k / (n_segs - 1) if n_segs > 1 else 0.0
-            point = _cubic_bezier_nd(v0, p1, p2, v1, perc)
-
+        for point in points:
             pt_dist = 0.0
             if last_point is not None:
                 pt_dist = math.sqrt(
                     sum((point[d] - last_point[d]) ** 2 for d in range(ndim))
                 )
             total_length += pt_dist
-
-            self.points.append(point)
-            self.partial_lengths.append(pt_dist)
+            self.lengths.append(total_length)
+            self.segment_lengths.append(pt_dist)
             last_point = point
 
         self.segment_length = total_length
 
 
+def _sample_bezier_adaptive(
+    v0: list[float],
+    p1: list[float],
+    p2: list[float],
+    v1: list[float],
+    tolerance: float,
+) -> list[list[float]]:
+    """Sample a cubic bezier by error-bounded subdivision.
+
+    The curve is first cut into `_MIN_PATH_SPANS` even spans, so S-shaped
+    spans whose middle happens to sit on the chord are still split. A
+    span is halved while its middle point lies further than *tolerance*
+    from the chord midpoint, down to `_MAX_PATH_DEPTH` levels.
+
+    Returns:
+        The sample points, in curve order, starting at *v0* and ending
+        at *v1*.
+    """
+    ndim = len(v0)
+    points = [_cubic_bezier_nd(v0, p1, p2, v1, 0.0)]
+    stack: list[tuple[float, list[float], float, list[float], int]] = []
+    for k in range(_MIN_PATH_SPANS, 0, -1):
+        ta = (k - 1) / _MIN_PATH_SPANS
+        tb = k / _MIN_PATH_SPANS
+        stack.append(
+            (
+                ta,
+                _cubic_bezier_nd(v0, p1, p2, v1, ta),
+                tb,
+                _cubic_bezier_nd(v0, p1, p2, v1, tb),
+                0,
+            )
+        )
+    # Spans are pushed right half first, so points come out in order.
+    while stack:
+        ta, pa, tb, pb, depth = stack.pop()
+        tm = (ta + tb) / 2.0
+        pm = _cubic_bezier_nd(v0, p1, p2, v1, tm)
+        error = math.sqrt(
+            sum((pm[d] - (pa[d] + pb[d]) / 2.0) ** 2 for d in range(ndim))
+        )
+        if error > tolerance and depth < _MAX_PATH_DEPTH:
+            stack.append((tm, pm, tb, pb, depth + 1))
+            stack.append((ta, pa, tm, pm, depth + 1))
+        else:
+            points.append(pm)
+            points.append(pb)
+    return points
+
+
 def _get_point_on_path(
     bezier_data: _BezierPathData,
     eased_perc: float,
@@ -398,35 +637,49 @@ def _get_point_on_path(
     """Get position along a pre-sampled bezier path at arc-length fraction.
 
     Port of lottie-web's PropertyFactory interpolateValue (spatial branch).
-    Walks the precomputed polyline segments to find the point at the
-    given arc-length distance.
+    Bisects the cumulative lengths to find the samples around the given
+    arc-length distance and interpolates between them.
     """
+    points = bezier_data.points
     if eased_perc <= 0.0:
-        return list(bezier_data.points[0])
+        return list(points[0])
     if eased_perc >= 1.0:
-        return list(bezier_data.points[-1])
+        return list(points[-1])
 
     distance = bezier_data.segment_length * eased_perc
-    added_length = 0.0
-    n_pts = len(bezier_data.points)
+    if distance == 0.0:
+        return list(points[0])
 
-    for j in range(n_pts):
-        added_length += bezier_data.partial_lengths[j]
+    # Last sample at or before the distance. Zero-length chords share
+    # their cumulative length with the previous sample and are skipped.
+    j = bisect_right(bezier_data.lengths, distance) - 1
+    if j >= len(points) - 1:
+        return list(points[-1])
 
-        if distance == 0.0 or eased_perc == 0.0 or j == n_pts - 1:
-            return list(bezier_data.points[j])
+    seg_perc = (distance - bezier_data.lengths[j]) / bezier_data.segment_lengths[j + 1]
+    pt_a = points[j]
+    pt_b = points[j + 1]
+    return [pt_a[d] + (pt_b[d] - pt_a[d]) * seg_perc for d in range(len(pt_a))]
 
-        if (
-            distance >= added_length
-            and distance < added_length + bezier_data.partial_lengths[j + 1]
-        ):
-            seg_perc = (distance - added_length) / bezier_data.partial_lengths[j + 1]
-            pt_a = bezier_data.points[j]
-            pt_b = bezier_data.points[j + 1]
-            return [pt_a[d] + (pt_b[d] - pt_a[d]) * seg_perc for d in range(len(pt_a))]
 
-    # Fallback: return last point
-    return list(bezier_data.points[-1])
+def _points_on_path_array(bezier_data: _BezierPathData, eased_perc: Any) -> Any:
+    """Vectorized `_get_point_on_path` over a NumPy array of fractions."""
+    points = np.asarray(bezier_data.points, dtype=float)
+    cumulative = np.asarray(bezier_data.lengths, dtype=float)
+    partial = np.asarray(bezier_data.segment_lengths, dtype=float)
+    n_pts = len(points)
+
+    distance = bezier_data.segment_length * eased_perc
+    j = np.clip(np.searchsorted(cumulative, distance, side="right") - 1, 0, n_pts - 1)
+    last = (j == n_pts - 1) | (eased_perc >= 1.0)
+    j_next = np.minimum(j + 1, n_pts - 1)
+    seg_len = np.where(last, 1.0, partial[j_next])
+    seg_perc = np.where(last, 0.0, (distance - cumulative[j]) / seg_len)
+    result = points[j] + (points[j_next] - points[j]) * seg_perc[:, None]
+
+    result[last] = points[-1]
+    result[(eased_perc <= 0.0) | (distance == 0.0)] = points[0]
+    return result
 
 
 def _tangents_are_zero(tangent: list[float] | None) -> bool:
@@ -576,12 +829,116 @@ def _compute_auto_temporal_ease(
 
 
 # ---------------------------------------------------------------------------
-# Segment interpolation - lottie-web approach
+# Segment compilation - lottie-web approach
 # ---------------------------------------------------------------------------
+# Each keyframe segment is compiled once into a segment object that holds
+# everything independent of the evaluated time: easing functions, resolved
+# tangents and the sampled spatial path. Segments evaluate one time when
+# called, or a NumPy array of times with `evaluate_array`.
 
 
-def _interpolate_bezier_1d(
-    t: float,
+def _copy_value(value: Any) -> Any:
+    """Return a copy of list values so callers cannot mutate the cache."""
+    return list(value) if isinstance(value, list) else value
+
+
+class _Segment(abc.ABC):
+    """A compiled keyframe segment."""
+
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def __call__(self, time: float) -> Any:
+        """Evaluate the segment at *time*."""
+
+    def evaluate_array(self, times: Any) -> Any:
+        """Evaluate a NumPy array of times, one row per time."""
+        return np.array([self(t) for t in times.tolist()], dtype=float)
+
+
+class _ConstantSegment(_Segment):
+    """A segment that holds one value (HOLD and fallbacks)."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __call__(self, time: float) -> Any:
+        return _copy_value(self.value)
+
+    def evaluate_array(self, times: Any) -> Any:
+        value = np.asarray(self.value, dtype=float)
+        return np.broadcast_to(value, (len(times), *value.shape))
+
+
+class _LinearSegment(_Segment):
+    """A LINEAR segment, for scalar (`v0`, `v1` floats) or list values."""
+
+    __slots__ = ("t0", "dt", "v0", "v1")
+
+    def __init__(self, t0: float, t1: float, v0: Any, v1: Any) -> None:
+        self.t0 = t0
+        self.dt = t1 - t0
+        self.v0 = v0
+        self.v1 = v1
+
+    def __call__(self, time: float) -> Any:
+        v0 = self.v0
+        v1 = self.v1
+        ratio = (time - self.t0) / self.dt
+        if isinstance(v0, list):
+            return [v0[d] + (v1[d] - v0[d]) * ratio for d in range(len(v0))]
+        return v0 + (v1 - v0) * ratio
+
+    def evaluate_array(self, times: Any) -> Any:
+        ratio = (times - self.t0) / self.dt
+        v0 = np.asarray(self.v0, dtype=float)
+        v1 = np.asarray(self.v1, dtype=float)
+        if v0.ndim:
+            ratio = ratio[:, None]
+        return v0 + (v1 - v0) * ratio
+
+
+def _compile_linear(t0: float, t1: float, v0: Any, v1: Any) -> _Segment:
+    """Compile a LINEAR segment."""
+    if isinstance(v0, list) and isinstance(v1, list):
+        return _LinearSegment(t0, t1, v0, v1)
+    if isinstance(v0, (int, float)) and isinstance(v1, (int, float)):
+        return _LinearSegment(t0, t1, float(v0), float(v1))
+    return _ConstantSegment(v0)
+
+
+class _Bezier1DSegment(_Segment):
+    """One dimension of a temporal BEZIER segment."""
+
+    __slots__ = ("t0", "dt", "v0", "v1", "easing")
+
+    def __init__(
+        self,
+        t0: float,
+        dt: float,
+        v0: float,
+        v1: float,
+        easing: _BezierEasing,
+    ) -> None:
+        self.t0 = t0
+        self.dt = dt
+        self.v0 = v0
+        self.v1 = v1
+        self.easing = easing
+
+    def __call__(self, time: float) -> float:
+        return self.v0 + (self.v1 - self.v0) * self.easing.get(
+            (time - self.t0) / self.dt
+        )
+
+    def evaluate_array(self, times: Any) -> Any:
+        perc = self.easing.get_array((times - self.t0) / self.dt)
+        return self.v0 + (self.v1 - self.v0) * perc
+
+
+def _compile_bezier_1d(
     t0: float,
     t1: float,
     v0: float,
@@ -590,58 +947,104 @@ def _interpolate_bezier_1d(
     in_ease: KeyframeEase,
     out_override: tuple[float, float] | None = None,
     in_override: tuple[float, float] | None = None,
-) -> float:
-    """Interpolate 1D using lottie-web's BezierEasing approach.
+) -> _Segment:
+    """Compile one dimension of a temporal BEZIER segment.
 
-    Converts speed/influence to normalized bezier control points,
-    then uses BezierEasing to get the eased progress, then lerps.
+    Converts speed/influence to normalized bezier control points once;
+    evaluation maps the time fraction through the easing function and
+    lerps in value space.
     """
     dt = t1 - t0
     if dt == 0:
-        return v0
-
-    # Convert AEP ease to normalized bezier control points
-    cx1, cy1, cx2, cy2 = _ease_to_bezier_1d(
-        t0, t1, v0, v1, out_ease, in_ease, out_override, in_override
+        return _ConstantSegment(v0)
+    easing = _get_bezier_easing(
+        *_ease_to_bezier_1d(
+            t0, t1, v0, v1, out_ease, in_ease, out_override, in_override
+        )
     )
+    return _Bezier1DSegment(t0, dt, v0, v1, easing)
 
-    # Get easing function (cached)
-    easing = _get_bezier_easing(cx1, cy1, cx2, cy2)
 
-    # Normalized time fraction
-    x = (t - t0) / dt
+class _BezierNDSegment(_Segment):
+    """A non-spatial BEZIER segment eased per dimension."""
 
-    # Eased progress
-    perc = easing.get(x)
+    __slots__ = ("dimensions",)
 
-    # Linear interpolation in value space
-    return v0 + (v1 - v0) * perc
+    def __init__(self, dimensions: list[_Segment]) -> None:
+        self.dimensions = dimensions
 
+    def __call__(self, time: float) -> list[float]:
+        return [dimension(time) for dimension in self.dimensions]
 
-def _interpolate_spatial_bezier(
-    t: float,
+    def evaluate_array(self, times: Any) -> Any:
+        return np.stack([d.evaluate_array(times) for d in self.dimensions], axis=1)
+
+
+class _SpatialSegment(_Segment):
+    """A spatial BEZIER segment.
+
+    Time maps to an eased arc-length fraction, which is then located on
+    the straight line between the keyframes or on the sampled path.
+    """
+
+    __slots__ = ("t0", "dt", "v0", "v1", "easing", "path")
+
+    def __init__(
+        self,
+        t0: float,
+        dt: float,
+        v0: list[float],
+        v1: list[float],
+        easing: _BezierEasing | None,
+        path: _BezierPathData | None,
+    ) -> None:
+        self.t0 = t0
+        self.dt = dt
+        self.v0 = v0
+        self.v1 = v1
+        self.easing = easing
+        self.path = path
+
+    def __call__(self, time: float) -> list[float]:
+        x = (time - self.t0) / self.dt
+        perc = self.easing.get(x) if self.easing is not None else x
+        if self.path is not None:
+            return _get_point_on_path(self.path, perc)
+        v0 = self.v0
+        v1 = self.v1
+        return [v0[d] + (v1[d] - v0[d]) * perc for d in range(len(v0))]
+
+    def evaluate_array(self, times: Any) -> Any:
+        x = (times - self.t0) / self.dt
+        perc = self.easing.get_array(x) if self.easing is not None else x
+        if self.path is not None:
+            return _points_on_path_array(self.path, perc)
+        v0 = np.asarray(self.v0, dtype=float)
+        v1 = np.asarray(self.v1, dtype=float)
+        return v0 + (v1 - v0) * perc[:, None]
+
+
+def _compile_spatial_bezier(
     t0: float,
     t1: float,
     kf0: Keyframe,
     kf1: Keyframe,
+    v0: list[float],
+    v1: list[float],
     out_tan_override: list[float] | None = None,
     in_tan_override: list[float] | None = None,
-) -> list[float]:
-    """Interpolate spatial property using lottie-web's approach.
-
-    1. Builds a polyline approximation of the spatial bezier path
-    2. Converts temporal ease to a BezierEasing function
-    3. Maps time -> eased arc-length fraction
-    4. Walks the polyline to find the position
+    path_tolerance: float | None = None,
+) -> _Segment:
+    """Compile a spatial BEZIER segment.
+
+    1. Converts temporal ease to a BezierEasing function
+    2. Builds a polyline approximation of the spatial bezier path, unless
+       the tangents are zero and the path is a straight line. See
+       `_BezierPathData` for *path_tolerance*.
     """
-    v0 = kf0.value
-    v1 = kf1.value
-    if not isinstance(v0, list) or not isinstance(v1, list):
-        return list(v0) if isinstance(v0, list) else [float(v0)]  # type: ignore[arg-type]
-
     dt = t1 - t0
     if dt == 0:
-        return list(v0)
+        return _ConstantSegment(v0)
 
     ndim = len(v0)
     out_tan = out_tan_override or kf0.out_spatial_tangent or [0.0] * ndim
@@ -652,15 +1055,12 @@ def _interpolate_spatial_bezier(
     out_ease = kf0.out_temporal_ease[0] if kf0.out_temporal_ease else None
     in_ease = kf1.in_temporal_ease[0] if kf1.in_temporal_ease else None
 
-    has_explicit_ease = (
+    easing: _BezierEasing | None = None
+    if (
         out_ease is not None
         and in_ease is not None
         and (out_ease.influence > 0 or in_ease.influence > 0)
-    )
-
-    if has_explicit_ease:
-        assert out_ease is not None and in_ease is not None
-
+    ):
         # For spatial properties, we convert speed/influence to normalized
         # bezier control points using the segment distance
         if straight_path:
@@ -695,141 +1095,389 @@ def _interpolate_spatial_bezier(
         cy2 = max(0.0, min(1.0, cy2))
 
         easing = _get_bezier_easing(cx1, cy1, cx2, cy2)
-        x = (t - t0) / dt
-        perc = easing.get(x)
-    else:
-        perc = (t - t0) / dt
-
-    # For straight paths, just lerp
-    if straight_path:
-        return [v0[d] + (v1[d] - v0[d]) * perc for d in range(ndim)]
-
-    # Build spatial bezier path data (polyline approximation)
-    # In a full implementation this would be cached; for correctness
-    # comparison we build it each time.
-    bezier_data = _BezierPathData(v0, v1, out_tan, in_tan)
 
-    # Walk the path to get the position at the eased arc-length fraction
-    return _get_point_on_path(bezier_data, perc)
+    # Spatial bezier path data (polyline approximation), sampled once.
+    # Straight paths are lerped instead.
+    path = (
+        None
+        if straight_path
+        else _BezierPathData(v0, v1, out_tan, in_tan, path_tolerance)
+    )
+    return _SpatialSegment(t0, dt, v0, v1, easing, path)
 
 
 # ---------------------------------------------------------------------------
-# Public entry point
+# Compiled keyframe curve
 # ---------------------------------------------------------------------------
 
 
-def interpolate_keyframes(
-    time: float,
-    keyframes: list[Keyframe],
-    is_spatial: bool,
-) -> list[float] | float | None:
-    """Compute the interpolated value at *time* from a keyframe list.
-
-    Uses lottie-web's algorithms:
-    - BezierEasing for temporal ease (normalized unit-square bezier)
-    - Polyline path approximation for spatial bezier
-    - Linear arc-length interpolation along sampled path
-
-    Args:
-        time: Time in seconds.
-        keyframes: Sorted list of keyframes.
-        is_spatial: Whether the property is spatial.
-
-    Returns:
-        Interpolated value, or `None` if no keyframes.
-    """
-    if not keyframes:
-        return None
-
-    n = len(keyframes)
-
-    # Before first keyframe or single keyframe
-    if n == 1 or time <= keyframes[0].time:
-        return cast("list[float] | float | None", keyframes[0].value)
-
-    # After last keyframe
-    if time >= keyframes[-1].time:
-        return cast("list[float] | float | None", keyframes[-1].value)
-
-    # Find the segment
-    right_idx = 0
-    for i in range(1, n):
-        if keyframes[i].time >= time:
-            right_idx = i
-            break
-
-    left_idx = right_idx - 1
-    kf_left = keyframes[left_idx]
-    kf_right = keyframes[right_idx]
+def is_numeric_value(value: Any) -> bool:
+    """Whether *value* is a number or a list of numbers."""
+    if isinstance(value, list):
+        return all(
+            isinstance(c, (int, float)) and not isinstance(c, bool) for c in value
+        )
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
 
-    t0 = kf_left.time
-    t1 = kf_right.time
 
-    # At exactly a keyframe time
-    if abs(time - t0) < 1e-12:
-        return cast("list[float] | float | None", kf_left.value)
-    if abs(time - t1) < 1e-12:
-        return cast("list[float] | float | None", kf_right.value)
+def _is_numeric_track(values: list[Any]) -> bool:
+    """Whether *values* are all numbers, or all equally long number lists."""
+    if not values or not all(is_numeric_value(v) for v in values):
+        return False
+    first = values[0]
+    if isinstance(first, list):
+        return all(isinstance(v, list) and len(v) == len(first) for v in values)
+    return not any(isinstance(v, list) for v in values)
 
-    # Determine interpolation type
-    out_type = kf_left.out_interpolation_type
-    in_type = kf_right.in_interpolation_type
 
-    # HOLD
-    if out_type == KeyframeInterpolationType.HOLD:
-        return cast("list[float] | float | None", kf_left.value)
-    if in_type == KeyframeInterpolationType.HOLD:
-        return cast("list[float] | float | None", kf_right.value)
+class KeyframeCurve:
+    """The keyframes of one property, compiled for repeated evaluation.
 
-    v0 = kf_left.value
-    v1 = kf_right.value
+    Keyframe times and values are read once, auto-bezier tangents and
+    ease are computed at most once for the whole track, and each segment
+    is compiled on first use into an evaluator holding its easing
+    functions and sampled spatial path. Segments are found by bisecting
+    the keyframe times, so one evaluation costs `O(log n)` instead of a
+    scan over every keyframe.
 
-    # LINEAR
-    if out_type == KeyframeInterpolationType.LINEAR:
-        ratio = (time - t0) / (t1 - t0)
-        if isinstance(v0, list) and isinstance(v1, list):
-            return [v0[d] + (v1[d] - v0[d]) * ratio for d in range(len(v0))]
-        if isinstance(v0, (int, float)) and isinstance(v1, (int, float)):
-            return float(v0) + (float(v1) - float(v0)) * ratio
-        return cast("list[float] | float | None", v0)
+    The curve is a snapshot of the keyframes it was built from.
+    `Property` caches one per property and rebuilds it after keyframe
+    edits.
 
-    # Pre-compute auto-bezier tangents/ease
-    auto_tangents: list[tuple[list[float] | None, list[float] | None]] | None
-    auto_ease: list[tuple[float, float, float, float]] | None
+    Args:
+        keyframes: Sorted list of keyframes.
+        is_spatial: Whether the property is spatial.
+        path_tolerance: Maximum distance, in property units, between a
+            spatial bezier path and the polyline it is sampled into.
+            `None` samples 150 evenly spaced points per segment, like
+            lottie-web. Larger values sample faster but less accurately.
 
-    has_auto_spatial = is_spatial and any(
-        getattr(kf, "spatial_auto_bezier", False) for kf in keyframes
-    )
-    auto_tangents = (
-        _compute_auto_spatial_tangents(keyframes) if has_auto_spatial else None
-    )
+    Raises:
+        ValueError: If *path_tolerance* is not positive.
+    """
 
-    has_auto_temporal = any(
-        getattr(kf, "temporal_auto_bezier", False) for kf in keyframes
+    __slots__ = (
+        "keyframes",
+        "is_spatial",
+        "path_tolerance",
+        "times",
+        "values",
+        "_auto_tangents",
+        "_auto_ease",
+        "_segments",
+        "_progress_segments",
     )
-    auto_ease = _compute_auto_temporal_ease(keyframes) if has_auto_temporal else None
 
-    # BEZIER
-    if out_type == KeyframeInterpolationType.BEZIER:
-        if is_spatial and isinstance(v0, list) and isinstance(v1, list):
+    def __init__(
+        self,
+        keyframes: list[Keyframe],
+        is_spatial: bool,
+        path_tolerance: float | None = None,
+    ) -> None:
+        if path_tolerance is not None and not path_tolerance > 0:
+            raise ValueError(f"path_tolerance must be positive, got {path_tolerance}")
+        self.keyframes = keyframes
+        self.is_spatial = is_spatial
+        self.path_tolerance = path_tolerance
+        self.times: list[float] = [kf.time for kf in keyframes]
+        self.values: list[Any] = [kf.value for kf in keyframes]
+
+        # Auto-bezier tangents and ease, computed on the first BEZIER
+        # segment compile. `False` marks "not computed yet".
+        self._auto_tangents: (
+            list[tuple[list[float] | None, list[float] | None]] | None | bool
+        ) = False
+        self._auto_ease: list[tuple[float, float, float, float]] | None | bool = False
+
+        self._segments: list[_Segment | None] = [None] * max(len(keyframes) - 1, 0)
+        self._progress_segments: list[_Segment | None] = list(self._segments)
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    @property
+    def is_numeric(self) -> bool:
+        """Whether every keyframe value is a number or a number list."""
+        return _is_numeric_track(self.values)
+
+    def value_at(self, time: float) -> list[float] | float | None:
+        """Compute the interpolated value at *time*.
+
+        Returns:
+            Interpolated value, or `None` if there are no keyframes.
+        """
+        times = self.times
+        n = len(times)
+        if not n:
+            return None
+
+        # Before first keyframe or single keyframe
+        if n == 1 or time <= times[0]:
+            return _copy_value(self.values[0])  # type: ignore[no-any-return]
+
+        # After last keyframe
+        if time >= times[-1]:
+            return _copy_value(self.values[-1])  # type: ignore[no-any-return]
+
+        # Find the segment: first keyframe at or after `time`
+        return self._value_in_segment(bisect_left(times, time), time)  # type: ignore[no-any-return]
+
+    def values_at(self, times: typing.Iterable[float]) -> list[Any]:
+        """Compute the interpolated values at every time of *times*.
+
+        The times are swept in ascending order, moving through the
+        segments once, so evaluating `m` times costs `O(m + n)` for
+        already sorted input. Results are returned in input order.
+        """
+        query = list(times)
+        key_times = self.times
+        n = len(key_times)
+        if not n:
+            return [None] * len(query)
+
+        order: typing.Iterable[int] = range(len(query))
+        if any(a > b for a, b in zip(query, query[1:])):
+            order = sorted(order, key=query.__getitem__)
+
+        values = self.values
+        first_time = key_times[0]
+        last_time = key_times[-1]
+        results: list[Any] = [None] * len(query)
+        right_idx = 1
+        for i in order:
+            time = query[i]
+            if n == 1 or time <= first_time:
+                results[i] = _copy_value(values[0])
+            elif time >= last_time:
+                results[i] = _copy_value(values[-1])
+            else:
+                while key_times[right_idx] < time:
+                    right_idx += 1
+                results[i] = self._value_in_segment(right_idx, time)
+        return results
+
+    def values_at_array(self, times: Any) -> Any:
+        """Compute the values at a NumPy array of *times*, vectorized.
+
+        Requires NumPy and a numeric track (see `is_numeric`).
+
+        Returns:
+            A float array of shape `(len(times),)` for scalar tracks or
+            `(len(times), dimensions)` for list-valued tracks.
+        """
+        query = np.asarray(times, dtype=float)
+        table = np.asarray(self.values, dtype=float)
+        key_times = np.asarray(self.times, dtype=float)
+        out = np.empty((len(query), *table.shape[1:]), dtype=float)
+
+        # Clamp outside the keyframe range; "before" wins like value_at.
+        after = query >= key_times[-1]
+        before = query <= key_times[0]
+        if len(key_times) == 1:
+            before[:] = True
+        out[after] = table[-1]
+        out[before] = table[0]
+
+        inside = np.flatnonzero(~(before | after))
+        if not len(inside):
+            return out
+        inner = query[inside]
+        right = np.searchsorted(key_times, inner, side="left")
+        left = right - 1
+
+        # At exactly a keyframe time; the left keyframe wins.
+        at_right = np.abs(inner - key_times[right]) < 1e-12
+        at_left = np.abs(inner - key_times[left]) < 1e-12
+        out[inside[at_right]] = table[right[at_right]]
+        out[inside[at_left]] = table[left[at_left]]
+
+        pending = ~(at_left | at_right)
+        inside = inside[pending]
+        left = left[pending]
+        for segment_idx in np.unique(left).tolist():
+            rows = inside[left == segment_idx]
+            segment = self._get_segment(segment_idx)
+            out[rows] = segment.evaluate_array(query[rows])
+        return out
+
+    def progress_at(
+        self, times: typing.Iterable[float]
+    ) -> tuple[list[int], list[float]]:
+        """Locate every time of *times* between two keyframes.
+
+        This drives the interpolation of values that are not numbers,
+        such as shapes: the caller blends keyframe `index` toward
+        keyframe `index + 1` by the eased `progress`, computed from the
+        keyframe interpolation and temporal ease as for a value going
+        from `0` to `1`. HOLD segments have progress `0`, or `1` for a
+        HOLD into the next keyframe.
+
+        Returns:
+            `(indices, progress)`, in the order of *times*. Times before
+            the first keyframe map to `(0, 0.0)`, times after the last to
+            `(n - 1, 0.0)`.
+        """
+        query = list(times)
+        key_times = self.times
+        n = len(key_times)
+        indices = [0] * len(query)
+        progress = [0.0] * len(query)
+        if n < 2:
+            return indices, progress
+
+        order: typing.Iterable[int] = range(len(query))
+        if any(a > b for a, b in zip(query, query[1:])):
+            order = sorted(order, key=query.__getitem__)
+
+        first_time = key_times[0]
+        last_time = key_times[-1]
+        right_idx = 1
+        for i in order:
+            time = query[i]
+            if time <= first_time:
+                continue
+            if time >= last_time:
+                indices[i] = n - 1
+                continue
+            while key_times[right_idx] < time:
+                right_idx += 1
+            left_idx = right_idx - 1
+            if abs(time - key_times[left_idx]) < 1e-12:
+                indices[i] = left_idx
+            elif abs(time - key_times[right_idx]) < 1e-12:
+                indices[i] = right_idx
+            else:
+                indices[i] = left_idx
+                progress[i] = self._get_progress_segment(left_idx)(time)
+        return indices, progress
+
+    def _get_progress_segment(self, left_idx: int) -> _Segment:
+        """Return the `0` to `1` progress of the segment at *left_idx*."""
+        segment = self._progress_segments[left_idx]
+        if segment is None:
+            segment = self._compile_progress_segment(left_idx)
+            self._progress_segments[left_idx] = segment
+        return segment
+
+    def _compile_progress_segment(self, left_idx: int) -> _Segment:
+        """Compile the eased progress between keyframe *left_idx* and the next."""
+        right_idx = left_idx + 1
+        kf_left = self.keyframes[left_idx]
+        kf_right = self.keyframes[right_idx]
+        t0 = self.times[left_idx]
+        t1 = self.times[right_idx]
+
+        out_type = kf_left.out_interpolation_type
+        if out_type == KeyframeInterpolationType.HOLD:
+            return _ConstantSegment(0.0)
+        if kf_right.in_interpolation_type == KeyframeInterpolationType.HOLD:
+            return _ConstantSegment(1.0)
+        if out_type == KeyframeInterpolationType.LINEAR:
+            return _LinearSegment(t0, t1, 0.0, 1.0)
+        if out_type != KeyframeInterpolationType.BEZIER:
+            return _ConstantSegment(0.0)
+
+        out_ease = kf_left.out_temporal_ease
+        in_ease = kf_right.in_temporal_ease
+        if not out_ease or not in_ease:
+            return _LinearSegment(t0, t1, 0.0, 1.0)
+        return _compile_bezier_1d(t0, t1, 0.0, 1.0, out_ease[0], in_ease[0])
+
+    def _value_in_segment(self, right_idx: int, time: float) -> Any:
+        """Value at *time*, strictly between the first and last keyframe."""
+        left_idx = right_idx - 1
+
+        # At exactly a keyframe time
+        if abs(time - self.times[left_idx]) < 1e-12:
+            return _copy_value(self.values[left_idx])
+        if abs(time - self.times[right_idx]) < 1e-12:
+            return _copy_value(self.values[right_idx])
+
+        return self._get_segment(left_idx)(time)
+
+    def _get_segment(self, left_idx: int) -> _Segment:
+        """Return the compiled segment starting at keyframe *left_idx*."""
+        segment = self._segments[left_idx]
+        if segment is None:
+            segment = self._compile_segment(left_idx)
+            self._segments[left_idx] = segment
+        return segment
+
+    def _get_auto_tangents(
+        self,
+    ) -> list[tuple[list[float] | None, list[float] | None]] | None:
+        """Spatial tangents of the whole track, if any key is auto-bezier."""
+        if self._auto_tangents is False:
+            keyframes = self.keyframes
+            self._auto_tangents = (
+                _compute_auto_spatial_tangents(keyframes)
+                if any(getattr(kf, "spatial_auto_bezier", False) for kf in keyframes)
+                else None
+            )
+        return self._auto_tangents  # type: ignore[return-value]
+
+    def _get_auto_ease(self) -> list[tuple[float, float, float, float]] | None:
+        """Temporal ease of the whole track, if any key is auto-bezier."""
+        if self._auto_ease is False:
+            keyframes = self.keyframes
+            self._auto_ease = (
+                _compute_auto_temporal_ease(keyframes)
+                if any(getattr(kf, "temporal_auto_bezier", False) for kf in keyframes)
+                else None
+            )
+        return self._auto_ease  # type: ignore[return-value]
+
+    def _compile_segment(self, left_idx: int) -> _Segment:
+        """Compile the segment between keyframes *left_idx* and the next."""
+        right_idx = left_idx + 1
+        kf_left = self.keyframes[left_idx]
+        kf_right = self.keyframes[right_idx]
+        t0 = self.times[left_idx]
+        t1 = self.times[right_idx]
+        v0 = self.values[left_idx]
+        v1 = self.values[right_idx]
+
+        # Determine interpolation type
+        out_type = kf_left.out_interpolation_type
+        in_type = kf_right.in_interpolation_type
+
+        # HOLD
+        if out_type == KeyframeInterpolationType.HOLD:
+            return _ConstantSegment(v0)
+        if in_type == KeyframeInterpolationType.HOLD:
+            return _ConstantSegment(v1)
+
+        # LINEAR
+        if out_type == KeyframeInterpolationType.LINEAR:
+            return _compile_linear(t0, t1, v0, v1)
+
+        if out_type != KeyframeInterpolationType.BEZIER:
+            return _ConstantSegment(v0)
+
+        # BEZIER
+        if self.is_spatial and isinstance(v0, list) and isinstance(v1, list):
             out_tan_ov: list[float] | None = None
             in_tan_ov: list[float] | None = None
+            auto_tangents = self._get_auto_tangents()
             if auto_tangents:
                 out_tan_ov = auto_tangents[left_idx][0]
                 in_tan_ov = auto_tangents[right_idx][1]
-            return _interpolate_spatial_bezier(
-                time,
+            return _compile_spatial_bezier(
                 t0,
                 t1,
                 kf_left,
                 kf_right,
+                v0,
+                v1,
                 out_tan_override=out_tan_ov,
                 in_tan_override=in_tan_ov,
+                path_tolerance=self.path_tolerance,
             )
 
         # Non-spatial: per-dimension 1D bezier
         out_ov: tuple[float, float] | None = None
         in_ov: tuple[float, float] | None = None
+        auto_ease = self._get_auto_ease()
         if auto_ease:
             ae_left = auto_ease[left_idx]
             ae_right = auto_ease[right_idx]
@@ -837,32 +1485,23 @@ def interpolate_keyframes(
             in_ov = (ae_right[2], ae_right[3])
 
         if isinstance(v0, list) and isinstance(v1, list):
-            result: list[float] = []
-            for d in range(len(v0)):
-                out_e = (
-                    kf_left.out_temporal_ease[d]
-                    if d < len(kf_left.out_temporal_ease)
-                    else kf_left.out_temporal_ease[0]
-                )
-                in_e = (
-                    kf_right.in_temporal_ease[d]
-                    if d < len(kf_right.in_temporal_ease)
-                    else kf_right.in_temporal_ease[0]
-                )
-                result.append(
-                    _interpolate_bezier_1d(
-                        time,
+            out_eases = kf_left.out_temporal_ease
+            in_eases = kf_right.in_temporal_ease
+            return _BezierNDSegment(
+                [
+                    _compile_bezier_1d(
                         t0,
                         t1,
                         v0[d],
                         v1[d],
-                        out_e,
-                        in_e,
+                        out_eases[d] if d < len(out_eases) else out_eases[0],
+                        in_eases[d] if d < len(in_eases) else in_eases[0],
                         out_override=out_ov,
                         in_override=in_ov,
                     )
-                )
-            return result
+                    for d in range(len(v0))
+                ]
+            )
 
         if isinstance(v0, (int, float)) and isinstance(v1, (int, float)):
             out_e_1d = (
@@ -872,8 +1511,7 @@ def interpolate_keyframes(
                 kf_right.in_temporal_ease[0] if kf_right.in_temporal_ease else None
             )
             if out_e_1d and in_e_1d:
-                return _interpolate_bezier_1d(
-                    time,
+                return _compile_bezier_1d(
                     t0,
                     t1,
                     float(v0),
@@ -883,8 +1521,41 @@ def interpolate_keyframes(
                     out_override=out_ov,
                     in_override=in_ov,
                 )
-            ratio = (time - t0) / (t1 - t0)
-            return float(v0) + (float(v1) - float(v0)) * ratio
+            return _compile_linear(t0, t1, v0, v1)
 
-    # Fallback
-    return cast("list[float] | float | None", v0)
+        # Fallback
+        return _ConstantSegment(v0)
+
+
+# ---------------------------------------------------------------------------
+# Public entry point
+# ---------------------------------------------------------------------------
+
+
+def interpolate_keyframes(
+    time: float,
+    keyframes: list[Keyframe],
+    is_spatial: bool,
+) -> list[float] | float | None:
+    """Compute the interpolated value at *time* from a keyframe list.
+
+    Uses lottie-web's algorithms:
+    - BezierEasing for temporal ease (normalized unit-square bezier)
+    - Polyline path approximation for spatial bezier
+    - Linear arc-length interpolation along sampled path
+
+    This compiles a throwaway `KeyframeCurve`. To evaluate the same
+    keyframes repeatedly, build the curve once and call
+    `KeyframeCurve.value_at` instead.
+
+    Args:
+        time: Time in seconds.
+        keyframes: Sorted list of keyframes.
+        is_spatial: Whether the property is spatial.
+
+    Returns:
+        Interpolated value, or `None` if no keyframes.
+    """
+    if not keyframes:
+        return None
+    return KeyframeCurve(keyframes, is_spatial).value_at(time)
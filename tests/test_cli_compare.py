@@ -10,12 +10,22 @@ from __future__ import annotations
 from pathlib import Path
 
 from py_aep.cli.compare import (
+    MISSING_BYTE,
     ByteDifference,
     ChunkDifference,
+    ChunkDigest,
+    ChunkEdit,
     MultiFileDifference,
     _compare_chunk_dicts,
     _format_hex_dump,
+    _leaf_digest,
+    _list_digest,
+    align_digest_trees,
+    chunk_digest_tree,
     compare_binary_data,
+    compare_digest_trees,
+    diff_columns,
+    diff_ranges,
     filter_differences,
     parse_aep_chunks,
     to_json_output,
@@ -99,6 +109,75 @@ class TestCompareBinaryData:
         assert diffs[0].byte2 == 0x03
 
 
+class TestDiffRanges:
+    """Tests for diff_ranges function."""
+
+    def test_identical(self) -> None:
+        data = bytes(range(256)) * 10
+        assert diff_ranges(data, bytes(data), "test") == []
+
+    def test_adjacent_bytes_coalesced(self) -> None:
+        data1 = bytes(1000)
+        data2 = bytearray(data1)
+        data2[60:70] = b"\xff" * 10
+        data2[500] = 1
+        ranges = diff_ranges(data1, bytes(data2), "test")
+        assert [(r.start, r.end) for r in ranges] == [(60, 70), (500, 501)]
+        assert ranges[0].bytes1 == bytes(10)
+        assert ranges[0].bytes2 == b"\xff" * 10
+
+    def test_matches_byte_by_byte_scan(self) -> None:
+        data1 = bytes(i * 7 % 251 for i in range(5000))
+        data2 = bytearray(data1)
+        for offset in (0, 1, 63, 64, 65, 127, 128, 2048, 4095, 4999):
+            data2[offset] ^= 0x10
+        expected = [i for i, (a, b) in enumerate(zip(data1, data2)) if a != b]
+        diffs = list(compare_binary_data(data1, bytes(data2), "test"))
+        assert [d.offset for d in diffs] == expected
+        assert all(d.bit_position == 3 for d in diffs)
+
+    def test_extra_bytes_range(self) -> None:
+        ranges = diff_ranges(b"\x00\x01", b"\x00\x02\x03\x04", "test")
+        assert [(r.start, r.end) for r in ranges] == [(1, 4)]
+        assert ranges[0].bytes1 == b"\x01"
+        assert ranges[0].format_diff() == (
+            "  Offset    1-3 (0x0001-0x0003), 3 bytes: 01 vs 02 03 04"
+        )
+
+        ranges = diff_ranges(b"\x00\x01", b"\x00\x03", "test")
+        assert ranges[0].format_diff().endswith(", bit 6")
+
+    def test_chunk_dicts_without_per_byte(self) -> None:
+        diffs, _, _ = _compare_chunk_dicts(
+            {"a": b"\x00\x00\x00"}, {"a": b"\x01\x01\x00"}, per_byte=False
+        )
+        assert diffs[0].byte_diffs == []
+        assert diffs[0].num_byte_differences() == 2
+
+
+class TestDiffColumns:
+    """Tests for diff_columns()."""
+
+    def test_identical(self) -> None:
+        assert diff_columns([b"abc"] * 4, "p") == []
+
+    def test_matches_per_offset_scan(self) -> None:
+        base = bytes(range(200))
+        data_list = [base, base[:150] + b"\xff" + base[151:], base[:100], base + b"x"]
+        diffs = diff_columns(data_list, "p")
+        assert [(d.offset, d.values) for d in diffs] == [
+            (150, [150, 0xFF, MISSING_BYTE, 150]),
+        ]
+
+    def test_shorter_files_are_missing(self) -> None:
+        diffs = diff_columns([b"ab", b"a", b"aC", b""], "p")
+        assert [(d.offset, d.values) for d in diffs] == [
+            (1, [ord("b"), MISSING_BYTE, ord("C"), MISSING_BYTE]),
+        ]
+        # A byte only one file has is not a difference.
+        assert diff_columns([b"ab", b"a"], "p") == []
+
+
 class TestLeafOnlyChunks:
     """Tests that only leaf chunks appear in parsed output (no LIST dups)."""
 
@@ -146,6 +225,114 @@ class TestCompareChunkDicts:
         assert "c" in only2
 
 
+def _leaf(path: str, data: bytes) -> ChunkDigest:
+    return ChunkDigest(path, "tdb4", _leaf_digest("tdb4", data), data)
+
+
+def _list(path: str, *children: ChunkDigest) -> ChunkDigest:
+    return ChunkDigest(
+        path,
+        "LIST:Fold",
+        _list_digest("LIST:Fold", list(children)),
+        None,
+        list(children),
+    )
+
+
+class TestChunkDigestTree:
+    """Tests for chunk_digest_tree() and compare_digest_trees()."""
+
+    def test_matches_flat_comparison(self) -> None:
+        tree1 = _list(
+            "",
+            _list("A", _leaf("A/x", b"\x00\x01"), _leaf("A/y", b"\x02")),
+            _list("B", _leaf("B/x", b"\x03"), _leaf("B/e", b"")),
+            _leaf("c", b"\x04"),
+        )
+        tree2 = _list(
+            "",
+            _list("A", _leaf("A/x", b"\x00\x01"), _leaf("A/y", b"\x02")),
+            _list("B", _leaf("B/x", b"\x05"), _leaf("B/e", b"\x06")),
+            _list("D", _leaf("D/z", b"\x07")),
+        )
+        flat1 = {leaf.path: leaf.data for leaf in tree1.iter_leaves()}
+        flat2 = {leaf.path: leaf.data for leaf in tree2.iter_leaves()}
+        diffs, only1, only2 = compare_digest_trees(tree1, tree2)
+        expected = _compare_chunk_dicts(flat1, flat2)  # type: ignore[arg-type]
+        assert [d.path for d in diffs] == [d.path for d in expected[0]] == ["B/x"]
+        assert diffs[0].byte_diffs == expected[0][0].byte_diffs
+        assert (only1, only2) == (expected[1], expected[2]) == (["c"], ["B/e", "D/z"])
+
+    def test_equal_subtrees_are_skipped(self) -> None:
+        tree1 = _list("", _list("A", _leaf("A/x", b"\x00")))
+        # Same digests with different data: only a descent would see it.
+        tree2 = _list("", _list("A", _leaf("A/x", b"\x01")))
+        tree2.children[0].digest = tree1.children[0].digest
+        assert compare_digest_trees(tree1, tree2) == ([], [], [])
+
+    def test_identical_file(self) -> None:
+        aep_path = SAMPLES_DIR / "versions" / "ae2025" / "complete.aep"
+        tree = chunk_digest_tree(aep_path)
+        flat = {leaf.path: leaf.data for leaf in tree.iter_leaves()}
+        assert flat == parse_aep_chunks(aep_path)
+        assert chunk_digest_tree(aep_path).digest == tree.digest
+        assert compare_digest_trees(tree, tree) == ([], [], [])
+
+
+def _siblings(*payloads: bytes) -> ChunkDigest:
+    return _list("", *[_leaf(f"tdb4[{i}]", data) for i, data in enumerate(payloads)])
+
+
+class TestAlignDigestTrees:
+    """Tests for align_digest_trees()."""
+
+    def test_insertion_does_not_shift(self) -> None:
+        tree1 = _siblings(b"a", b"b", b"c")
+        tree2 = _siblings(b"a", b"new", b"b", b"c")
+        diffs, edits = align_digest_trees(tree1, tree2)
+        assert diffs == []
+        assert edits == [ChunkEdit("inserted", None, "tdb4[1]", 3)]
+
+    def test_changed_chunk_after_insertion(self) -> None:
+        tree1 = _siblings(b"a", b"b", b"c")
+        tree2 = _siblings(b"new", b"a", b"B", b"c")
+        diffs, edits = align_digest_trees(tree1, tree2)
+        assert [(d.path, d.path2) for d in diffs] == [("tdb4[1]", "tdb4[2]")]
+        assert edits == [ChunkEdit("inserted", None, "tdb4[0]", 3)]
+
+    def test_moves_and_deletions(self) -> None:
+        tree1 = _list(
+            "",
+            _list("A", _leaf("A/x", b"xx"), _leaf("A/y", b"y")),
+            _leaf("b", b"b"),
+            _leaf("c", b"c"),
+        )
+        tree2 = _list("", _leaf("c", b"c"), _leaf("b", b"b"))
+        diffs, edits = align_digest_trees(tree1, tree2)
+        assert diffs == []
+        assert sorted(edits, key=lambda edit: edit.kind) == [
+            ChunkEdit("deleted", "A", None, 3),
+            ChunkEdit("moved", "b", "b", 1),
+        ]
+
+    def test_duplicate_siblings_are_compared(self) -> None:
+        tree1 = _siblings(b"a", b"a")
+        tree2 = _siblings(b"a", b"b")
+        diffs, edits = align_digest_trees(tree1, tree2)
+        assert [(d.path, d.path2) for d in diffs] == [("tdb4[1]", None)]
+        assert edits == []
+
+    def test_unmoved_duplicates_between_changes(self) -> None:
+        tree1 = _siblings(b"k1", b"d", b"d", b"k2")
+        tree2 = _siblings(b"k9", b"d", b"d", b"k8")
+        diffs, edits = align_digest_trees(tree1, tree2)
+        assert [(d.path, d.path2) for d in diffs] == [
+            ("tdb4[0]", None),
+            ("tdb4[3]", None),
+        ]
+        assert edits == []
+
+
 class TestFormatHexDump:
     """Tests for _format_hex_dump helper."""
 
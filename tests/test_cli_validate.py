@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 from conftest import load_expected, parse_project
 
@@ -22,6 +24,20 @@ from py_aep.enums import BlendingMode
 SAMPLES_DIR = Path(__file__).parent.parent / "samples"
 
 
+class _Unconvertible(dict):  # type: ignore[type-arg]
+    def items(self) -> Any:
+        raise RuntimeError("cannot convert")
+
+
+@dataclass
+class _Model:
+    value: int = 1
+
+    @property
+    def nested(self) -> _Unconvertible:
+        return _Unconvertible()
+
+
 class TestToDict:
     """Tests for to_dict() serialization."""
 
@@ -49,6 +65,9 @@ class TestToDict:
         assert to_dict("hello") == "hello"
         assert to_dict(None) is None
 
+    def test_unconvertible_property_is_skipped(self) -> None:
+        assert to_dict(_Model()) == {"value": 1}
+
 
 class TestGetEnumValue:
     """Tests for get_enum_value()."""
@@ -0,0 +1,164 @@
+"""Tests for the COS parser and serializer."""
+
+from __future__ import annotations
+
+import io
+
+import pytest
+
+from py_aep.cos import (
+    CosEvent,
+    CosParser,
+    IndirectObject,
+    IndirectReference,
+    Stream,
+    extract_cos_path,
+    iter_cos_events,
+    serialize,
+)
+
+
+def _parse(data: bytes) -> object:
+    return CosParser(data).parse()
+
+
+class TestCosParser:
+    """Tests for CosParser.parse()."""
+
+    def test_top_level_dict(self) -> None:
+        assert _parse(b"/a 1 /b 2.5 /c true /d null") == {
+            "a": 1,
+            "b": 2.5,
+            "c": True,
+            "d": None,
+        }
+
+    def test_nested_containers(self) -> None:
+        assert _parse(b"/a << /b [1 -2 .5 +3] >> /c []") == {
+            "a": {"b": [1, -2, 0.5, 3]},
+            "c": [],
+        }
+
+    def test_whitespace_and_comments(self) -> None:
+        assert _parse(b"% header\n/a\r\n\t1 % trailing\n/b 2") == {"a": 1, "b": 2}
+
+    def test_string_escapes(self) -> None:
+        assert _parse(rb"/s (a\(b\)c\\d\n\101)") == {"s": "a(b)c\\d\nA"}
+
+    def test_string_newlines_are_normalized(self) -> None:
+        assert _parse(b"/s (a\r\nb\rc\n\rd)") == {"s": "a\nb\nc\nd"}
+
+    def test_utf16_string(self) -> None:
+        data = b"/s (\xfe\xff" + "日本".encode("utf-16-be") + b")"
+        assert _parse(data) == {"s": "日本"}
+
+    def test_hex_string(self) -> None:
+        assert _parse(b"/h <41 4 2>") == {"h": b"A\x42"}
+        assert _parse(b"/h <414>") == {"h": b"A@"}
+
+    def test_identifier_escapes(self) -> None:
+        assert _parse(b"/a#20b 1") == {"a b": 1}
+
+    def test_indirect_objects(self) -> None:
+        assert _parse(b"/r 1 0 R /o 2 0 obj (x) endobj /n 3 /m 4") == {
+            "r": IndirectReference(1, 0),
+            "o": IndirectObject(2, 0, "x"),
+            "n": 3,
+            "m": 4,
+        }
+        assert _parse(b"[1 2]") == [1, 2]
+
+    def test_stream(self) -> None:
+        assert _parse(b"/s << /L 3 >> stream\r\nabcendstream") == {
+            "s": Stream({"L": 3}, b"abc")
+        }
+
+    def test_max_pos_limits_input(self) -> None:
+        assert CosParser(b"/a 1 /b 2", 4).parse() == {"a": 1}
+
+    def test_memoryview_and_file_input(self) -> None:
+        data = b"/a [1 (x)]"
+        assert CosParser(memoryview(data)).parse() == {"a": [1, "x"]}
+        assert CosParser(io.BytesIO(data), len(data)).parse() == {"a": [1, "x"]}
+
+    @pytest.mark.parametrize(
+        "data", [b"/s (abc", b"/h <4x>", b"/a > 1", b"/k foo", b"/s (\\q)", b"/a#2"]
+    )
+    def test_invalid_input(self, data: bytes) -> None:
+        with pytest.raises(SyntaxError):
+            _parse(data)
+
+    def test_serialize_roundtrip(self) -> None:
+        tree = {
+            "a": {"b": [1, 2.5, "text (with) parens", "日本", b"\x00\xff"]},
+            "c": [True, False, None],
+            "d": IndirectReference(1, 0),
+        }
+        assert _parse(serialize(tree)) == tree
+
+    def test_serialize_separators(self) -> None:
+        tree = {"a": [1, -2, 0.5], "b": "x", "c": {"d": True, "e": None}, "f": b"\x01"}
+        assert serialize(tree) == b"/a [1 -2 0.5]/b (x)/c <</d true/e null>>/f <01>"
+
+
+class TestCosEvents:
+    """Tests for iter_cos_events() and extract_cos_path()."""
+
+    def test_events(self) -> None:
+        events = list(iter_cos_events(b"/a [1 (x)] /b << /c 2 0 R >>"))
+        assert events == [
+            (CosEvent.DictStart, None),
+            (CosEvent.Key, "a"),
+            (CosEvent.ArrayStart, None),
+            (CosEvent.Value, 1),
+            (CosEvent.Value, "x"),
+            (CosEvent.ArrayEnd, None),
+            (CosEvent.Key, "b"),
+            (CosEvent.DictStart, None),
+            (CosEvent.Key, "c"),
+            (CosEvent.Value, IndirectReference(2, 0)),
+            (CosEvent.DictEnd, None),
+            (CosEvent.DictEnd, None),
+        ]
+
+    def test_object_and_stream_events(self) -> None:
+        events = list(
+            iter_cos_events(b"/o 1 0 obj << /L 1 >> stream\nzendstream endobj")
+        )
+        assert events[2:] == [
+            (CosEvent.ObjectStart, (1, 0)),
+            (CosEvent.DictStart, None),
+            (CosEvent.Key, "L"),
+            (CosEvent.Value, 1),
+            (CosEvent.StreamEnd, b"z"),
+            (CosEvent.ObjectEnd, None),
+            (CosEvent.DictEnd, None),
+        ]
+
+    def test_deep_nesting(self) -> None:
+        depth = 5000
+        data = b"/a " + b"[" * depth + b"1" + b"]" * depth
+        assert sum(1 for _ in iter_cos_events(data)) == 2 * depth + 4
+        assert extract_cos_path(data, ("a",) + (0,) * depth) == 1
+
+    def test_invalid_input(self) -> None:
+        with pytest.raises(SyntaxError):
+            list(iter_cos_events(b"/a [1 2"))
+
+    def test_extract_cos_path(self) -> None:
+        data = b"/0 << /1 << /0 [(A) (B)] >> >> /1 << /1 [<< /0 (doc) >>] >>"
+        assert extract_cos_path(data, ("0", "1", "0")) == ["A", "B"]
+        assert extract_cos_path(data, ("1", "1", 0, "0")) == "doc"
+        assert extract_cos_path(data, ()) == CosParser(data).parse()
+        assert extract_cos_path(data, ("0", "2")) is None
+        assert extract_cos_path(data, ("1", "1", 5)) is None
+
+    def test_extract_stops_reading(self) -> None:
+        assert extract_cos_path(b"/a 1 /b 2 /c <4x>", ("a",)) == 1
+        with pytest.raises(SyntaxError):
+            extract_cos_path(b"/a 1 /b 2 /c <4x>", ("c",))
+
+    def test_extract_indirect_object(self) -> None:
+        data = b"/o 1 0 obj [1 2] endobj"
+        assert extract_cos_path(data, ("o",)) == IndirectObject(1, 0, [1, 2])
+        assert extract_cos_path(data, ("o", 1)) == 2
@@ -9,15 +9,19 @@ import pytest
 from conftest import (
     get_comp,
     get_comp_from_json_by_name,
+    get_layer,
     load_expected,
     parse_project,
 )
 
 from py_aep import parse as parse_aep
 from py_aep.enums import GuideOrientationType
+from py_aep.models.columns import iter_property_paths, path_selected
+from py_aep.models.items.composition import CompItem
 from py_aep.models.layers import (
     AVLayer,
     CameraLayer,
+    Layer,
     LightLayer,
     ShapeLayer,
     TextLayer,
@@ -28,6 +32,7 @@ from py_aep.models.sources.solid import SolidSource
 SAMPLES_DIR = Path(__file__).parent.parent / "samples" / "models" / "composition"
 LAYER_SAMPLES_DIR = Path(__file__).parent.parent / "samples" / "models" / "layer"
 FOOTAGE_SAMPLES_DIR = Path(__file__).parent.parent / "samples" / "models" / "footage"
+PROPERTY_SAMPLES_DIR = Path(__file__).parent.parent / "samples" / "models" / "property"
 
 
 class TestCompItemBasic:
@@ -465,6 +470,14 @@ class TestCompItemLayerFiltering:
         assert len(comp.solo_layers) == 1
         assert all(layer.solo for layer in comp.solo_layers)
 
+    def test_switched_on_layers(self) -> None:
+        comp = get_comp(
+            parse_project(LAYER_SAMPLES_DIR / "layer_switches.aep"), "solo_true"
+        )
+        assert comp.switched_on_layers == [
+            layer for layer in comp.solo_layers if layer.enabled
+        ]
+
     def test_empty_text_layers(self) -> None:
         """A comp with only a shape layer has no text layers."""
         comp = get_comp(parse_project(LAYER_SAMPLES_DIR / "type.aep"), "type_shape")
@@ -1369,3 +1382,126 @@ class TestRoundtripEssentialGraphics:
         comp.motion_graphics_template_name = "Created Template"
         assert comp.motion_graphics_template_name == "Created Template"
         assert comp.motion_graphics_template_controller_count == 0
+
+
+class TestBake:
+    """Tests for CompItem.bake."""
+
+    def _comp(self) -> tuple[CompItem, Layer]:
+        # Not the cached parse_project: some tests modify the layer.
+        project = parse_aep(PROPERTY_SAMPLES_DIR / "keyframe_LINEAR.aep").project
+        comp = project.compositions[0]
+        return comp, comp.layers[0]
+
+    def test_matches_values_at_times(self) -> None:
+        comp, layer = self._comp()
+        baked = comp.bake(use_numpy=False)[layer.id]
+        assert baked.layer_id == layer.id
+        assert baked.times
+        assert baked.values
+        for path, values in baked.values.items():
+            prop = next(p for q, p in iter_property_paths(layer) if q == path)
+            assert values == prop.values_at_times(baked.times, use_numpy=False)
+
+    def test_only_animated_properties(self) -> None:
+        comp, layer = self._comp()
+        baked = comp.bake(use_numpy=False)[layer.id]
+        animated = {p for p, prop in iter_property_paths(layer) if prop.keyframes}
+        assert set(baked.values) <= animated
+
+    def test_honors_in_and_out_point(self) -> None:
+        comp, layer = self._comp()
+        layer.in_point = 0.5
+        layer.out_point = 1.0
+        baked = comp.bake(fps=10, use_numpy=False)[layer.id]
+        assert baked.times == pytest.approx([0.5, 0.6, 0.7, 0.8, 0.9])
+
+    def test_skips_disabled_layer(self) -> None:
+        comp, layer = self._comp()
+        layer.enabled = False
+        assert layer.id not in comp.bake(use_numpy=False)
+
+    def test_properties_filter(self) -> None:
+        comp, layer = self._comp()
+        baked = comp.bake(properties=["ADBE Transform Group"], use_numpy=False)
+        paths = baked[layer.id].values
+        assert all(path.startswith("ADBE Transform Group/") for path in paths)
+
+    def test_path_selected(self) -> None:
+        position = "ADBE Transform Group/ADBE Position"
+        assert path_selected(position, None)
+        assert path_selected(position, {position})
+        assert path_selected(position, {"ADBE Transform Group"})
+        assert not path_selected(position, {"ADBE Transform"})
+        assert not path_selected(position, set())
+
+    def test_numpy(self) -> None:
+        np = pytest.importorskip("numpy")
+        comp, layer = self._comp()
+        baked = comp.bake(use_numpy=True)[layer.id]
+        expected = comp.bake(use_numpy=False)[layer.id]
+        assert isinstance(baked.times, np.ndarray)
+        for path, values in baked.values.items():
+            assert np.allclose(values, np.asarray(expected.values[path]))
+
+    def test_processes(self) -> None:
+        comp, _ = self._comp()
+        serial = comp.bake(use_numpy=False)
+        parallel = comp.bake(processes=2, use_numpy=False)
+        assert parallel == serial
+
+    def test_rejects_reversed_range(self) -> None:
+        comp, _ = self._comp()
+        with pytest.raises(ValueError):
+            comp.bake(start=2.0, end=1.0)
+
+
+class TestEvaluateNested:
+    """Tests for CompItem.evaluate_nested."""
+
+    def test_top_level_layers_match_values_at_times(self) -> None:
+        project = parse_project(PROPERTY_SAMPLES_DIR / "keyframe_LINEAR.aep")
+        comp = project.compositions[0]
+        layer = comp.layers[0]
+        times = [0.0, 0.5, 1.0]
+        frames = comp.evaluate_nested(times)
+        assert len(frames) == len(times)
+        for time, samples in zip(times, frames):
+            sample = next(s for s in samples if s.layer_path == (layer.id,))
+            assert sample.comp_id == comp.id
+            assert sample.time == time
+            assert sample.display_time == time + comp.display_start_time
+            for path, value in sample.values.items():
+                prop = next(p for q, p in iter_property_paths(layer) if q == path)
+                assert value == prop.value_at_time(time)
+
+    def test_empty_properties(self) -> None:
+        project = parse_project(PROPERTY_SAMPLES_DIR / "keyframe_LINEAR.aep")
+        comp = project.compositions[0]
+        frames = comp.evaluate_nested([0.0], properties=[])
+        assert frames[0]
+        assert all(sample.values == {} for sample in frames[0])
+
+    def test_nested_layers_follow_precomp_layer(self) -> None:
+        # Precomp layer of a 5 s composition, starting at 3 s.
+        precomp_layer = get_layer(
+            parse_project(LAYER_SAMPLES_DIR / "outPoint_clamp.aep"),
+            "outPoint_clamp_with_startTime",
+        )
+        assert isinstance(precomp_layer, AVLayer)
+        assert isinstance(precomp_layer.source, CompItem)
+        assert precomp_layer.start_time == pytest.approx(3.0)
+        assert precomp_layer.source_time(4.0) == pytest.approx(1.0)
+
+        comp = precomp_layer.containing_comp
+        samples = comp.evaluate_nested([4.0], properties=[])[0]
+        nested = [s for s in samples if s.layer_path[0] == precomp_layer.id]
+        assert nested
+        assert nested[0].layer_path == (precomp_layer.id,)
+        assert nested[0].comp_id == comp.id
+        assert nested[0].time == 4.0
+        for sample in nested[1:]:
+            assert len(sample.layer_path) >= 2
+            if len(sample.layer_path) == 2:
+                assert sample.comp_id == precomp_layer.source.id
+                assert sample.time == pytest.approx(1.0)
@@ -28,6 +28,7 @@ from py_aep.enums import (
     PropertyType,
     TrackMatteType,
 )
+from py_aep.models.items.composition import CompItem
 from py_aep.models.layers import (
     AVLayer,
     CameraLayer,
@@ -38,6 +39,7 @@ from py_aep.models.layers import (
 from py_aep.models.layers.three_d_model_layer import ThreeDModelLayer
 from py_aep.models.properties.property_base import PropertyBase
 from py_aep.models.properties.property_group import PropertyGroup
+from py_aep.models.transform import multiply_matrices, transform_point
 
 SAMPLES_DIR = Path(__file__).parent.parent / "samples" / "models" / "layer"
 BUGS_DIR = Path(__file__).parent.parent / "samples" / "bugs"
@@ -665,9 +667,101 @@ class TestParenting:
                         assert child_layer._parent_id == layer_json["parent"]
 
 
+class TestTransformMatrix:
+    """Tests for layer transform and world matrices."""
+
+    def _parent_comp(self) -> CompItem:
+        return get_comp(parse_project(SAMPLES_DIR / "layer_misc.aep"), "parent")
+
+    @pytest.mark.parametrize(
+        "sample", ["layer_misc", "orientation_0_0_5", "orientation_5_0_0"]
+    )
+    def test_anchor_point_maps_to_position(self, sample: str) -> None:
+        layer = get_first_layer(parse_project(SAMPLES_DIR / f"{sample}.aep"))
+        matrix = layer.transform_matrix_at(0.0)
+        anchor = layer.transform["ADBE Anchor Point"].value_at_time(0.0)
+        position = layer.transform["ADBE Position"].value_at_time(0.0)
+        assert transform_point(matrix, anchor)[:2] == pytest.approx(position[:2])
+
+    def test_3d_rotations_ground_truth(self) -> None:
+        # Not the cached parse_project: the transform is modified.
+        project = parse_aep(SAMPLES_DIR / "orientation_5_0_0.aep").project
+        layer = get_first_layer(project)
+        assert layer.three_d_layer
+        assert layer.parent is None
+        values = {
+            "ADBE Anchor Point": [10.0, 20.0, 30.0],
+            "ADBE Position": [100.0, 200.0, 300.0],
+            "ADBE Scale": [200.0, 100.0, 50.0],
+            "ADBE Orientation": [0.0, 0.0, 90.0],
+            "ADBE Rotate X": 90.0,
+            "ADBE Rotate Y": 90.0,
+            "ADBE Rotate Z": 90.0,
+        }
+        for match_name, value in values.items():
+            prop = layer.transform[match_name]
+            assert not prop.keyframes
+            prop.value = value
+        # Z, Y and X Rotation, then Orientation, turn the layer's x axis
+        # to +z, its y axis to +x and its z axis to +y. The columns are
+        # those axes times the scale, and the anchor point lands on the
+        # position.
+        expected = [
+            [0.0, 1.0, 0.0, 80.0],
+            [0.0, 0.0, 0.5, 185.0],
+            [2.0, 0.0, 0.0, 280.0],
+            [0.0, 0.0, 0.0, 1.0],
+        ]
+        for matrix in (layer.transform_matrix_at(0.0), layer.world_matrix_at(0.0)):
+            for row, expected_row in zip(matrix, expected):
+                assert row == pytest.approx(expected_row, abs=1e-9)
+        matrix = layer.transform_matrix_at(0.0)
+        assert transform_point(matrix, [11.0, 20.0, 30.0]) == pytest.approx(
+            [100.0, 200.0, 302.0]
+        )
+        assert transform_point(matrix, [10.0, 21.0, 30.0]) == pytest.approx(
+            [101.0, 200.0, 300.0]
+        )
+
+    def test_world_matrix_includes_parent(self) -> None:
+        comp = self._parent_comp()
+        child = next(layer for layer in comp.layers if layer.parent is not None)
+        parent = child.parent
+        assert parent is not None
+        expected = multiply_matrices(
+            parent.world_matrix_at(0.5), child.transform_matrix_at(0.5)
+        )
+        assert child.world_matrix_at(0.5) == expected
+
+    def test_world_matrices_at_matches_single_time(self) -> None:
+        comp = self._parent_comp()
+        times = [0.0, 0.25, 0.5]
+        batch = comp.world_matrices_at(times)
+        assert set(batch) == {layer.id for layer in comp.layers}
+        for layer in comp.layers:
+            assert layer.world_matrices_at(times) == batch[layer.id]
+            for time, matrix in zip(times, batch[layer.id]):
+                assert matrix == layer.world_matrix_at(time)
+
+
 class TestTimeRemap:
     """Tests for time remap."""
 
+    def test_source_time_without_remap(self) -> None:
+        # Not the cached parse_project: the layer is modified.
+        project = parse_aep(SAMPLES_DIR / "avlayer_flags.aep").project
+        layer = get_layer(project, "timeRemapEnabled_true")
+        layer.time_remap_enabled = False
+        expected = (1.5 - layer.start_time) * 100.0 / (layer.stretch or 100.0)
+        assert layer.source_time(1.5) == pytest.approx(expected)
+
+    def test_source_time_with_remap(self) -> None:
+        layer = get_layer(
+            parse_project(SAMPLES_DIR / "avlayer_flags.aep"), "timeRemapEnabled_true"
+        )
+        remap = layer["ADBE Time Remapping"]
+        assert layer.source_time(0.5) == remap.value_at_time(0.5)
+
     def test_timeRemapEnabled_true(self) -> None:
         expected = load_expected(SAMPLES_DIR, "avlayer_flags")
         layer = get_layer(
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import io
+import json
 from pathlib import Path
 
+import pytest
 from conftest import load_expected, parse_project
 
 from py_aep import parse as parse_aep
+from py_aep.cli.validate import to_dict
 from py_aep.enums import (
     BitsPerChannel,
     ColorManagementSystem,
@@ -17,6 +21,10 @@ from py_aep.enums import (
     LutInterpolationMethod,
     TimeDisplayType,
 )
+from py_aep.kaitai.proxy import ProxyBody
+from py_aep.models.properties.property_group import PropertyGroup
+from py_aep.models.selector import _matching_descendants
+from py_aep.models.serialize import iter_json
 
 SAMPLES_DIR = Path(__file__).parent.parent / "samples" / "models" / "project"
 
@@ -873,3 +881,133 @@ class TestIdempotency:
         roundtrip_bytes = out.read_bytes()
 
         assert original_bytes == roundtrip_bytes
+
+
+class TestSelect:
+    """Tests for Project.select path selectors."""
+
+    LAYER_SAMPLES = Path(__file__).parent.parent / "samples" / "models" / "layer"
+
+    def test_text_document_path(self) -> None:
+        project = parse_project(self.LAYER_SAMPLES / "type.aep")
+        results = list(
+            project.select(
+                "comp[name=type_text]/layer[type=text]"
+                "/ADBE Text Properties/ADBE Text Document"
+            )
+        )
+        assert len(results) == 1
+        assert results[0].match_name == "ADBE Text Document"
+        assert results[0].value.text == "TextLayer"
+
+    def test_display_names(self) -> None:
+        project = parse_project(self.LAYER_SAMPLES / "type.aep")
+        by_match_name = list(
+            project.select("comp/layer/ADBE Transform Group/ADBE Position")
+        )
+        by_display_name = list(project.select("comp/layer/Transform/Position"))
+        assert by_match_name
+        assert by_match_name == by_display_name
+
+    def test_recursive_step(self) -> None:
+        project = parse_project(self.LAYER_SAMPLES / "type.aep")
+        direct = list(project.select("layer/ADBE Transform Group/ADBE Opacity"))
+        recursive = list(project.select("layer/**/ADBE Opacity"))
+        assert direct
+        assert all(prop in recursive for prop in direct)
+
+    def test_recursive_step_uses_index(self) -> None:
+        project = parse_project(self.LAYER_SAMPLES / "type.aep")
+        expected = [
+            prop
+            for layer in project.select("layer")
+            for prop in _matching_descendants(layer, "ADBE Position")
+        ]
+        assert expected
+        assert list(project.select("layer/**/ADBE Position")) == expected
+
+    def test_nested_recursive_inputs_are_deduplicated(self) -> None:
+        project = parse_project(self.LAYER_SAMPLES / "type.aep")
+        results = list(project.select("layer/**/*/**/*"))
+        assert results
+        assert len({id(prop) for prop in results}) == len(results)
+
+    def test_descendants_in_document_order(self) -> None:
+        def make_group(match_name: str) -> PropertyGroup:
+            return PropertyGroup(
+                _tdsb=ProxyBody(enabled=1),
+                match_name=match_name,
+                property_depth=1,
+                properties=[],
+            )
+
+        inner = [make_group("ADBE Effect Built In Params") for _ in range(2)]
+        for group in inner:
+            group._synthesize_children()
+        root = make_group("ADBE Effect Parade")
+        root.properties = inner
+        everything = list(_matching_descendants(root, None))
+        assert everything[:2] == [inner[0], inner[0].properties[0]]
+        for name in {prop.match_name for prop in everything}:
+            found = list(_matching_descendants(root, name))
+            assert found == [p for p in everything if p.match_name == name]
+            assert len(found) == 2
+
+    def test_layer_type_filter(self) -> None:
+        project = parse_project(self.LAYER_SAMPLES / "type.aep")
+        cameras = list(project.select("layer[type=camera]"))
+        assert cameras
+        assert all(layer.layer_type == "CameraLayer" for layer in cameras)
+
+    def test_is_lazy(self) -> None:
+        project = parse_project(self.LAYER_SAMPLES / "type.aep")
+        results = project.select("comp/layer")
+        assert not isinstance(results, list)
+        assert next(results).containing_comp in project.compositions
+
+    def test_malformed(self) -> None:
+        project = parse_project(self.LAYER_SAMPLES / "type.aep")
+        for selector in ("ADBE Position", "comp[name", "comp/comp", "**"):
+            with pytest.raises(ValueError):
+                project.select(selector)
+
+
+class TestWriteJson:
+    """Tests for streaming JSON export."""
+
+    LAYER_SAMPLES = Path(__file__).parent.parent / "samples" / "models" / "layer"
+
+    def test_matches_to_dict(self) -> None:
+        project = parse_project(self.LAYER_SAMPLES / "type.aep")
+        output = io.StringIO()
+        project.write_json(output)
+        expected = json.loads(json.dumps(to_dict(project), default=str))
+        assert json.loads(output.getvalue()) == expected
+
+    def test_include(self) -> None:
+        project = parse_project(self.LAYER_SAMPLES / "type.aep")
+        output = io.StringIO()
+        project.write_json(output, include={"items", "bits_per_channel"})
+        assert set(json.loads(output.getvalue())) == {"items", "bits_per_channel"}
+
+    def test_depth(self) -> None:
+        project = parse_project(self.LAYER_SAMPLES / "type.aep")
+        output = io.StringIO()
+        project.write_json(output, depth=0, include={"items"})
+        items = json.loads(output.getvalue())["items"]
+        assert items
+        assert all(item is None for item in items.values())
+
+    def test_encoding_matches_json_dumps(self) -> None:
+        data = {
+            "numbers": [1, -2.5, float("inf"), True, None],
+            "text": 'caf\u00e9 "quoted"',
+            "empty": [{}, []],
+            3: {"nested": [{"a": 1}]},
+        }
+        assert "".join(iter_json(data)) == json.dumps(data)
+        assert "".join(iter_json(data, indent=2)) == json.dumps(data, indent=2)
+
+    def test_generators_stream_as_arrays(self) -> None:
+        values = (i * 2 for i in range(3))
+        assert "".join(iter_json({"values": values})) == '{"values": [0, 2, 4]}'
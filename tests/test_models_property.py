@@ -22,9 +22,11 @@ from py_aep.enums import (
     MaskFeatherFalloff,
     MaskMode,
     MaskMotionBlur,
+    PropertyControlType,
     PropertyType,
     PropertyValueType,
 )
+from py_aep.kaitai.proxy import ProxyBody
 from py_aep.models import Layer, MaskPropertyGroup, Property, PropertyGroup
 
 SAMPLES_DIR = Path(__file__).parent.parent / "samples" / "models" / "property"
@@ -1608,6 +1610,86 @@ class TestShapeValue:
         assert [fp.seg_loc for fp in shape.feather_points] == [0, 128, 255, 256, 270, 299]
         assert [fp.radius for fp in shape.feather_points] == [10.0, 20.0, 30.0, 40.0, 50.0, 60.0]
 
+    def test_to_arrays_matches_lists(self) -> None:
+        """to_arrays returns the same points as vertices and tangents."""
+        layer = get_layer(parse_project(SAMPLES_DIR / "shape_basic.aep"), "shape_closed_oval")
+        shape = _get_mask_shape(layer).value
+        arrays = shape.to_arrays(use_numpy=False)
+        assert arrays.vertices == shape.vertices
+        assert arrays.in_tangents == shape.in_tangents
+        assert arrays.out_tangents == shape.out_tangents
+        assert arrays.closed is True
+
+    def test_to_arrays_numpy(self) -> None:
+        """NumPy arrays have one (x, y) row per vertex."""
+        np = pytest.importorskip("numpy")
+        layer = get_layer(parse_project(SAMPLES_DIR / "shape_misc.aep"), "shape_many_points")
+        shape = _get_mask_shape(layer).value
+        arrays = shape.to_arrays(use_numpy=True)
+        assert arrays.vertices.shape == (300, 2)
+        np.testing.assert_array_equal(arrays.vertices, shape.vertices)
+        np.testing.assert_array_equal(arrays.in_tangents, shape.in_tangents)
+        np.testing.assert_array_equal(arrays.out_tangents, shape.out_tangents)
+
+    def test_shapes_at_times_keyframes(self) -> None:
+        """Shapes at keyframe times match the keyframe values."""
+        layer = get_layer(parse_project(SAMPLES_DIR / "shape_misc.aep"), "shape_animated")
+        prop = _get_mask_shape(layer)
+        kf0, kf1 = prop.keyframes
+        shapes = prop.shapes_at_times(
+            [kf0.time - 1.0, kf0.time, kf1.time, kf1.time + 1.0], use_numpy=False
+        )
+        assert shapes[0].vertices == kf0.value.vertices
+        assert shapes[1].vertices == kf0.value.vertices
+        assert shapes[2].vertices == kf1.value.vertices
+        assert shapes[3].vertices == kf1.value.vertices
+
+    def test_shapes_at_times_between_keyframes(self) -> None:
+        """Vertices move from one keyframe shape toward the next."""
+        layer = get_layer(parse_project(SAMPLES_DIR / "shape_misc.aep"), "shape_animated")
+        prop = _get_mask_shape(layer)
+        kf0, kf1 = prop.keyframes
+        middle = (kf0.time + kf1.time) / 2
+        (shape,) = prop.shapes_at_times([middle], use_numpy=False)
+        for point, start, end in zip(
+            shape.vertices, kf0.value.vertices, kf1.value.vertices
+        ):
+            for value, low, high in zip(point, start, end):
+                assert min(low, high) < value < max(low, high)
+
+    def test_shapes_at_times_numpy_matches_lists(self) -> None:
+        """NumPy and list results agree."""
+        np = pytest.importorskip("numpy")
+        layer = get_layer(parse_project(SAMPLES_DIR / "shape_misc.aep"), "shape_animated")
+        prop = _get_mask_shape(layer)
+        start = prop.keyframes[0].time
+        end = prop.keyframes[-1].time
+        times = [start + (end - start) * i / 10 for i in range(11)]
+        for fast, slow in zip(
+            prop.shapes_at_times(times, use_numpy=True),
+            prop.shapes_at_times(times, use_numpy=False),
+        ):
+            np.testing.assert_allclose(fast.vertices, slow.vertices)
+            np.testing.assert_allclose(fast.in_tangents, slow.in_tangents)
+            np.testing.assert_allclose(fast.out_tangents, slow.out_tangents)
+
+    def test_shapes_at_times_static(self) -> None:
+        """A static shape is returned at every time, as independent copies."""
+        layer = get_layer(parse_project(SAMPLES_DIR / "shape_basic.aep"), "shape_closed_square")
+        prop = _get_mask_shape(layer)
+        shapes = prop.shapes_at_times([0.0, 1.0], use_numpy=False)
+        assert shapes[0].vertices == prop.value.vertices
+        shapes[0].vertices[0][0] = -1.0
+        assert shapes[1].vertices == prop.value.vertices
+
+    def test_shapes_at_times_not_a_shape(self) -> None:
+        """Non-shape properties raise TypeError."""
+        layer = get_layer(parse_project(SAMPLES_DIR / "shape_basic.aep"), "shape_closed_square")
+        opacity = _find_property(layer, "ADBE Opacity")
+        assert opacity is not None
+        with pytest.raises(TypeError):
+            opacity.shapes_at_times([0.0])
+
 
 
 
@@ -2173,6 +2255,45 @@ class TestRoundtripPropertyValue:
         assert abs(prop2.value[2] - 30.0) < 0.01
 
 
+class TestResolvedValueCache:
+    """Static values are resolved once and refreshed after edits."""
+
+    def test_value_is_copied(self) -> None:
+        project = parse_aep(SAMPLES_DIR / "is_modified_false.aep").project
+        prop = _find_property(project.compositions[0].layers[0], "ADBE Orientation")
+        assert prop is not None
+        value = prop.value
+        value[0] += 100.0
+        assert prop.value != value
+
+    def test_write_cdat_invalidates(self) -> None:
+        project = parse_aep(SAMPLES_DIR / "is_modified_false.aep").project
+        prop = _find_property(project.compositions[0].layers[0], "ADBE Rotate X")
+        assert prop is not None
+        assert prop.value == 0.0
+        prop._write_cdat(45.0)
+        assert prop.value == pytest.approx(45.0)
+
+    def test_comp_resize_rescales_effect_point(self) -> None:
+        project = parse_aep(SAMPLES_DIR / "effects.aep").project
+        comp = get_comp(project, "effect_2dPoint")
+        layer = comp.layers[0]
+        assert layer.effects is not None
+        points = [
+            prop
+            for effect in layer.effects.properties
+            for prop in effect.properties
+            if isinstance(prop, Property)
+            and prop.property_control_type == PropertyControlType.TWO_D
+        ]
+        assert points
+        before = points[0].value
+        comp.width = comp.width * 2
+        after = points[0].value
+        assert after[0] == pytest.approx(before[0] * 2)
+        assert after[1] == pytest.approx(before[1])
+
+
 class TestRoundtripExpressionCreate:
     """Roundtrip: add an expression to a property that had none."""
 
@@ -2481,3 +2602,163 @@ class TestValueValidation:
         assert position.dimensions == 3
         with pytest.raises(TypeError, match="expected a sequence of 3 elements"):
             position.value = 42.0
+
+
+class TestMatchNameIndex:
+    """Tests for Project.properties_by_match_name / effects_by_match_name."""
+
+    def test_effects_by_match_name(self) -> None:
+        project = parse_project(SAMPLES_DIR / "2_gaussian.aep")
+        layer = get_first_layer(project)
+        matches = project.effects_by_match_name("ADBE Gaussian Blur 2")
+        assert [m.property for m in matches] == layer.effects.properties
+        assert all(m.layer is layer for m in matches)
+        assert all(m.comp is layer.containing_comp for m in matches)
+
+    def test_effect_parameters(self) -> None:
+        project = parse_project(SAMPLES_DIR / "2_gaussian.aep")
+        matches = project.properties_by_match_name("ADBE Gaussian Blur 2-0001")
+        assert len(matches) == 2
+        assert [m.property.parent_property for m in matches] == [
+            m.property for m in project.effects_by_match_name("ADBE Gaussian Blur 2")
+        ]
+
+    def test_non_effect_groups_excluded(self) -> None:
+        project = parse_project(SAMPLES_DIR / "2_gaussian.aep")
+        assert project.properties_by_match_name("ADBE Transform Group")
+        assert project.effects_by_match_name("ADBE Transform Group") == []
+
+    def test_unknown_match_name(self) -> None:
+        project = parse_project(SAMPLES_DIR / "2_gaussian.aep")
+        assert project.properties_by_match_name("Not A Match Name") == []
+
+    def test_tree_changes_invalidate(self) -> None:
+        project = parse_aep(SAMPLES_DIR / "2_gaussian.aep").project
+        layer = get_first_layer(project)
+        assert len(project.effects_by_match_name("ADBE Gaussian Blur 2")) == 2
+        first = layer.effects.properties[0]
+        layer.effects.properties = layer.effects.properties[1:]
+        matches = project.effects_by_match_name("ADBE Gaussian Blur 2")
+        assert [m.property for m in matches] == layer.effects.properties
+        assert first not in [m.property for m in matches]
+
+    def test_tree_changes_are_per_project(self) -> None:
+        project = parse_aep(SAMPLES_DIR / "2_gaussian.aep").project
+        other = parse_aep(SAMPLES_DIR / "2_gaussian.aep").project
+        other_index = other._get_match_name_index()
+        layer = get_first_layer(project)
+        layer.effects.properties = layer.effects.properties[1:]
+        assert other._get_match_name_index() is other_index
+
+    def test_added_layer_invalidates(self) -> None:
+        project = parse_aep(SAMPLES_DIR / "2_gaussian.aep").project
+        layer = get_first_layer(project)
+        assert len(project.effects_by_match_name("ADBE Gaussian Blur 2")) == 2
+        layer.containing_comp._add_layer(layer)
+        assert len(project.effects_by_match_name("ADBE Gaussian Blur 2")) == 4
+
+
+class TestChildLookupIndex:
+    """Tests for the PropertyGroup name/match-name lookup index."""
+
+    @staticmethod
+    def _make_group() -> PropertyGroup:
+        group = PropertyGroup(
+            _tdsb=ProxyBody(enabled=1),
+            match_name="ADBE Effect Built In Params",
+            property_depth=1,
+            properties=[],
+        )
+        group._synthesize_children()
+        return group
+
+    def test_lookup_keys(self) -> None:
+        group = self._make_group()
+        for prop in group:
+            assert group[prop.match_name] is prop
+            assert group[prop.name] is prop
+            assert group[prop.name.lower().replace(" ", "_")] is prop
+
+    def test_rename_invalidates(self) -> None:
+        group = self._make_group()
+        prop = group.properties[1]
+        old_name = prop.name
+        prop._auto_name = "Renamed"
+        assert group["Renamed"] is prop
+        assert group.renamed is prop
+        with pytest.raises(KeyError):
+            group[old_name]
+
+    def test_reassign_invalidates(self) -> None:
+        group = self._make_group()
+        first = group.properties[0]
+        group.properties = group.properties[1:]
+        with pytest.raises(KeyError):
+            group[first.match_name]
+
+    def test_private_attribute_not_a_child(self) -> None:
+        group = self._make_group()
+        assert not hasattr(group, "_ldta")
+
+
+class TestToColumns:
+    """Tests for Project.to_columns columnar export."""
+
+    def test_tables_are_rectangular(self) -> None:
+        tables = parse_project(SAMPLES_DIR / "keyframe_BEZIER.aep").to_columns(
+            use_numpy=False
+        )
+        for table in tables.values():
+            lengths = {len(column) for column in table.values()}
+            assert len(lengths) <= 1
+
+    def test_keyframes_match_model(self) -> None:
+        project = parse_project(SAMPLES_DIR / "keyframe_BEZIER.aep")
+        layer = get_first_layer(project)
+        position = layer.transform.property(name="ADBE Position")
+        tables = project.to_columns(use_numpy=False)
+        props = tables["properties"]
+        row = props["path"].index("ADBE Transform Group/ADBE Position")
+        assert props["layer_id"][row] == layer.id
+        assert props["num_keys"][row] == len(position.keyframes)
+        first = props["first_key"][row]
+        keys = tables["keyframes"]
+        for i, kf in enumerate(position.keyframes):
+            assert keys["property_index"][first + i] == row
+            assert keys["time"][first + i] == kf.time
+            assert keys["value_0"][first + i] == kf.value[0]
+
+    def test_without_keyframes(self) -> None:
+        tables = parse_project(SAMPLES_DIR / "keyframe_BEZIER.aep").to_columns(
+            include_keyframes=False, use_numpy=False
+        )
+        assert len(tables["keyframes"]["time"]) == 0
+        assert set(tables["properties"]["num_keys"]) == {0}
+
+    def test_text_documents_not_decoded(self) -> None:
+        project = parse_aep(LAYER_SAMPLES_DIR / "type.aep").project
+        layer = get_comp(project, "type_text").text_layers[0]
+        source_text = layer.text.source_text
+        props = project.to_columns(use_numpy=False)["properties"]
+        row = next(
+            i
+            for i, (path, layer_id) in enumerate(zip(props["path"], props["layer_id"]))
+            if layer_id == layer.id and path.endswith("ADBE Text Document")
+        )
+        assert props["dimensions"][row] == 0
+        assert source_text._value_loader is not None
+
+    def test_duplicate_effect_paths_unique(self) -> None:
+        project = parse_project(SAMPLES_DIR / "2_gaussian.aep")
+        layer = get_first_layer(project)
+        props = project.to_columns(use_numpy=False)["properties"]
+        paths = [
+            path
+            for path, layer_id in zip(props["path"], props["layer_id"])
+            if layer_id == layer.id
+        ]
+        assert len(paths) == len(set(paths))
+        assert (
+            "ADBE Effect Parade/ADBE Gaussian Blur 2[1]/ADBE Gaussian Blur 2-0001"
+            in paths
+        )
@@ -4,9 +4,12 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
 from conftest import get_comp
 
+from py_aep import TextDocument
 from py_aep import parse as parse_aep
+from py_aep.cos import CosParser
 from py_aep.enums import (
     AutoKernType,
     FontBaselineOption,
@@ -14,6 +17,7 @@ from py_aep.enums import (
     LeadingType,
     ParagraphJustification,
 )
+from py_aep.parsers.text import parse_fonts
 
 SAMPLES_DIR = Path(__file__).parent.parent / "samples" / "models" / "layer"
 
@@ -132,6 +136,60 @@ class TestTextDocumentParsing:
         assert doc.apply_stroke is False
 
 
+class TestLazyTextDocument:
+    """Tests for deferred decoding of text document COS data."""
+
+    def test_decoded_on_first_value_access(self) -> None:
+        app = parse_aep(SAMPLES_DIR / "type.aep")
+        source_text = get_comp(app.project, "type_text").text_layers[0].text.source_text
+        assert source_text._value_loader is not None
+        assert source_text.value.text == "TextLayer"
+        assert source_text._value_loader is None
+        assert source_text.value is source_text.value
+
+    def test_set_value_before_decoding(self) -> None:
+        app = parse_aep(SAMPLES_DIR / "type.aep")
+        source_text = get_comp(app.project, "type_text").text_layers[0].text.source_text
+        doc = TextDocument(text="Replaced")
+        source_text.value = doc
+        assert source_text._value_loader is None
+        assert source_text.value is doc
+
+
+class TestDeferredWriteBack:
+    """Tests for deferred serialization of edited COS data."""
+
+    def test_serialized_on_flush(self) -> None:
+        project, doc = _get_text_document(SAMPLES_DIR / "type.aep", "type_text")
+        original = doc._btdk_body.binary_data
+        doc.font_size = 72.0
+        doc.faux_bold = True
+        assert doc._btdk_body.binary_data is original
+
+        project._cos_writes.flush()
+        assert doc._btdk_body.binary_data != original
+        reparsed = CosParser(doc._btdk_body.binary_data).parse()
+        assert reparsed == doc._cos_data
+
+    def test_queue_is_per_project(self) -> None:
+        project, doc = _get_text_document(SAMPLES_DIR / "type.aep", "type_text")
+        other, other_doc = _get_text_document(SAMPLES_DIR / "type.aep", "type_text")
+        original = doc._btdk_body.binary_data
+        doc.font_size = 72.0
+        other_doc.font_size = 48.0
+        other.replace_text({"No such text": "x"})
+        assert doc._btdk_body.binary_data is original
+        project._cos_writes.flush()
+        assert doc._btdk_body.binary_data != original
+
+    def test_readers_flush_their_chunk(self) -> None:
+        project, doc = _get_text_document(SAMPLES_DIR / "type.aep", "type_text")
+        original = doc._btdk_body.binary_data
+        doc.font_size = 72.0
+        assert project.fonts
+        assert doc._btdk_body.binary_data != original
+
+
 class TestFontObject:
     """Tests for FontObject COS field access."""
 
@@ -146,6 +204,104 @@ class TestFontObject:
         assert doc.font_object.version == "Version 7.00"
 
 
+class TestProjectFonts:
+    """Tests for the project-wide font table."""
+
+    def test_fonts(self) -> None:
+        project = parse_aep(SAMPLES_DIR / "type.aep").project
+        names = [font.post_script_name for font in project.fonts]
+        assert "TimesNewRomanPSMT" in names
+        assert len(names) == len(set(names))
+
+    def test_fonts_skip_text_decoding(self) -> None:
+        project = parse_aep(SAMPLES_DIR / "type.aep").project
+        source_text = get_comp(project, "type_text").text_layers[0].text.source_text
+        assert "TimesNewRomanPSMT" in [font.post_script_name for font in project.fonts]
+        assert source_text._value_loader is not None
+        # Decoding the documents later reuses the interned fonts
+        assert source_text.value.font_object in project.fonts
+
+    def test_fonts_are_shared(self) -> None:
+        project = parse_aep(SAMPLES_DIR / "type.aep").project
+        fonts = {}
+        for _layer, doc in project._iter_text_documents():
+            for font in doc._fonts:
+                key = (font.post_script_name, font.version)
+                assert fonts.setdefault(key, font) is font
+
+    def test_layers_using_font(self) -> None:
+        project = parse_aep(SAMPLES_DIR / "type.aep").project
+        layer = get_comp(project, "type_text").text_layers[0]
+        assert layer in project.layers_using_font("TimesNewRomanPSMT")
+        assert project.layers_using_font("NoSuchFont") == []
+
+    def test_fonts_are_read_only(self) -> None:
+        project = parse_aep(SAMPLES_DIR / "type.aep").project
+        font = project.fonts[0]
+        with pytest.raises(AttributeError):
+            font.post_script_name = "Other"
+        with pytest.raises(AttributeError):
+            font.version = "2.0"
+
+    def test_fonts_are_cached(self) -> None:
+        project = parse_aep(SAMPLES_DIR / "type.aep").project
+        first = project._get_text_fonts()
+        assert project._get_text_fonts() is first
+        doc = get_comp(project, "type_text").text_layers[0].text.source_text.value
+        doc.text = "Changed"
+        assert project._get_text_fonts() is not first
+
+    def test_parse_fonts_interns(self) -> None:
+        def font_entry(name: str) -> dict:
+            return {"0": {"0": {"0": name, "5": "1.0"}, "99": "CoolTypeFont"}}
+
+        cos_data = {"0": {"1": {"0": [font_entry("A"), font_entry("B")]}}}
+        table: dict = {}
+        first = parse_fonts(cos_data, table)
+        second = parse_fonts(cos_data, table)
+        assert [font.post_script_name for font in first] == ["A", "B"]
+        assert all(a is b for a, b in zip(first, second))
+        assert set(table) == {("A", "1.0"), ("B", "1.0")}
+
+
+class TestReplaceText:
+    """Tests for Project.replace_text."""
+
+    def test_mapping(self, tmp_path: Path) -> None:
+        project = parse_aep(SAMPLES_DIR / "type.aep").project
+        assert project.replace_text({"TextLayer": "Calque de texte"}) >= 1
+        out = tmp_path / "modified.aep"
+        project.save(out)
+
+        _project2, doc2 = _get_text_document(out, "type_text")
+        assert doc2.text == "Calque de texte"
+
+    def test_callable_and_comps(self) -> None:
+        project = parse_aep(SAMPLES_DIR / "type.aep").project
+        comp = get_comp(project, "type_text")
+        count = project.replace_text(
+            lambda text: text.upper() if text == "TextLayer" else None,
+            comps=[comp],
+            font_size=12.0,
+        )
+        doc = comp.text_layers[0].text.source_text.value
+        assert count >= 1
+        assert doc.text == "TEXTLAYER"
+        assert doc.font_size == 12.0
+
+    def test_no_match(self) -> None:
+        project = parse_aep(SAMPLES_DIR / "type.aep").project
+        assert project.replace_text({"No such text": "x"}) == 0
+
+    def test_font_not_in_document(self) -> None:
+        project = parse_aep(SAMPLES_DIR / "type.aep").project
+        doc = get_comp(project, "type_text").text_layers[0].text.source_text.value
+        with pytest.raises(ValueError, match="NoSuchFont"):
+            project.replace_text({"TextLayer": "Changed"}, font="NoSuchFont")
+        assert doc.text == "TextLayer"
+        assert doc.font == "TimesNewRomanPSMT"
+
+
 class TestRoundtripFontSize:
     """Roundtrip tests for TextDocument.font_size."""
 
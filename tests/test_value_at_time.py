@@ -13,12 +13,27 @@ See :doc:`/limitations` for details.
 
 from __future__ import annotations
 
+import typing
 from pathlib import Path
 
 import pytest
-from conftest import get_first_layer, load_expected, parse_project
+from conftest import get_comp, get_first_layer, load_expected, parse_project
 
 from py_aep import Property
+from py_aep import parse as parse_aep
+from py_aep.enums import KeyframeInterpolationType, PropertyControlType
+from py_aep.resolvers import (
+    DEFAULT_EASING_CACHE_SIZE,
+    clear_easing_cache,
+    easing_cache_info,
+    set_easing_cache_size,
+)
+from py_aep.resolvers.interpolation import (
+    KeyframeCurve,
+    _BezierPathData,
+    _get_bezier_easing,
+    _get_point_on_path,
+)
 
 SAMPLES_DIR = Path(__file__).parent.parent / "samples" / "models" / "property"
 VAT_DIR = SAMPLES_DIR / "value_at_time"
@@ -40,10 +55,14 @@ def _load_vat(base_name: str) -> tuple[str, list[dict]]:
     return prop["matchName"], prop["frames"]
 
 
-def _get_prop(base_name: str) -> Property:
-    """Parse .aep and return the target property."""
+def _get_prop(base_name: str, *, fresh: bool = False) -> Property:
+    """Parse .aep and return the target property.
+
+    Tests that edit the property pass *fresh* to get an uncached parse.
+    """
     aep = SAMPLES_DIR / f"{base_name}.aep"
-    layer = get_first_layer(parse_project(aep))
+    project = parse_aep(aep).project if fresh else parse_project(aep)
+    layer = get_first_layer(project)
     (
         match_name,
         _,
@@ -157,3 +176,275 @@ class TestValueAtTimeAPI:
             elif isinstance(expected, list):
                 for g, e in zip(result, expected):
                     assert abs(g - e) < 0.001
+
+
+class TestKeyframeCurveCache:
+    """Tests for the compiled keyframe curve cached on each property."""
+
+    def test_curve_is_reused(self) -> None:
+        prop = _get_prop("keyframe_LINEAR")
+        prop.value_at_time(0.5)
+        curve = prop._curve
+        assert curve is not None
+        prop.value_at_time(1.0)
+        assert prop._curve is curve
+
+    def test_results_are_copies(self) -> None:
+        prop = _get_prop("keyframe_LINEAR")
+        first_time = prop.keyframes[0].time
+        result = prop.value_at_time(first_time)
+        assert isinstance(result, list)
+        result[0] += 1000.0
+        assert prop.value_at_time(first_time) != result
+
+    def test_keyframe_value_edit_invalidates(self) -> None:
+        prop = _get_prop("keyframe_LINEAR", fresh=True)
+        last = prop.keyframes[-1]
+        prop.value_at_time(last.time)
+        new_value = [v + 10.0 for v in last.value]
+        last.value = new_value
+        assert prop.value_at_time(last.time) == pytest.approx(new_value)
+
+    def test_interpolation_edit_invalidates(self) -> None:
+        prop = _get_prop("keyframe_bezier_ease_in_out_1D", fresh=True)
+        first, second = prop.keyframes[0], prop.keyframes[1]
+        quarter = first.time + (second.time - first.time) / 4
+        eased = prop.value_at_time(quarter)
+        first.out_interpolation_type = KeyframeInterpolationType.HOLD
+        assert prop.value_at_time(quarter) == pytest.approx(first.value)
+        assert prop.value_at_time(quarter) != pytest.approx(eased)
+
+    def test_ease_edit_invalidates(self) -> None:
+        prop = _get_prop("keyframe_bezier_ease_in_out_1D", fresh=True)
+        first, second = prop.keyframes[0], prop.keyframes[1]
+        quarter = first.time + (second.time - first.time) / 4
+        eased = prop.value_at_time(quarter)
+        first.out_temporal_ease[0].influence = 0.1
+        second.in_temporal_ease[0].influence = 0.1
+        assert prop.value_at_time(quarter) != pytest.approx(eased)
+
+    def test_comp_resize_invalidates_effect_point(self) -> None:
+        project = parse_aep(SAMPLES_DIR / "effects.aep").project
+        comp = get_comp(project, "effect_2dPoint")
+        layer = comp.layers[0]
+        assert layer.effects is not None
+        point = next(
+            prop
+            for effect in layer.effects.properties
+            for prop in effect.properties
+            if isinstance(prop, Property)
+            and prop.property_control_type == PropertyControlType.TWO_D
+        )
+        # Animate the point with the two straight-line keyframes of a
+        # position sample. Effect point keyframes hold comp fractions, so
+        # their resolved values scale with the composition size.
+        donor = _get_prop("keyframe_linear_2D_position", fresh=True)
+        point.keyframes = donor.keyframes[:2]
+        point._link_keyframes()
+        first, second = point.keyframes
+        middle = (first.time + second.time) / 2
+        before = point.value_at_time(middle)
+        comp.width = comp.width * 2
+        after = point.value_at_time(middle)
+        assert after[0] == pytest.approx(before[0] * 2)
+        assert after[1] == pytest.approx(before[1])
+
+
+class TestKeyframeQueries:
+    """Tests for the bisected keyframe time queries."""
+
+    def test_nearest_key_index(self) -> None:
+        prop = _get_prop("keyframe_bezier_ease_in_out_1D")
+        times = [kf.time for kf in prop.keyframes]
+        for index, time in enumerate(times):
+            assert prop.nearest_key_index(time) == index
+        assert prop.nearest_key_index(times[0] - 10.0) == 0
+        assert prop.nearest_key_index(times[-1] + 10.0) == len(times) - 1
+        middle = (times[0] + times[1]) / 2
+        assert prop.nearest_key_index(middle) == 0
+        assert prop.nearest_key_index(middle + 1e-6) == 1
+        assert prop.nearest_key(times[1]) is prop.keyframes[1]
+
+    def test_key_index_at_or_before(self) -> None:
+        prop = _get_prop("keyframe_bezier_ease_in_out_1D")
+        times = [kf.time for kf in prop.keyframes]
+        assert prop.key_index_at_or_before(times[0] - 1e-3) is None
+        assert prop.key_index_at_or_before(times[0]) == 0
+        assert prop.key_index_at_or_before((times[0] + times[1]) / 2) == 0
+        assert prop.key_index_at_or_before(times[1]) == 1
+        assert prop.key_index_at_or_before(times[-1] + 10.0) == len(times) - 1
+
+    def test_keyframes_in_range(self) -> None:
+        prop = _get_prop("keyframe_bezier_ease_in_out_1D")
+        keyframes = prop.keyframes
+        first, second = keyframes[0].time, keyframes[1].time
+        assert prop.keyframes_in_range(first, second) == [keyframes[0]]
+        assert prop.keyframes_in_range(first, second + 1e-3) == keyframes[:2]
+        assert prop.keyframes_in_range(first - 10.0, first) == []
+        assert prop.keyframes_in_range(first - 10.0, keyframes[-1].time + 10.0) == (
+            keyframes
+        )
+
+    def test_keyframes_in_range_rejects_reversed_range(self) -> None:
+        prop = _get_prop("keyframe_bezier_ease_in_out_1D")
+        with pytest.raises(ValueError):
+            prop.keyframes_in_range(1.0, 0.0)
+
+    def test_queries_skip_keyframe_curve(self) -> None:
+        prop = _get_prop("keyframe_bezier_ease_in_out_1D", fresh=True)
+        assert prop.nearest_key_index(0.0) == 0
+        assert prop.keyframes_in_range(0.0, prop.keyframes[-1].time + 1.0)
+        assert prop._curve is None
+
+    def test_queries_after_key_moves_past_neighbour(self) -> None:
+        prop = _get_prop("keyframe_bezier_ease_in_out_1D", fresh=True)
+        first, second = prop.keyframes[0], prop.keyframes[1]
+        prop.nearest_key_index(first.time)
+        after = prop.keyframes[2].time if len(prop.keyframes) > 2 else second.time + 1.0
+        first.time = (second.time + after) / 2
+        assert prop.keyframes[0] is first
+        assert prop.nearest_key_index(first.time) == 0
+        assert prop.nearest_key_index(second.time) == 1
+        assert prop.key_index_at_or_before(first.time) == 0
+        assert prop.key_index_at_or_before(second.time) == 1
+        assert prop.keyframes_in_range(second.time, first.time + 1e-3) == [
+            second,
+            first,
+        ]
+
+    def test_queries_follow_time_edits(self) -> None:
+        prop = _get_prop("keyframe_bezier_ease_in_out_1D", fresh=True)
+        last = prop.keyframes[-1]
+        assert prop.key_index_at_or_before(last.time + 1.0) == len(prop.keyframes) - 1
+        last.time = last.time + 2.0
+        assert prop.nearest_key_index(last.time) == len(prop.keyframes) - 1
+        assert prop.keyframes_in_range(last.time - 1.0, last.time + 1.0) == [last]
+
+
+class TestValuesAtTimes:
+    """Batch evaluation must match per-time value_at_time."""
+
+    @pytest.mark.parametrize("sample", _NON_SPATIAL_SAMPLES + _SPATIAL_SAMPLES)
+    def test_matches_value_at_time(self, sample: str) -> None:
+        prop = _get_prop(sample)
+        _, frames = _load_vat(sample)
+        times = [f["time"] for f in frames]
+        # Reverse so the batch has to sort its input.
+        times.reverse()
+        expected = [prop.value_at_time(t) for t in times]
+        assert prop.values_at_times(times, use_numpy=False) == expected
+
+    @pytest.mark.parametrize("sample", _NON_SPATIAL_SAMPLES + _SPATIAL_SAMPLES)
+    def test_numpy_matches_value_at_time(self, sample: str) -> None:
+        np = pytest.importorskip("numpy")
+        prop = _get_prop(sample)
+        _, frames = _load_vat(sample)
+        times = [f["time"] for f in frames]
+        expected = np.asarray([prop.value_at_time(t) for t in times], dtype=float)
+        result = prop.values_at_times(times, use_numpy=True)
+        assert result.shape == expected.shape
+        assert np.allclose(result, expected, rtol=0, atol=1e-9)
+
+    def test_static_property(self) -> None:
+        prop = _get_prop("property_1D_opacity")
+        values = prop.values_at_times([0.0, 1.0, 2.0], use_numpy=False)
+        assert values == [prop.value_at_time(t) for t in (0.0, 1.0, 2.0)]
+
+    def test_sample(self) -> None:
+        prop = _get_prop("keyframe_LINEAR")
+        frame_rate = prop._containing_layer.containing_comp.frame_rate
+        times, values = prop.sample(0.0, 1.0, use_numpy=False)
+        assert len(times) == int(frame_rate) + 1
+        assert times[1] == pytest.approx(1.0 / frame_rate)
+        assert values == [prop.value_at_time(t) for t in times]
+
+    def test_sample_explicit_fps(self) -> None:
+        prop = _get_prop("keyframe_LINEAR")
+        times, _ = prop.sample(0.5, 1.5, fps=10, use_numpy=False)
+        assert times == pytest.approx([0.5 + i / 10 for i in range(11)])
+
+    def test_sample_rejects_reversed_range(self) -> None:
+        prop = _get_prop("keyframe_LINEAR")
+        with pytest.raises(ValueError):
+            prop.sample(2.0, 1.0)
+
+
+class TestPathTolerance:
+    """Adaptive sampling of spatial bezier paths."""
+
+    @pytest.mark.parametrize("sample", _SPATIAL_SAMPLES)
+    def test_fine_tolerance_matches_ground_truth(self, sample: str) -> None:
+        prop = _get_prop(sample)
+        _, frames = _load_vat(sample)
+        times = [f["time"] for f in frames]
+        values = prop.values_at_times(times, use_numpy=False, path_tolerance=0.001)
+        for got, f in zip(values, frames):
+            assert got == pytest.approx(f["value"], abs=0.02)
+
+    def test_coarser_tolerance_samples_fewer_points(self) -> None:
+        args = ([0.0, 0.0], [500.0, 300.0], [300.0, -200.0], [-100.0, 400.0])
+        fine = _BezierPathData(*args, tolerance=0.01)
+        coarse = _BezierPathData(*args, tolerance=5.0)
+        assert len(coarse.points) < len(fine.points)
+        assert fine.segment_length == pytest.approx(coarse.segment_length, rel=0.01)
+        for path in (fine, coarse):
+            assert _get_point_on_path(path, 0.0) == [0.0, 0.0]
+            assert _get_point_on_path(path, 1.0) == [500.0, 300.0]
+
+    def test_adaptive_path_close_to_default(self) -> None:
+        args = ([0.0, 0.0, 0.0], [500.0, 300.0, 100.0], [300.0, -200.0, 50.0])
+        default = _BezierPathData(*args, [-100.0, 400.0, 0.0])
+        adaptive = _BezierPathData(*args, [-100.0, 400.0, 0.0], tolerance=0.5)
+        for i in range(101):
+            a = _get_point_on_path(default, i / 100)
+            b = _get_point_on_path(adaptive, i / 100)
+            assert b == pytest.approx(a, abs=1.0)
+
+    def test_rejects_non_positive_tolerance(self) -> None:
+        with pytest.raises(ValueError):
+            KeyframeCurve([], is_spatial=True, path_tolerance=0.0)
+
+
+class TestEasingCache:
+    """The shared easing function cache is bounded and instrumented."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_cache(self) -> typing.Iterator[None]:
+        clear_easing_cache()
+        yield
+        set_easing_cache_size(DEFAULT_EASING_CACHE_SIZE)
+        clear_easing_cache()
+
+    def test_counts_hits_and_misses(self) -> None:
+        first = _get_bezier_easing(0.2, 0.0, 0.8, 1.0)
+        assert _get_bezier_easing(0.2, 0.0, 0.8, 1.0) is first
+        info = easing_cache_info()
+        assert (info.hits, info.misses, info.size) == (1, 1, 1)
+
+    def test_evicts_least_recently_used(self) -> None:
+        set_easing_cache_size(2)
+        a = _get_bezier_easing(0.1, 0.0, 0.9, 1.0)
+        _get_bezier_easing(0.2, 0.0, 0.8, 1.0)
+        _get_bezier_easing(0.1, 0.0, 0.9, 1.0)
+        _get_bezier_easing(0.3, 0.0, 0.7, 1.0)
+        info = easing_cache_info()
+        assert (info.evictions, info.size, info.max_size) == (1, 2, 2)
+        assert _get_bezier_easing(0.1, 0.0, 0.9, 1.0) is a
+
+    def test_shrinking_evicts(self) -> None:
+        for i in range(5):
+            _get_bezier_easing(i / 10, 0.0, 0.5, 1.0)
+        set_easing_cache_size(3)
+        assert easing_cache_info().size == 3
+        assert easing_cache_info().evictions == 2
+
+    def test_zero_disables_cache(self) -> None:
+        set_easing_cache_size(0)
+        _get_bezier_easing(0.2, 0.0, 0.8, 1.0)
+        _get_bezier_easing(0.2, 0.0, 0.8, 1.0)
+        info = easing_cache_info()
+        assert (info.misses, info.size) == (2, 0)
+
+    def test_rejects_negative_size(self) -> None:
+        with pytest.raises(ValueError):
+            set_easing_cache_size(-1)